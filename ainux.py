@@ -7,11 +7,395 @@ Date: September 15, 2025
 
 import subprocess
 import sys
+import functools
 import os
 import re
 import platform
 import argparse
-from typing import Optional, Dict, List
+import shlex
+import shutil
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping, Pattern, Tuple
+
+from shell_session import ShellSession
+
+try:
+    # Optional: google-re2 guarantees linear-time matching on untrusted input
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    # Optional: Hyperscan scans all natural language patterns in one vectorized pass
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Commands that should never be executed. Built once at import and shared read-only
+_DANGEROUS_COMMANDS: Tuple[str, ...] = (
+    'rm -rf /',
+    'del /q /s',
+    'format',
+    'fdisk',
+    'mkfs',
+    'dd',
+    'shutdown',
+    'reboot',
+    'halt',
+    'poweroff',
+    'init 0',
+    'init 6',
+)
+
+# Command mappings organized by platform, frozen so every instance can share them
+_COMMAND_MAPPINGS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    'windows': MappingProxyType({
+        'list_files': 'dir',
+        'current_directory': 'cd',
+        'change_directory': 'cd',
+        'create_directory': 'mkdir',
+        'remove_file': 'del',
+        'copy_file': 'copy',
+        'move_file': 'move',
+        'show_processes': 'tasklist',
+        'network_info': 'ipconfig',
+        'system_info': 'systeminfo',
+        'disk_usage': 'dir /-c',
+    }),
+    'linux': MappingProxyType({
+        'list_files': 'ls -la',
+        'current_directory': 'pwd',
+        'change_directory': 'cd',
+        'create_directory': 'mkdir',
+        'remove_file': 'rm',
+        'copy_file': 'cp',
+        'move_file': 'mv',
+        'show_processes': 'ps aux',
+        'network_info': 'ifconfig',
+        'system_info': 'uname -a',
+        'disk_usage': 'df -h',
+    }),
+    'darwin': MappingProxyType({  # macOS
+        'list_files': 'ls -la',
+        'current_directory': 'pwd',
+        'change_directory': 'cd',
+        'create_directory': 'mkdir',
+        'remove_file': 'rm',
+        'copy_file': 'cp',
+        'move_file': 'mv',
+        'show_processes': 'ps aux',
+        'network_info': 'ifconfig',
+        'system_info': 'uname -a',
+        'disk_usage': 'df -h',
+    })
+})
+
+# Natural language patterns and their corresponding command types, checked in order.
+# Gaps are lazy (.*?) so a failed attempt stops at the first keyword instead of
+# backtracking from the end of the input, short literals such as 'ls' and 'dir'
+# need word boundaries (otherwise 'directory' reads as 'dir'), and argument
+# patterns take the whole next token rather than whatever a greedy gap leaves over.
+# Which command type wins depends on table order, but within a type that takes no
+# argument any pattern gives the same command, so the short literal commands users
+# type most often are listed first there and end the scan earliest.
+_PATTERNS: Dict[str, List[str]] = {
+    'list_files': [
+        r'\bdir\b',
+        r'\bls\b',
+        r'list.*?files?.*?current.*?director',
+        r'show.*?files?.*?current.*?director',
+        r'list.*?files?.*?here',
+        r'show.*?files?.*?here',
+        r'list.*?director.*?content',
+        r'what.*?files?.*?here'
+    ],
+    'current_directory': [
+        r'\bpwd\b',
+        r'show.*?current.*?director',
+        r'what.*?current.*?director',
+        r'where.*?am.*?i',
+        r'current.*?path',
+        r'working.*?director'
+    ],
+    'change_directory': [
+        r'change.*?director.*?\bto\s+(\S+)',
+        r'go.*?to.*?director\S*\s+(\S+)',
+        r'\bcd\s+(\S+)',
+        r'navigate.*?\bto\s+(\S+)'
+    ],
+    'create_directory': [
+        r'create.*?director\S*\s+(?:(?:called|named)\s+)?(\S+)',
+        r'make.*?director\S*\s+(?:(?:called|named)\s+)?(\S+)',
+        r'\bmkdir\s+(\S+)',
+        r'new.*?folder\S*\s+(?:(?:called|named)\s+)?(\S+)'
+    ],
+    'show_processes': [
+        r'\bps\b',
+        r'show.*?process',
+        r'list.*?process',
+        r'running.*?process',
+        r'task.*?list'
+    ],
+    'network_info': [
+        r'show.*?network.*?info',
+        r'network.*?config',
+        r'ip.*?config',
+        r'network.*?settings'
+    ],
+    'system_info': [
+        r'system.*?info',
+        r'show.*?system.*?info',
+        r'computer.*?info',
+        r'machine.*?info'
+    ],
+    'disk_usage': [
+        r'disk.*?usage',
+        r'disk.*?space',
+        r'storage.*?info',
+        r'free.*?space'
+    ]
+}
+
+
+def _compile(pattern: str) -> Pattern[str]:
+    """
+    Compile a pattern with RE2 when it is installed, otherwise with re.
+    
+    Args:
+        pattern (str): Regular expression source
+        
+    Returns:
+        Pattern: Compiled pattern; falls back to re for anything RE2 rejects
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# Command types whose captured argument is appended to the platform command
+_ARGUMENT_COMMAND_TYPES = frozenset({'change_directory', 'create_directory'})
+
+# Bare command names typed as the whole input; these resolve with a dict lookup
+# to the same command type the pattern table would pick, skipping the regex
+_LITERAL_COMMAND_TYPES: Dict[str, str] = {
+    'dir': 'list_files',
+    'ls': 'list_files',
+    'pwd': 'current_directory',
+    'ps': 'show_processes',
+}
+
+
+def _platform_patterns(platform_name: str) -> List[Tuple[str, str, str, bool]]:
+    """
+    List the natural language patterns usable on one platform, in table order.
+
+    Args:
+        platform_name (str): Lowercased platform name, e.g. 'linux'
+
+    Returns:
+        List: (group name, shell command, pattern, captures argument) per pattern
+    """
+    platform_commands = _COMMAND_MAPPINGS.get(platform_name, {})
+    entries = []
+    for command_type, pattern_list in _PATTERNS.items():
+        command = platform_commands.get(command_type)
+        if not command:
+            continue
+        takes_argument = command_type in _ARGUMENT_COMMAND_TYPES
+        for index, pattern in enumerate(pattern_list):
+            has_argument = takes_argument and re.compile(pattern).groups > 0
+            entries.append((f"{command_type}__{index}", command, pattern, has_argument))
+    return entries
+
+
+@functools.lru_cache(maxsize=None)
+def _build_dispatch(platform_name: str) -> Tuple[Optional[Pattern[str]], Dict[str, Tuple[str, Optional[int]]]]:
+    """
+    Specialize the natural language patterns for one platform.
+
+    Every pattern whose command type exists on the platform becomes its own named
+    alternative behind a lazy ``.*?`` prefix, and the union is anchored at the start
+    of the input, so the engine tries the alternatives strictly in table order. That
+    keeps the original "first pattern in the table wins" priority while doing a
+    single C-level match per input. Each group name is resolved up front to the
+    final shell command, so a hit needs no further mapping lookups.
+
+    Args:
+        platform_name (str): Lowercased platform name, e.g. 'linux'
+
+    Returns:
+        Tuple: The compiled union (None if the platform has no commands) and a
+            dispatch table mapping each alternative's group name to its command
+            and argument group index (or None)
+    """
+    entries = _platform_patterns(platform_name)
+    if not entries:
+        return None, {}
+
+    alternatives = [f".*?(?P<{name}>{pattern})" for name, _, pattern, _ in entries]
+    union = _compile("(?s)^(?:" + "|".join(alternatives) + ")")
+    dispatch = {
+        name: (command, union.groupindex[name] + 1 if has_argument else None)
+        for name, command, _, has_argument in entries
+    }
+    return union, dispatch
+
+
+@functools.lru_cache(maxsize=None)
+def _build_hyperscan(platform_name: str) -> Optional[Tuple["hyperscan.Database", List[Tuple[str, Optional[Pattern[str]]]]]]:
+    """
+    Compile one platform's patterns into a Hyperscan database.
+
+    Hyperscan reports every pattern that matches anywhere in the input, with the
+    pattern's table position as its id, so the lowest reported id is the same
+    winner the union regex picks. Hyperscan does not capture groups, so patterns
+    that take an argument keep a compiled regex to extract it after they win.
+
+    Args:
+        platform_name (str): Lowercased platform name, e.g. 'linux'
+
+    Returns:
+        Optional[Tuple]: The database and, per pattern id, its command and argument
+            regex (or None); None if Hyperscan is unavailable or rejects a pattern
+    """
+    entries = _platform_patterns(platform_name)
+    if hyperscan is None or not entries:
+        return None
+
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[pattern.encode() for _, _, pattern, _ in entries],
+            ids=list(range(len(entries))),
+            flags=[hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_SINGLEMATCH] * len(entries),
+        )
+    except hyperscan.error:
+        return None
+
+    targets = [
+        (command, _compile(pattern) if has_argument else None)
+        for _, command, pattern, has_argument in entries
+    ]
+    return database, targets
+
+
+# Absolutely forbidden commands
+_FORBIDDEN_PATTERNS = [
+    r'rm\s+-rf\s+/',                     # rm -rf /
+    r'format(\s|$)',                     # format disk
+    r'fdisk',                            # partition tool
+    r'dd\s+if=',                         # raw disk overwrite
+    r'shutdown(\s|$)',
+    r'reboot(\s|$)',
+    r'poweroff(\s|$)',
+    r'init\s+[06]',                      # init 0 or 6
+]
+
+# Dangerous but confirmable
+_CONFIRMABLE_PATTERNS = [
+    r'rm\s+-rf\s+.+',            # rm -rf folder
+    r'rm\s+.+',                  # rm file
+    r'del\s+.+',                 # delete file (Windows)
+    r'rmdir\s+/s\s+/q\s+.+',     # delete folder (Windows)
+    r'rmdir\s+.+',               # any rmdir
+    r'mv\s+.+',                  # moving files can be destructive
+    r'chmod\s+7[0-7][0-7]',      # chmod 7xx
+    r'chown\s+-r\s+.+',          # recursive ownership
+]
+
+# Each list only needs an "any pattern matches" answer, so one alternation scans the command once
+_FORBIDDEN_RE = _compile("|".join(f"(?:{pattern})" for pattern in _FORBIDDEN_PATTERNS))
+_CONFIRMABLE_RE = _compile("|".join(f"(?:{pattern})" for pattern in _CONFIRMABLE_PATTERNS))
+
+
+# Interactive-mode keywords, checked with one hashed lookup per input
+_EXIT_COMMANDS = frozenset({'exit', 'quit', 'q', 'bye'})
+_HELP_COMMANDS = frozenset({'help', 'h', '?'})
+
+
+# Separator used around command results
+_RESULT_BAR = "=" * 50
+
+# Result blocks with the static text and separators filled in once at import;
+# display_result only formats the command, output and error into them
+_RESULT_HEADER = f"\n{_RESULT_BAR}\n🔧 EXECUTED COMMAND: {{command}}\n{_RESULT_BAR}\n"
+_RESULT_FOOTER = f"{_RESULT_BAR}\n"
+_SUCCESS_TEMPLATE = _RESULT_HEADER + "Status: SUCCESS\nOutput:\n{output}\n" + _RESULT_FOOTER
+_SUCCESS_EMPTY_TEMPLATE = _RESULT_HEADER + "Status: SUCCESS\nOutput: (no output)\n" + _RESULT_FOOTER
+_FAILURE_TEMPLATE = _RESULT_HEADER + "Status: FAILED\nError: {error}\n" + _RESULT_FOOTER
+_FAILURE_BARE_TEMPLATE = _RESULT_HEADER + "Status: FAILED\n" + _RESULT_FOOTER
+
+# Help screen, assembled once so show_help is a single write
+_HELP_TEXT = "\n".join([
+    "",
+    "=" * 60,
+    "AiNux Help - Natural Language Command Examples",
+    "=" * 60,
+    "File Operations:",
+    "  • 'List files here' or 'Show files in current directory'",
+    "  • 'Show current directory' or 'Where am I?'",
+    "  • 'Create directory myproject'",
+    "",
+    "System Information:",
+    "  • 'Show running processes'",
+    "  • 'Show network info'",
+    "  • 'Show system info'",
+    "  • 'Show disk usage'",
+    "",
+    "Navigation:",
+    "  • 'Change directory to Documents'",
+    "  • 'Go to directory myproject'",
+    "",
+    "Other Commands:",
+    "  • 'help' or 'h' or '?' - Show this help",
+    "  • 'exit' or 'quit' or 'q' - Exit AiNux",
+    "=" * 60,
+    "",
+    "",
+])
+
+
+# Anything a shell would interpret (pipes, redirection, globs, variables, escapes, ...)
+_SHELL_SYNTAX = re.compile(r'[|&;<>()$`\\*?\[\]{}~!#%\n]')
+
+# Commands that must run inside a shell even when a same-named binary exists on PATH
+_SHELL_BUILTINS = frozenset({
+    'cd', 'pwd', 'echo', 'export', 'set', 'unset', 'alias', 'unalias', 'source', '.',
+    'exec', 'eval', 'exit', 'type', 'ulimit', 'umask', 'read', 'jobs', 'history',
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _which(program: str) -> Optional[str]:
+    """Resolve a program on PATH once; repeated commands reuse the cached path."""
+    return shutil.which(program)
+
+
+def _direct_argv(command: str) -> Optional[List[str]]:
+    """
+    Split a command for direct execution when it does not need a shell.
+    
+    Args:
+        command (str): Command line to execute
+        
+    Returns:
+        Optional[List[str]]: Argument list, or None if the command uses shell syntax,
+            starts with a builtin or variable assignment, or its program is not on PATH
+    """
+    if _SHELL_SYNTAX.search(command):
+        return None
+
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+
+    if not argv or argv[0] in _SHELL_BUILTINS or '=' in argv[0] or not _which(argv[0]):
+        return None
+    return argv
 
 
 class AiNux:
@@ -25,170 +409,92 @@ class AiNux:
     def __init__(self):
         """Initialize AiNux with platform-specific settings and command mappings."""
         self.platform = platform.system().lower()
-        self.dangerous_commands = self._load_dangerous_commands()
-        self.command_mappings = self._load_command_mappings()
+        self.dangerous_commands = _DANGEROUS_COMMANDS
+        self.command_mappings = _COMMAND_MAPPINGS
+        self._pattern_union, self._dispatch = _build_dispatch(self.platform)
+        self._hyperscan = _build_hyperscan(self.platform)
+        platform_commands = self.command_mappings.get(self.platform, {})
+        self._literal_commands = {
+            literal: platform_commands[command_type]
+            for literal, command_type in _LITERAL_COMMAND_TYPES.items()
+            if command_type in platform_commands
+        }
+        # cmd.exe cannot be driven reliably over pipes, so Windows keeps one shell per command
+        self._shell_session = ShellSession.create()
+        self._cached_match = functools.lru_cache(maxsize=512)(self._match_command)
     
-    def _load_dangerous_commands(self) -> List[str]:
+    def parse_natural_language(self, user_input: str) -> Optional[str]:
         """
-        Load a list of dangerous commands that should not be executed.
+        Convert natural language input into a system command.
         
+        Args:
+            user_input (str): Natural language input from user
+            
         Returns:
-            List[str]: List of dangerous command patterns
+            Optional[str]: System command or None if not recognized
         """
-        return [
-            'rm -rf /',
-            'del /q /s',
-            'format',
-            'fdisk',
-            'mkfs',
-            'dd',
-            'shutdown',
-            'reboot',
-            'halt',
-            'poweroff',
-            'init 0',
-            'init 6',
-        ]
+        # Convert input to lowercase for easier matching; the normalized text
+        # is also the cache key, so repeated phrases skip pattern matching
+        input_lower = user_input.lower().strip()
+
+        # Single-word commands like 'ls' are the most common input
+        command = self._literal_commands.get(input_lower)
+        if command is not None:
+            return command
+        return self._cached_match(input_lower)
     
-    def _load_command_mappings(self) -> Dict[str, Dict[str, str]]:
+    def _match_command(self, input_lower: str) -> Optional[str]:
         """
-        Load command mappings for different platforms.
+        Match normalized input against the pattern table.
         
+        Args:
+            input_lower (str): Lowercased, stripped user input
+            
         Returns:
-            Dict: Command mappings organized by platform
+            Optional[str]: System command or None if not recognized
         """
-        return {
-            'windows': {
-                'list_files': 'dir',
-                'current_directory': 'cd',
-                'change_directory': 'cd',
-                'create_directory': 'mkdir',
-                'remove_file': 'del',
-                'copy_file': 'copy',
-                'move_file': 'move',
-                'show_processes': 'tasklist',
-                'network_info': 'ipconfig',
-                'system_info': 'systeminfo',
-                'disk_usage': 'dir /-c',
-            },
-            'linux': {
-                'list_files': 'ls -la',
-                'current_directory': 'pwd',
-                'change_directory': 'cd',
-                'create_directory': 'mkdir',
-                'remove_file': 'rm',
-                'copy_file': 'cp',
-                'move_file': 'mv',
-                'show_processes': 'ps aux',
-                'network_info': 'ifconfig',
-                'system_info': 'uname -a',
-                'disk_usage': 'df -h',
-            },
-            'darwin': {  # macOS
-                'list_files': 'ls -la',
-                'current_directory': 'pwd',
-                'change_directory': 'cd',
-                'create_directory': 'mkdir',
-                'remove_file': 'rm',
-                'copy_file': 'cp',
-                'move_file': 'mv',
-                'show_processes': 'ps aux',
-                'network_info': 'ifconfig',
-                'system_info': 'uname -a',
-                'disk_usage': 'df -h',
-            }
-        }
+        # Hyperscan matches bytes, so only ASCII input is guaranteed to see the
+        # same word boundaries and whitespace classes as the re patterns
+        if self._hyperscan is not None and input_lower.isascii():
+            return self._match_hyperscan(input_lower)
+
+        # Match input against every pattern in a single pass
+        match = self._pattern_union.match(input_lower) if self._pattern_union else None
+        if match:
+            command, argument_group = self._dispatch[match.lastgroup]
+
+            # Handle commands that need arguments
+            if argument_group:
+                return f"{command} {match.group(argument_group)}"
+            return command
+        
+        # If no pattern matches, return None
+        return None
     
-    def parse_natural_language(self, user_input: str) -> Optional[str]:
+    def _match_hyperscan(self, input_lower: str) -> Optional[str]:
         """
-        Convert natural language input into a system command.
+        Match normalized ASCII input with the platform's Hyperscan database.
         
         Args:
-            user_input (str): Natural language input from user
+            input_lower (str): Lowercased, stripped user input
             
         Returns:
             Optional[str]: System command or None if not recognized
         """
-        # Convert input to lowercase for easier matching
-        input_lower = user_input.lower().strip()
-        
-        # Define natural language patterns and their corresponding command types
-        patterns = {
-            'list_files': [
-                r'list.*files?.*current.*director',
-                r'show.*files?.*current.*director',
-                r'list.*files?.*here',
-                r'show.*files?.*here',
-                r'list.*director.*content',
-                r'what.*files?.*here',
-                r'dir',
-                r'ls'
-            ],
-            'current_directory': [
-                r'show.*current.*director',
-                r'what.*current.*director',
-                r'where.*am.*i',
-                r'current.*path',
-                r'working.*director',
-                r'pwd'
-            ],
-            'change_directory': [
-                r'change.*director.*to\s+(\S+)',
-                r'go.*to.*director.*(\S+)',
-                r'cd\s+(\S+)',
-                r'navigate.*to\s+(\S+)'
-            ],
-            'create_directory': [
-                r'create.*director.*(\S+)',
-                r'make.*director.*(\S+)',
-                r'mkdir\s+(\S+)',
-                r'new.*folder.*(\S+)'
-            ],
-            'show_processes': [
-                r'show.*process',
-                r'list.*process',
-                r'running.*process',
-                r'task.*list',
-                r'ps'
-            ],
-            'network_info': [
-                r'show.*network.*info',
-                r'network.*config',
-                r'ip.*config',
-                r'network.*settings'
-            ],
-            'system_info': [
-                r'system.*info',
-                r'show.*system.*info',
-                r'computer.*info',
-                r'machine.*info'
-            ],
-            'disk_usage': [
-                r'disk.*usage',
-                r'disk.*space',
-                r'storage.*info',
-                r'free.*space'
-            ]
-        }
-        
-        # Try to match input against patterns
-        for command_type, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                match = re.search(pattern, input_lower)
-                if match:
-                    # Get the appropriate command for the current platform
-                    platform_commands = self.command_mappings.get(self.platform, {})
-                    base_command = platform_commands.get(command_type)
-                    
-                    if base_command:
-                        # Handle commands that need arguments
-                        if command_type in ['change_directory', 'create_directory'] and match.groups():
-                            return f"{base_command} {match.group(1)}"
-                        else:
-                            return base_command
-        
-        # If no pattern matches, return None
-        return None
+        database, targets = self._hyperscan
+        matched_ids = []
+        database.scan(
+            input_lower.encode(),
+            match_event_handler=lambda pattern_id, start, end, flags, context: matched_ids.append(pattern_id),
+        )
+        if not matched_ids:
+            return None
+
+        # The earliest pattern in table order wins, as with the union regex
+        command, argument_pattern = targets[min(matched_ids)]
+        if argument_pattern is not None:
+            return f"{command} {argument_pattern.search(input_lower).group(1)}"
+        return command
     
     def is_command_safe(self, command: str) -> str:
         """
@@ -203,36 +509,12 @@ class AiNux:
         command_lower = command.lower().strip()
 
         # Absolutely forbidden commands
-        forbidden_patterns = [
-            r'rm\s+-rf\s+/',                     # rm -rf /
-            r'format(\s|$)',                     # format disk
-            r'fdisk',                            # partition tool
-            r'dd\s+if=',                         # raw disk overwrite
-            r'shutdown(\s|$)',
-            r'reboot(\s|$)',
-            r'poweroff(\s|$)',
-            r'init\s+[06]',                      # init 0 or 6
-        ]
-
-        for pattern in forbidden_patterns:
-            if re.search(pattern, command_lower):
-                return "forbidden"
+        if _FORBIDDEN_RE.search(command_lower):
+            return "forbidden"
 
         # Dangerous but confirmable
-        confirmable_patterns = [
-            r'rm\s+-rf\s+.+',            # rm -rf folder
-            r'rm\s+.+',                  # rm file
-            r'del\s+.+',                 # delete file (Windows)
-            r'rmdir\s+/s\s+/q\s+.+',     # delete folder (Windows)
-            r'rmdir\s+.+',               # any rmdir
-            r'mv\s+.+',                  # moving files can be destructive
-            r'chmod\s+7[0-7][0-7]',      # chmod 7xx
-            r'chown\s+-r\s+.+',          # recursive ownership
-        ]
-
-        for pattern in confirmable_patterns:
-            if re.search(pattern, command_lower):
-                return "confirm"
+        if _CONFIRMABLE_RE.search(command_lower):
+            return "confirm"
 
         return "safe"
     
@@ -266,14 +548,27 @@ class AiNux:
 
         # Safe or confirmed → execute
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=os.getcwd()
-            )
+            argv = _direct_argv(command)
+            if argv:
+                # Plain program invocation: exec it directly, no intermediate shell
+                result = subprocess.run(
+                    argv,
+                    executable=_which(argv[0]),
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+            elif self._shell_session is not None:
+                # Shell syntax on POSIX: reuse the pooled shell
+                result = self._shell_session.run(command, timeout=30)
+            else:
+                result = subprocess.run(
+                    command,
+                    shell=True,
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
 
             return {
                 'success': result.returncode == 0,
@@ -306,23 +601,14 @@ class AiNux:
         Args:
             result (Dict): Result dictionary from execute_command
         """
-        print(f"\n{'='*50}")
-        print(f"🔧 EXECUTED COMMAND: {result['command']}")
-        print(f"{'='*50}")
-        
         if result['success']:
-            print("Status: SUCCESS")
-            if result['output']:
-                print(f"Output:")
-                print(f"{result['output']}")
-            else:
-                print("Output: (no output)")
+            template = _SUCCESS_TEMPLATE if result['output'] else _SUCCESS_EMPTY_TEMPLATE
         else:
-            print("Status: FAILED")
-            if result['error']:
-                print(f"Error: {result['error']}")
+            template = _FAILURE_TEMPLATE if result['error'] else _FAILURE_BARE_TEMPLATE
         
-        print("=" * 50)
+        # One write for the whole block instead of a print per line
+        sys.stdout.write(template.format(command=result['command'], output=result['output'], error=result['error']))
+        sys.stdout.flush()
     
     def run_interactive_mode(self, voice: bool = False) -> None:
         """
@@ -337,21 +623,25 @@ class AiNux:
         print("  - 'Create directory myproject'")
         print("\n")
         
+        # Import voice support once, up front, rather than on every loop iteration
+        if voice:
+            try:
+                from voice_input import listen_for_command, VoiceInputError, warm_up
+                warm_up()
+            except ImportError:
+                print("Voice mode requires SpeechRecognition. Falling back to text input.")
+                voice = False
+        
         while True:
             try:
                 # Get user input (voice or text)
                 if voice:
                     try:
-                        from voice_input import listen_for_command, VoiceInputError
                         print("🎤 Listening... (say a command, or say 'exit' to quit)")
                         heard = listen_for_command(timeout=6, phrase_time_limit=8, language="en-US")
                         user_input = (heard or "").strip()
                         if user_input:
                             print(f"You said: {user_input}")
-                    except ImportError:
-                        print("Voice mode requires SpeechRecognition. Falling back to text input.")
-                        voice = False
-                        user_input = input("AiNux> ").strip()
                     except VoiceInputError as e:
                         print(f"Voice error: {e}")
                         user_input = input("AiNux> ").strip()
@@ -362,7 +652,8 @@ class AiNux:
                     user_input = input("AiNux> ").strip()
                 
                 # Check for exit commands
-                if user_input.lower() in ['exit', 'quit', 'q', 'bye']:
+                input_lower = user_input.lower()
+                if input_lower in _EXIT_COMMANDS:
                     print("Goodbye! Thanks for using AiNux.")
                     break
                 
@@ -371,7 +662,7 @@ class AiNux:
                     continue
                 
                 # Show help if requested
-                if user_input.lower() in ['help', 'h', '?']:
+                if input_lower in _HELP_COMMANDS:
                     self.show_help()
                     continue
                 
@@ -401,28 +692,8 @@ class AiNux:
     
     def show_help(self) -> None:
         """Display help information with example commands."""
-        print("\n" + "=" * 60)
-        print("AiNux Help - Natural Language Command Examples")
-        print("=" * 60)
-        print("File Operations:")
-        print("  • 'List files here' or 'Show files in current directory'")
-        print("  • 'Show current directory' or 'Where am I?'")
-        print("  • 'Create directory myproject'")
-        print("")
-        print("System Information:")
-        print("  • 'Show running processes'")
-        print("  • 'Show network info'")
-        print("  • 'Show system info'")
-        print("  • 'Show disk usage'")
-        print("")
-        print("Navigation:")
-        print("  • 'Change directory to Documents'")
-        print("  • 'Go to directory myproject'")
-        print("")
-        print("Other Commands:")
-        print("  • 'help' or 'h' or '?' - Show this help")
-        print("  • 'exit' or 'quit' or 'q' - Exit AiNux")
-        print("=" * 60 + "\n")
+        sys.stdout.write(_HELP_TEXT)
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
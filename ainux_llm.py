@@ -4,17 +4,162 @@ import subprocess
 import sys
 import os
 import re
+import threading
 import platform
 import json
+import sqlite3
 import time
-from typing import Optional, Dict, List, Union
-from dataclasses import dataclass
+import random
+import atexit
+import asyncio
+import concurrent.futures
+import functools
+import locale
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict, deque
+from types import MappingProxyType
+from typing import Callable, Optional, Dict, List, Mapping, Tuple, Union
+from dataclasses import astuple, dataclass
+from enum import IntEnum
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from shell_session import ShellSession
+
+try:
+    # Optional: local sentence embeddings let paraphrased requests reuse cached commands
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    np = None
+    SentenceTransformer = None
+
+try:
+    # Optional: async HTTP client for calling the Gemini REST API directly
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    # Optional: Aho-Corasick automaton that rules out most commands before the safety regexes
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Load environment variables
 load_dotenv()
 
+# Diagnostics go through a queue to a background thread, so request handling never
+# waits on a terminal write. They go to stdout, like the rest of the interface.
+# AINUX_LOG sets the level (e.g. AINUX_LOG=WARNING); unknown names fall back to INFO
+_log_queue = queue.Queue(-1)
+_log_stream = logging.StreamHandler(sys.stdout)
+_log_stream.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = QueueListener(_log_queue, _log_stream)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger('ainux')
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+
+_log_level = (os.getenv('AINUX_LOG') or 'INFO').strip().upper()
+# getLevelName maps a registered name to its number and returns a string for anything else
+if isinstance(logging.getLevelName(_log_level), int):
+    logger.setLevel(_log_level)
+else:
+    logger.setLevel(logging.INFO)
+    logger.warning("WARNING: Unknown AINUX_LOG level '%s', using INFO", _log_level)
+
+# Retries stop once less than this many seconds of the request timeout remain
+MIN_ATTEMPT_BUDGET = 0.5
+
+# Longest pause between retries, in seconds
+MAX_BACKOFF = 8.0
+
+# API errors that will fail the same way again (bad key, bad request), by class name so
+# both google.api_core exceptions and anything wrapping them are recognized
+_PERMANENT_ERRORS = frozenset({
+    'BadRequest', 'InvalidArgument', 'FailedPrecondition', 'NotFound',
+    'PermissionDenied', 'Forbidden', 'Unauthenticated', 'Unauthorized',
+})
+
+# Gemini REST endpoint used by the async client
+GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+
+# Stands in for the user input while a request body is pre-serialized; JSON escapes it
+# as \u0000, which no prompt text produces, so the body can be split around it
+_BODY_PLACEHOLDER = "\x00"
+
+# Model metadata endpoint; a cheap request that opens the async client's connection
+GEMINI_MODEL_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}"
+
+# Prefixes the LLM sometimes puts before a command, each optional, in the order they're stripped
+_RESPONSE_PREFIX = re.compile(r'^(?:command:\s*)?(?:output:\s*)?(?:>\s*)?(?:\$\s*)?(?:#\s*)?', re.IGNORECASE)
+
+# One "<number>: <command>" line of a batched response
+_BATCH_LINE = re.compile(r'^\s*(\d+)\s*[:.)]\s*(.*)$')
+
+# Where LLM-generated commands are kept between sessions
+PROMPT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.ainux', 'cache.sqlite')
+
+# Seconds a saved command stays valid; older entries are dropped when the cache opens
+PROMPT_CACHE_TTL = 30 * 24 * 3600
+
+# Argument-like tokens of a prompt: quoted strings, and words with a digit, a path
+# separator, a ~ or a file extension ("100mb", "src/app", "notes.txt")
+_ARGUMENT_TOKEN = re.compile(r'"[^"]*"|\'[^\']*\'|[^\s"\',;:!?]*(?:\d|[/\\~]|\.\w)[^\s"\',;:!?]*')
+
+
+def _argument_tokens(text: str) -> set:
+    """Return the argument-like tokens of a prompt, without sentence-ending dots"""
+    return {token.rstrip('.') for token in _ARGUMENT_TOKEN.findall(text)}
+
+# Similar LLM-resolved prompts needed before asking Gemini for a reusable program
+PROGRAM_CLUSTER_SIZE = 5
+
+# LLM-resolved requests kept around for clustering
+PROGRAM_HISTORY_SIZE = 200
+
+# Token-set Jaccard similarity at which two prompts count as the same request shape
+PROGRAM_CLUSTER_SIMILARITY = 0.5
+
+# Values a cached program may substitute into a command: plain names and paths only
+_PROGRAM_ARGUMENT = re.compile(r'[\w.\-/~+:@%,=]+')
+
+# Seconds a command may run before it is killed
+COMMAND_TIMEOUT = 30
+
+# Seconds voice input waits for speech to start, and the longest phrase it records. A long
+# wait keeps the microphone open through pauses instead of reopening it every few seconds
+VOICE_LISTEN_TIMEOUT = 30
+VOICE_PHRASE_LIMIT = 8
+
+# Interactive-mode keywords, checked with one hashed lookup per input
+_EXIT_COMMANDS = frozenset({'exit', 'quit', 'q', 'bye'})
+_HELP_COMMANDS = frozenset({'help', 'h', '?'})
+_MODE_COMMANDS = frozenset({'mode', 'info', 'status'})
+
+# Interactive status lines, encoded once and written straight to stdout's byte stream
+_LISTENING = "🎤 Listening...\n".encode("utf-8")
+_GOODBYE = "Goodbye! Thanks for using AiNux.\n".encode("utf-8")
+_INTERRUPTED = "\nInterrupted by user. Exiting.\n".encode("utf-8")
+
+# Prompt shown before a dangerous command runs; only YES lets it through
+_CONFIRM_TEMPLATE = (
+    "\nWARNING: This command may delete or modify important files:\n  {command}\n"
+    "If you're absolutely certain, type YES.\n"
+    "Confirm (YES to run): "
+)
+
+# Lines of a command's output kept for its result; earlier lines are only streamed
+OUTPUT_MAX_LINES = 10_000
+
+# Encoding of command output, the same one text-mode pipes would decode with
+_OUTPUT_ENCODING = locale.getpreferredencoding(False)
+
 @dataclass
 class GeminiConfig:
     """Configuration for Gemini LLM integration"""
@@ -24,6 +169,185 @@ class GeminiConfig:
     temperature: float = 0.2
     max_retries: int = 2
     max_output_tokens: int = 100  
+    # Answer concurrent async requests with batched calls (BatchingGeminiLLM)
+    batch_requests: bool = bool(os.getenv('AINUX_BATCH_LLM'))
+
+
+@dataclass
+class CachedProgram:
+    """A regex and command template that resolves one shape of request locally"""
+    pattern: "re.Pattern[str]"
+    template: str
+    platform: str
+    
+    def apply(self, normalized_input: str) -> Optional[str]:
+        """
+        Produce the command for an input if it has this program's shape
+        
+        Args:
+            normalized_input (str): Lowercased input with collapsed whitespace
+            
+        Returns:
+            Optional[str]: Command, or None if the input doesn't match or captures
+                anything other than a plain name or path
+        """
+        match = self.pattern.fullmatch(normalized_input)
+        if not match:
+            return None
+        arguments = match.groupdict()
+        if not all(value and _PROGRAM_ARGUMENT.fullmatch(value) for value in arguments.values()):
+            return None
+        try:
+            return self.template.format(**arguments)
+        except (KeyError, IndexError, ValueError):
+            return None
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """
+    Decide whether a failed LLM request is worth retrying
+    
+    Args:
+        error (Exception): Error raised by the SDK or the HTTP client
+        
+    Returns:
+        bool: False for client errors such as a bad key or request, True otherwise
+    """
+    if type(error).__name__ in _PERMANENT_ERRORS:
+        return False
+    status = getattr(error, 'code', None)
+    if not isinstance(status, int):
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    # Timeouts (408) and rate limits (429) are the client errors that clear up on their own
+    if isinstance(status, int) and 400 <= status < 500 and status not in (408, 429):
+        return False
+    return True
+
+
+def _backoff_delay(attempt: int, deadline: float) -> float:
+    """
+    Exponential backoff with jitter, cut short so the next attempt still fits the deadline
+    
+    Args:
+        attempt (int): Zero-based number of the attempt that just failed
+        deadline (float): time.monotonic() value by which the request must finish
+        
+    Returns:
+        float: Seconds to wait before the next attempt
+    """
+    delay = min(2 ** attempt + random.random() * 0.25, MAX_BACKOFF)
+    return max(0.0, min(delay, deadline - time.monotonic() - MIN_ATTEMPT_BUDGET))
+
+
+def _decode_output(data: Optional[bytes]) -> str:
+    """
+    Turn captured command output into display text
+    
+    Args:
+        data (Optional[bytes]): Raw bytes read from the command's pipe
+        
+    Returns:
+        str: Decoded output with normalized newlines and surrounding whitespace removed
+    """
+    if not data:
+        return ''
+    return data.decode(_OUTPUT_ENCODING, errors='replace').replace('\r\n', '\n').strip()
+
+
+async def _read_lines(stream: "asyncio.StreamReader", lines: "deque[str]",
+                      on_line: Optional[Callable[[str], None]] = None) -> None:
+    """
+    Read a pipe to the end, one decoded line at a time
+    
+    Args:
+        stream (asyncio.StreamReader): Pipe to read
+        lines (deque): Receives each line; its maxlen bounds the memory used
+        on_line (Optional[Callable]): Called with each line as soon as it is complete
+    """
+    pending = b''
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        # Lines are split on raw bytes so a multi-byte character is never cut in half
+        *complete, pending = (pending + chunk).split(b'\n')
+        for raw in complete:
+            line = raw.decode(_OUTPUT_ENCODING, errors='replace').rstrip('\r')
+            lines.append(line)
+            if on_line:
+                on_line(line)
+    if pending:
+        line = pending.decode(_OUTPUT_ENCODING, errors='replace').rstrip('\r')
+        lines.append(line)
+        if on_line:
+            on_line(line)
+
+
+def _write_status(data: bytes) -> None:
+    """
+    Write a UTF-8 status line to stdout without a round trip through its text codec
+    
+    Args:
+        data (bytes): Encoded line, including its newline
+    """
+    stream = getattr(sys.stdout, 'buffer', None)
+    if stream is None:
+        # stdout was replaced by a text-only stream
+        sys.stdout.write(data.decode("utf-8"))
+    else:
+        # Text already written must come out first
+        sys.stdout.flush()
+        stream.write(data)
+        stream.flush()
+
+
+async def _read_input(prompt: str) -> str:
+    """
+    input() without blocking the event loop while the user types
+    
+    The read happens on a daemon thread rather than in the loop's executor, whose
+    threads are joined at exit, so a read still waiting after Ctrl+C doesn't keep
+    the process alive. Piped input is read directly: nobody is typing, and a daemon
+    thread blocked on a pipe would hold stdin's lock during interpreter shutdown
+    
+    Args:
+        prompt (str): Prompt written before reading
+        
+    Returns:
+        str: The line read, without its newline
+        
+    Raises:
+        EOFError: If stdin is closed
+    """
+    if not sys.stdin.isatty():
+        return input(prompt)
+    
+    result: "concurrent.futures.Future[str]" = concurrent.futures.Future()
+    
+    def read() -> None:
+        if not result.set_running_or_notify_cancel():
+            return
+        try:
+            result.set_result(input(prompt))
+        except Exception as e:
+            result.set_exception(e)
+    
+    threading.Thread(target=read, name="ainux-input", daemon=True).start()
+    return await asyncio.wrap_future(result)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_model_names(api_key: str) -> frozenset:
+    """
+    List the models available to an API key, once per process
+    
+    Args:
+        api_key (str): Gemini API key (the cache key; genai must already be configured with it)
+        
+    Returns:
+        frozenset: Full model names such as 'models/gemini-2.5-flash'
+    """
+    return frozenset(model.name for model in genai.list_models())
 
 
 class GeminiLLM:
@@ -35,6 +359,28 @@ class GeminiLLM:
         """Initialize Gemini LLM client with configuration"""
         self.config = config
         self.available = self._check_availability()
+        
+        # Prompts only vary in the user input, so everything else is rendered once per platform.
+        # The instructions are sent as the system instruction; Gemini's explicit context
+        # cache needs a longer prefix than this, so they aren't registered as cached content
+        self._prompt_parts: Dict[str, Tuple[str, str, str]] = {}
+        for known_platform in ('windows', 'linux', 'darwin'):
+            self._get_prompt_parts(known_platform)
+        # The same for the async client's JSON request bodies, as UTF-8 bytes
+        self._body_parts: Dict[str, Tuple[bytes, bytes]] = {}
+        
+        # SDK models (one per platform, since the system instruction differs) and the
+        # generation parameters, reused across requests
+        self._models: Dict[str, "genai.GenerativeModel"] = {}
+        self._generation_config = genai.types.GenerationConfig(
+            temperature=self.config.temperature,
+            max_output_tokens=self.config.max_output_tokens,
+        )
+        
+        # Async HTTP client and in-flight requests, both bound to the event loop that created them
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Dict[str, "asyncio.Task[Optional[str]]"] = {}
     
     def _check_availability(self) -> bool:
         """
@@ -45,27 +391,26 @@ class GeminiLLM:
         """
         try:
             if not self.config.api_key:
-                print("ERROR: No GEMINI_API_KEY found in .env file")
+                logger.error("ERROR: No GEMINI_API_KEY found in .env file")
                 return False
             
             # Configure Gemini
             genai.configure(api_key=self.config.api_key)
             
             # Test the connection by listing models
-            models = genai.list_models()
-            available_models = [model.name for model in models]
+            available_models = _list_model_names(self.config.api_key)
             
             # Check if our target model is available
             target_model = f"models/{self.config.model}"
             if target_model in available_models:
-                print(f"SUCCESS: Gemini API connected successfully with model: {self.config.model}")
+                logger.info("SUCCESS: Gemini API connected successfully with model: %s", self.config.model)
                 return True
             else:
-                print(f"WARNING: Model '{self.config.model}' not found. Using default.")
+                logger.warning("WARNING: Model '%s' not found. Using default.", self.config.model)
                 return True
                 
         except Exception as e:
-            print(f"ERROR: Gemini API not available: {str(e)}")
+            logger.error("ERROR: Gemini API not available: %s", e)
             return False
     
     def generate_command(self, user_input: str, platform: str) -> Optional[str]:
@@ -83,22 +428,18 @@ class GeminiLLM:
             return None
         
         prompt = self._create_command_prompt(user_input, platform)
+        deadline = time.monotonic() + self.config.timeout
         
         for attempt in range(self.config.max_retries):
+            remaining = deadline - time.monotonic()
+            if remaining < MIN_ATTEMPT_BUDGET:
+                break
             try:
-                # Initialize the model
-                model = genai.GenerativeModel(self.config.model)
-                
-                # Configure generation parameters
-                generation_config = genai.types.GenerationConfig(
-                    temperature=self.config.temperature,
-                    max_output_tokens=self.config.max_output_tokens,
-                )
-                
                 # Generate response
-                response = model.generate_content(
+                response = self._get_model(platform).generate_content(
                     prompt,
-                    generation_config=generation_config
+                    generation_config=self._generation_config,
+                    request_options={"timeout": remaining}
                 )
                 
                 if response.text:
@@ -107,15 +448,233 @@ class GeminiLLM:
                         return command
                 
             except Exception as e:
-                print(f"RETRY: LLM request attempt {attempt + 1} failed: {str(e)}")
+                if not _is_retryable_error(e):
+                    logger.error("ERROR: LLM request failed: %s", e)
+                    break
+                logger.warning("RETRY: LLM request attempt %d failed: %s", attempt + 1, e)
                 if attempt < self.config.max_retries - 1:
-                    time.sleep(1)  # Brief pause before retry
+                    time.sleep(_backoff_delay(attempt, deadline))
+        
+        return None
+    
+    def _get_model(self, platform: str) -> "genai.GenerativeModel":
+        """
+        Return the model for a platform, creating it on first use
+        
+        Args:
+            platform (str): Operating system platform
+            
+        Returns:
+            genai.GenerativeModel: Model whose system instruction holds the platform's instructions
+        """
+        model = self._models.get(platform)
+        if model is None:
+            model = self._models[platform] = genai.GenerativeModel(
+                self.config.model,
+                system_instruction=self._get_system_instruction(platform)
+            )
+        return model
+    
+    async def warm_up_async(self) -> None:
+        """Open the pooled HTTP client's connection ahead of the first async request"""
+        if not self.available or httpx is None:
+            return
+        try:
+            await self._get_client().get(
+                GEMINI_MODEL_URL.format(model=self.config.model),
+                headers={"x-goog-api-key": self.config.api_key},
+            )
+        except Exception as e:
+            logger.debug("Gemini warm-up failed: %s", e)
+    
+    async def generate_command_async(self, user_input: str, platform: str) -> Optional[str]:
+        """
+        Async version of generate_command that calls the Gemini REST API over a pooled
+        HTTP connection. Concurrent calls for the same prompt share one request.
+        
+        Args:
+            user_input (str): Natural language input from user
+            platform (str): Current operating system platform
+            
+        Returns:
+            Optional[str]: Generated system command or None if failed
+        """
+        if not self.available:
+            return None
+        if httpx is None:
+            # Without httpx, keep the event loop free by running the SDK in a thread
+            return await asyncio.to_thread(self.generate_command, user_input, platform)
+        
+        body = self._create_request_body(user_input, platform)
+        self._get_client()
+        task = self._inflight.get(body)
+        if task is None:
+            task = asyncio.ensure_future(self._request_command(body))
+            self._inflight[body] = task
+            task.add_done_callback(lambda _: self._inflight.pop(body, None))
+        
+        # Shielded so a caller that gives up doesn't cancel the request for the others
+        return await asyncio.shield(task)
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+    
+    def _get_client(self) -> "httpx.AsyncClient":
+        """
+        Return the HTTP client for the running event loop, creating it on first use
+        
+        Returns:
+            httpx.AsyncClient: Client with a persistent connection pool
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            limits = httpx.Limits(max_keepalive_connections=32)
+            try:
+                self._client = httpx.AsyncClient(http2=True, limits=limits, timeout=self.config.timeout)
+            except ImportError:
+                # HTTP/2 needs the h2 package
+                self._client = httpx.AsyncClient(limits=limits, timeout=self.config.timeout)
+            self._client_loop = loop
+            self._inflight = {}
+        return self._client
+    
+    async def _request_command(self, body: bytes) -> Optional[str]:
+        """
+        Send one command request to the Gemini REST API, retrying like generate_command
+        
+        Args:
+            body (bytes): JSON request body from _create_request_body
+            
+        Returns:
+            Optional[str]: Extracted command or None if failed
+        """
+        deadline = time.monotonic() + self.config.timeout
+        
+        for attempt in range(self.config.max_retries):
+            remaining = deadline - time.monotonic()
+            if remaining < MIN_ATTEMPT_BUDGET:
+                break
+            try:
+                text = await self._post_body(body, timeout=remaining)
+                command = self._extract_command(text)
+                if command:
+                    return command
+                
+            except Exception as e:
+                if not _is_retryable_error(e):
+                    logger.error("ERROR: LLM request failed: %s", e)
+                    break
+                logger.warning("RETRY: LLM request attempt %d failed: %s", attempt + 1, e)
+                if attempt < self.config.max_retries - 1:
+                    await asyncio.sleep(_backoff_delay(attempt, deadline))
+        
+        return None
+    
+    async def _post_prompt(self, prompt: str, max_output_tokens: int, system_instruction: Optional[str] = None,
+                           timeout: Optional[float] = None) -> str:
+        """
+        Make one Gemini REST call
+        
+        Args:
+            prompt (str): Prompt text
+            max_output_tokens (int): Output token budget for the response
+            system_instruction (Optional[str]): Instructions sent apart from the prompt
+            timeout (Optional[float]): Seconds allowed for this call (client default if None)
+            
+        Returns:
+            str: Text of the first candidate (empty if there is none)
+        """
+        body = {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "temperature": self.config.temperature,
+                "maxOutputTokens": max_output_tokens,
+            },
+        }
+        if system_instruction:
+            body["systemInstruction"] = {"parts": [{"text": system_instruction}]}
+        return await self._post_body(json.dumps(body).encode(), timeout)
+    
+    async def _post_body(self, body: bytes, timeout: Optional[float] = None) -> str:
+        """
+        POST a serialized generateContent request
+        
+        Args:
+            body (bytes): JSON request body
+            timeout (Optional[float]): Seconds allowed for this call (client default if None)
+            
+        Returns:
+            str: Text of the first candidate (empty if there is none)
+        """
+        response = await self._get_client().post(
+            GEMINI_API_URL.format(model=self.config.model),
+            content=body,
+            headers={"x-goog-api-key": self.config.api_key, "Content-Type": "application/json"},
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+        )
+        response.raise_for_status()
+        candidates = response.json().get("candidates") or []
+        if not candidates:
+            return ""
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return "".join(part.get("text", "") for part in parts)
+    
+    def synthesize_program(self, cluster: List[Tuple[str, str]], platform: str) -> Optional[CachedProgram]:
+        """
+        Ask Gemini for a regex and template that reproduce a cluster of resolved prompts
+        
+        Args:
+            cluster (List[Tuple[str, str]]): (normalized prompt, command) examples
+            platform (str): Operating system platform
+            
+        Returns:
+            Optional[CachedProgram]: Program that reproduces every example, or None
+        """
+        if not self.available:
+            return None
+        
+        examples_text = '\n'.join(json.dumps({'input': prompt, 'command': command}) for prompt, command in cluster)
+        prompt = f"""You write tiny programs that turn natural language requests into {platform} commands.
+
+Below are requests that share one shape, each with the command it produced:
+{examples_text}
+
+Return a JSON object with two keys:
+- "regex": a Python regular expression that fully matches every input above (and other
+  requests of the same shape), using named groups such as (?P<name>\\S+) for the parts
+  that vary between requests
+- "template": the command as a Python str.format template using those group names
+
+Output only the JSON object."""
+        
+        try:
+            model = genai.GenerativeModel(self.config.model)
+            response = model.generate_content(
+                prompt,
+                generation_config=genai.types.GenerationConfig(
+                    temperature=0,
+                    response_mime_type='application/json',
+                )
+            )
+            spec = json.loads(response.text)
+            program = CachedProgram(re.compile(spec['regex']), str(spec['template']), platform)
+        except Exception as e:
+            logger.warning("WARNING: Program synthesis failed: %s", e)
+            return None
         
+        # Only keep programs that reproduce every example exactly
+        if all(program.apply(prompt) == command for prompt, command in cluster):
+            return program
         return None
     
     def _create_command_prompt(self, user_input: str, platform: str) -> str:
         """
-        Create an intelligent prompt for command generation
+        Create an intelligent prompt for command generation. The static instructions
+        are sent separately, see _get_system_instruction.
         
         Args:
             user_input (str): User's natural language input
@@ -124,6 +683,99 @@ class GeminiLLM:
         Returns:
             str: Formatted prompt for the LLM
         """
+        prefix, suffix, _ = self._get_prompt_parts(platform)
+        return prefix + user_input + suffix
+    
+    def _get_system_instruction(self, platform: str) -> str:
+        """
+        Return the static instructions sent as the system instruction for a platform
+        
+        Args:
+            platform (str): Operating system platform
+            
+        Returns:
+            str: Instructions and examples shared by every prompt on the platform
+        """
+        return self._get_prompt_parts(platform)[2]
+    
+    def _create_batch_prompt(self, user_inputs: List[str], platform: str) -> str:
+        """
+        Create a prompt that converts several requests in one LLM call
+        
+        Args:
+            user_inputs (List[str]): User requests, answered by their 1-based position
+            platform (str): Operating system platform
+            
+        Returns:
+            str: Formatted prompt for the LLM
+        """
+        requests_text = '\n'.join(f'{number}. "{user_input}"' for number, user_input in enumerate(user_inputs, 1))
+        return f"""TASK: Convert each numbered natural language request to a {platform} command.
+Output exactly one line per request, in order, formatted as "<number>: <command>".
+
+REQUESTS:
+{requests_text}
+
+COMMANDS:"""
+    
+    def _create_request_body(self, user_input: str, platform: str) -> bytes:
+        """
+        Serialize the generateContent request for a command prompt, only escaping the
+        user input; the rest of the body is serialized once per platform
+        
+        Args:
+            user_input (str): Natural language input from user
+            platform (str): Operating system platform
+            
+        Returns:
+            bytes: JSON request body
+        """
+        parts = self._body_parts.get(platform)
+        if parts is None:
+            prefix, suffix, instructions = self._get_prompt_parts(platform)
+            template = json.dumps({
+                "contents": [{"parts": [{"text": prefix + _BODY_PLACEHOLDER + suffix}]}],
+                "generationConfig": {
+                    "temperature": self.config.temperature,
+                    "maxOutputTokens": self.config.max_output_tokens,
+                },
+                "systemInstruction": {"parts": [{"text": instructions}]},
+            }).encode()
+            head, tail = template.split(json.dumps(_BODY_PLACEHOLDER)[1:-1].encode())
+            parts = self._body_parts[platform] = (head, tail)
+        # Escaping a string on its own gives the same text as escaping it inside the prompt
+        return b"".join((parts[0], json.dumps(user_input)[1:-1].encode(), parts[1]))
+    
+    def _get_prompt_parts(self, platform: str) -> Tuple[str, str, str]:
+        """
+        Return the pre-rendered prompt text for a platform, rendering it on first use
+        
+        Args:
+            platform (str): Operating system platform
+            
+        Returns:
+            Tuple[str, str, str]: Text before and after the user input in a command
+                prompt, and the system instruction
+        """
+        parts = self._prompt_parts.get(platform)
+        if parts is None:
+            parts = self._prompt_parts[platform] = (
+                f'TASK: Convert this natural language to a {platform} command:\n"',
+                '"\n\nCOMMAND:',
+                self._create_instructions(platform).rstrip(),
+            )
+        return parts
+    
+    def _create_instructions(self, platform: str) -> str:
+        """
+        Create the instructions and examples shared by every command prompt
+        
+        Args:
+            platform (str): Operating system platform
+            
+        Returns:
+            str: Prompt text that precedes the task
+        """
         platform_commands = {
             'windows': {
                 'examples': [
@@ -196,10 +848,7 @@ EXAMPLES FOR DELETION:
 - "delete folder test_data" -> rmdir /s /q test_data         (Windows)
 - "delete file report.txt" -> del report.txt                 (Windows)
 
-TASK: Convert this natural language to a {platform} command:
-"{user_input}"
-
-COMMAND:"""
+"""
 
         return prompt
     
@@ -216,14 +865,8 @@ COMMAND:"""
         if not llm_response:
             return None
         
-        # Clean the response
-        command = llm_response.strip()
-        
-        # Remove common prefixes and suffixes
-        prefixes_to_remove = ['command:', 'output:', '>', '$', '#']
-        for prefix in prefixes_to_remove:
-            if command.lower().startswith(prefix):
-                command = command[len(prefix):].strip()
+        # Clean the response and remove common prefixes
+        command = _RESPONSE_PREFIX.sub('', llm_response.strip(), count=1)
         
         # Check for invalid responses
         invalid_responses = ['invalid_request', 'invalid request', 'error', 'unknown']
@@ -240,7 +883,1017 @@ COMMAND:"""
         if command.startswith("'") and command.endswith("'"):
             command = command[1:-1]
         
-        return command
+        return command
+
+
+class BatchingGeminiLLM:
+    """
+    Wraps GeminiLLM to answer concurrent async requests with batched Gemini calls
+    
+    Requests that arrive within a short window are sent as one numbered prompt and
+    the numbered answers are handed back to each caller. Requests the batch answer
+    doesn't cover are retried one at a time.
+    """
+    
+    def __init__(self, llm: GeminiLLM, window: float = 0.015, max_batch: int = 16):
+        """Initialize the batching layer around an existing Gemini client"""
+        self.llm = llm
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: Optional["asyncio.Queue[Tuple[str, str, asyncio.Future]]"] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Batches being answered, referenced until they finish
+        self._dispatching: set = set()
+    
+    @property
+    def available(self) -> bool:
+        """Whether the wrapped Gemini client is available"""
+        return self.llm.available
+    
+    async def generate_command_async(self, user_input: str, platform: str) -> Optional[str]:
+        """
+        Queue a request for the next batch and wait for its command
+        
+        Args:
+            user_input (str): Natural language input from user
+            platform (str): Current operating system platform
+            
+        Returns:
+            Optional[str]: Generated system command or None if failed
+        """
+        if not self.llm.available:
+            return None
+        if httpx is None:
+            return await self.llm.generate_command_async(user_input, platform)
+        
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+            self._loop = loop
+        
+        future = loop.create_future()
+        await self._queue.put((user_input, platform, future))
+        return await future
+    
+    async def aclose(self) -> None:
+        """Stop the batching worker and close the wrapped client"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        await self.llm.aclose()
+    
+    async def _run(self) -> None:
+        """Collect queued requests into batches and dispatch each batch"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            # One prompt per platform; the batches run while the next one is collected
+            by_platform: Dict[str, List[Tuple[str, asyncio.Future]]] = {}
+            for user_input, platform, future in batch:
+                by_platform.setdefault(platform, []).append((user_input, future))
+            for platform, requests in by_platform.items():
+                task = loop.create_task(self._dispatch(requests, platform))
+                self._dispatching.add(task)
+                task.add_done_callback(self._dispatching.discard)
+    
+    async def _dispatch(self, requests: List[Tuple[str, "asyncio.Future"]], platform: str) -> None:
+        """
+        Answer one platform's batch, falling back to single requests for any
+        answers that are missing or invalid
+        
+        Args:
+            requests (List[Tuple[str, asyncio.Future]]): Inputs and their callers' futures
+            platform (str): Operating system platform
+        """
+        commands: Dict[int, str] = {}
+        if len(requests) > 1:
+            prompt = self.llm._create_batch_prompt([user_input for user_input, _ in requests], platform)
+            try:
+                text = await self.llm._post_prompt(
+                    prompt,
+                    self.llm.config.max_output_tokens * len(requests),
+                    self.llm._get_system_instruction(platform),
+                )
+                commands = self._parse_batch_response(text, len(requests))
+            except Exception as e:
+                logger.warning("RETRY: Batched LLM request failed, sending requests individually: %s", e)
+        
+        async def resolve(number: int, user_input: str, future: "asyncio.Future") -> None:
+            try:
+                command = commands.get(number)
+                if command is None:
+                    command = await self.llm.generate_command_async(user_input, platform)
+                if not future.done():
+                    future.set_result(command)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+        
+        await asyncio.gather(*(
+            resolve(number, user_input, future)
+            for number, (user_input, future) in enumerate(requests, 1)
+        ))
+    
+    def _parse_batch_response(self, text: str, count: int) -> Dict[int, str]:
+        """
+        Split a batched response into commands by request number
+        
+        Args:
+            text (str): Raw response text
+            count (int): Number of requests in the batch
+            
+        Returns:
+            Dict[int, str]: Valid commands keyed by 1-based request number
+        """
+        commands = {}
+        for line in text.splitlines():
+            match = _BATCH_LINE.match(line)
+            if not match:
+                continue
+            number = int(match.group(1))
+            if 1 <= number <= count and number not in commands:
+                command = self.llm._extract_command(match.group(2))
+                if command:
+                    commands[number] = command
+        return commands
+
+
+# Sentence embedding model for the semantic cache and the intent classifier
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+# Dynamically quantized int8 ONNX exports published with the model, by CPU architecture
+_QUANTIZED_EMBEDDER_FILES = {
+    'x86_64': 'onnx/model_qint8_avx512_vnni.onnx',
+    'amd64': 'onnx/model_qint8_avx512_vnni.onnx',
+    'arm64': 'onnx/model_qint8_arm64.onnx',
+    'aarch64': 'onnx/model_qint8_arm64.onnx',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_embedder() -> Optional["SentenceTransformer"]:
+    """
+    Load the sentence embedding model once per process
+    
+    Returns:
+        Optional[SentenceTransformer]: The model, or None if it is unavailable
+    """
+    if SentenceTransformer is None:
+        return None
+    
+    # Prefer the int8 ONNX export, which needs sentence-transformers>=3.2 with optimum[onnxruntime]
+    file_name = _QUANTIZED_EMBEDDER_FILES.get(platform.machine().lower())
+    if file_name:
+        try:
+            return SentenceTransformer(EMBEDDING_MODEL, backend='onnx', model_kwargs={'file_name': file_name})
+        except Exception:
+            pass
+    try:
+        return SentenceTransformer(EMBEDDING_MODEL)
+    except Exception as e:
+        logger.warning("WARNING: Embedding model failed to load, semantic matching disabled: %s", e)
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _embed(text: str) -> Optional["np.ndarray"]:
+    """
+    Embed text as a unit vector; cached since the same requests recur
+    
+    Args:
+        text (str): Normalized text
+        
+    Returns:
+        Optional[np.ndarray]: Read-only embedding, or None without a model
+    """
+    embedder = _get_embedder()
+    if embedder is None:
+        return None
+    embedding = embedder.encode(text, normalize_embeddings=True)
+    embedding.setflags(write=False)
+    return embedding
+
+
+# Canonical phrasings of the requests that map to one fixed command, for the intent classifier
+_INTENT_PHRASES: Dict[str, List[str]] = {
+    'list_files': ['list files in current directory', 'show all files here', 'what files are in this folder'],
+    'list_python_files': ['list python files', 'show all .py files', 'find python scripts here'],
+    'current_directory': ['show current directory', 'where am i', 'print working directory'],
+    'show_processes': ['show running processes', 'list all processes', 'what tasks are running'],
+    'network_info': ['show network configuration', 'what is my ip address', 'network interface details'],
+    'network_connections': ['show network connections', 'list open ports', 'active connections'],
+    'system_info': ['show system information', 'what operating system is this', 'computer hardware details'],
+    'disk_usage': ['show disk usage', 'how much disk space is free', 'storage space available'],
+    'environment_vars': ['show environment variables', 'list env vars'],
+    'logged_users': ['who is logged in', 'show logged in users'],
+    'large_files': ['find large files', 'show the biggest files'],
+    'recent_files': ['show recently modified files', 'which files changed recently'],
+    'file_count': ['how many files are here', 'count the files in this directory'],
+    'memory_usage': ['show memory usage', 'how much ram is free'],
+}
+
+# Cosine similarity above which the intent classifier answers without the LLM
+INTENT_THRESHOLD = 0.75
+
+# Politeness and filler words the intent classifier accepts besides the words of its phrases
+_INTENT_FILLER_WORDS = frozenset(
+    'a all an any are can could currently display give here i is me my now of on '
+    'please right tell the this what which would you'.split())
+
+# Set AINUX_ALWAYS_LLM to send every request to the LLM, skipping the local shortcuts
+# (canonical phrases, intent classifier, caches); meant for benchmarking the LLM path
+ALWAYS_LLM = bool(os.getenv('AINUX_ALWAYS_LLM'))
+
+# Trailing punctuation ignored when matching a canonical phrase
+_CANONICAL_PUNCTUATION = '?.!'
+
+# Exact phrasings, besides the intent phrases, common enough to resolve by lookup
+_CANONICAL_EXTRA_PHRASES: Dict[str, List[str]] = {
+    'list_files': ['ls', 'dir', 'list files', 'list files here', 'show files', 'show files here',
+                   'list all files in the current directory', 'show files in current directory'],
+    'current_directory': ['pwd', 'show current working directory', 'what is the current directory'],
+    'show_processes': ['ps', 'show processes', 'list processes'],
+    'network_info': ['show network info', 'show network information'],
+    'system_info': ['show system info'],
+    'disk_usage': ['show disk space'],
+}
+
+# Normalized canonical phrase -> command type, checked before anything slower
+_CANONICAL_PHRASES: Mapping[str, str] = MappingProxyType({
+    phrase: intent
+    for table in (_INTENT_PHRASES, _CANONICAL_EXTRA_PHRASES)
+    for intent, phrases in table.items()
+    for phrase in phrases
+})
+
+# Words an input may consist of for the intent classifier to answer it; anything else
+# (a process name, a folder, a size) is an argument a fixed command would drop
+_INTENT_VOCABULARY = frozenset(
+    word for phrase in _CANONICAL_PHRASES for word in phrase.split()) | _INTENT_FILLER_WORDS
+
+
+@functools.lru_cache(maxsize=None)
+def _get_intent_index() -> Optional[Tuple["np.ndarray", List[str]]]:
+    """
+    Embed the canonical intent phrases once per process
+    
+    Returns:
+        Optional[Tuple[np.ndarray, List[str]]]: Unit-vector matrix with one row per
+            phrase and each row's intent, or None without an embedding model
+    """
+    embedder = _get_embedder()
+    if embedder is None:
+        return None
+    labels = [intent for intent, phrases in _INTENT_PHRASES.items() for _ in phrases]
+    phrases = [phrase for phrase_list in _INTENT_PHRASES.values() for phrase in phrase_list]
+    matrix = np.asarray(embedder.encode(phrases, normalize_embeddings=True), dtype=np.float32)
+    return matrix, labels
+
+
+class PromptCache:
+    """
+    Two-tier cache of LLM-generated commands keyed by platform and prompt
+    
+    The exact tier is an LRU dict keyed by the normalized prompt. When
+    sentence-transformers is installed, a semantic tier also matches paraphrases
+    whose embedding has a cosine similarity above the threshold with a cached
+    prompt, as long as both prompts name the same arguments: every word the cached
+    command copied from its prompt (a folder or file name, say) appears in the new
+    prompt, and both have the same numbers, paths and quoted strings.
+    
+    Entries are written through to a SQLite file as they are added, under a
+    namespace naming the model and temperature that produced them, so a
+    different configuration never reuses them.
+    """
+    
+    def __init__(self, path: Optional[str] = PROMPT_CACHE_PATH, maxsize: int = 1024, threshold: float = 0.92,
+                 namespace: str = '', ttl: float = PROMPT_CACHE_TTL):
+        """Initialize the cache and load entries saved by earlier sessions"""
+        self.path = path
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.namespace = namespace
+        self.ttl = ttl
+        self._db: Optional[sqlite3.Connection] = None
+        self._exact: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        # per platform: list of (normalized prompt, command), their embeddings, and the stacked matrix
+        self._semantic: Dict[str, List[Tuple[str, str]]] = {}
+        self._vectors: Dict[str, list] = {}
+        self._matrix: Dict[str, "np.ndarray"] = {}
+        self._load()
+    
+    @staticmethod
+    def normalize(prompt: str) -> str:
+        """Lowercase a prompt and collapse its whitespace"""
+        return ' '.join(prompt.lower().split())
+    
+    def get(self, platform: str, prompt: str) -> Optional[str]:
+        """
+        Look up a cached command for a prompt
+        
+        Args:
+            platform (str): Operating system platform
+            prompt (str): Natural language input from user
+            
+        Returns:
+            Optional[str]: Cached command or None on a miss
+        """
+        key = (platform, self.normalize(prompt))
+        command = self._exact.get(key)
+        if command is not None:
+            self._exact.move_to_end(key)
+            return command
+        return self._get_similar(platform, key[1])
+    
+    def put(self, platform: str, prompt: str, command: str) -> None:
+        """
+        Store a generated command in both tiers
+        
+        Args:
+            platform (str): Operating system platform
+            prompt (str): Natural language input from user
+            command (str): Command generated for it
+        """
+        key = (platform, self.normalize(prompt))
+        self._exact[key] = command
+        self._exact.move_to_end(key)
+        if len(self._exact) > self.maxsize:
+            self._exact.popitem(last=False)
+        self._store(platform, key[1], command)
+        
+        embedding = _embed(key[1])
+        if embedding is not None:
+            entries = self._semantic.setdefault(platform, [])
+            vectors = self._vectors.setdefault(platform, [])
+            entries.append((key[1], command))
+            vectors.append(embedding)
+            if len(entries) > self.maxsize:
+                del entries[0], vectors[0]
+            self._matrix.pop(platform, None)
+    
+    def close(self) -> None:
+        """Close the database; entries are already on disk"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+    
+    def _store(self, platform: str, prompt: str, command: str) -> None:
+        """Write one entry through to the database"""
+        if self._db is None:
+            return
+        try:
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO commands (namespace, platform, prompt, command, ts) VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, platform, prompt, command, time.time()))
+        except sqlite3.Error as e:
+            logger.warning("WARNING: Could not save prompt cache: %s", e)
+    
+    def _load(self) -> None:
+        """Open the database, drop expired entries, and read this namespace's newest ones"""
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # Connections are shared with worker threads (warm-up, executor parsing);
+            # the sqlite3 module serializes access itself
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS commands (namespace TEXT, platform TEXT, prompt TEXT, "
+                    "command TEXT, ts REAL, PRIMARY KEY (namespace, platform, prompt))")
+                self._db.execute("DELETE FROM commands WHERE ts < ?", (time.time() - self.ttl,))
+            rows = self._db.execute(
+                "SELECT platform, prompt, command FROM commands WHERE namespace = ? ORDER BY ts DESC LIMIT ?",
+                (self.namespace, self.maxsize)).fetchall()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("WARNING: Ignoring unreadable prompt cache: %s", e)
+            self.close()
+            return
+        # Oldest first, so the LRU order matches the order they were saved in
+        for platform, prompt, command in reversed(rows):
+            self._exact[(platform, prompt)] = command
+        
+        if _get_embedder() is None or not self._exact:
+            return
+        keys = list(self._exact)
+        embeddings = _get_embedder().encode([prompt for _, prompt in keys], normalize_embeddings=True)
+        for (platform, prompt), embedding in zip(keys, embeddings):
+            self._semantic.setdefault(platform, []).append((prompt, self._exact[(platform, prompt)]))
+            self._vectors.setdefault(platform, []).append(embedding)
+    
+    def _get_similar(self, platform: str, normalized: str) -> Optional[str]:
+        """Return the command of the most similar cached prompt above the threshold"""
+        vectors = self._vectors.get(platform)
+        if not vectors:
+            return None
+        embedding = _embed(normalized)
+        if embedding is None:
+            return None
+        
+        matrix = self._matrix.get(platform)
+        if matrix is None:
+            matrix = self._matrix[platform] = np.vstack(vectors)
+        scores = matrix @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        
+        cached_prompt, command = self._semantic[platform][best]
+        return command if self.same_arguments(cached_prompt, command, normalized) else None
+    
+    @staticmethod
+    def same_arguments(cached_prompt: str, command: str, prompt: str) -> bool:
+        """
+        Check that a cached command can answer a paraphrase of its prompt
+        
+        Paraphrases may differ only in the object they name ("folder a" vs "folder b")
+        or in a value the LLM rewrote ("100mb" became "+100M"), so a command is never
+        reused for arguments the user didn't say.
+        
+        Args:
+            cached_prompt (str): Normalized prompt the command was generated for
+            command (str): The cached command
+            prompt (str): Normalized new prompt
+            
+        Returns:
+            bool: True if the command's arguments fit the new prompt
+        """
+        carried = set(command.lower().split()) & set(cached_prompt.split())
+        if not carried <= set(prompt.split()):
+            return False
+        return _argument_tokens(cached_prompt) == _argument_tokens(prompt)
+
+
+# Command mappings for each platform, used when the LLM is not available. Built once at
+# import and shared read-only; macOS only differs from Linux in how memory is reported
+_WINDOWS_COMMANDS: Mapping[str, str] = MappingProxyType({
+    'list_files': 'dir',
+    'list_python_files': 'dir *.py',
+    'list_specific_files': 'dir *.',
+    'current_directory': 'cd',
+    'change_directory': 'cd',
+    'create_directory': 'mkdir',
+    'remove_file': 'del',
+    'copy_file': 'copy',
+    'move_file': 'move',
+    'show_processes': 'tasklist',
+    'show_specific_processes': 'tasklist /fi "imagename eq',
+    'network_info': 'ipconfig',
+    'network_connections': 'netstat -an',
+    'system_info': 'systeminfo',
+    'disk_usage': 'dir /-c',
+    'environment_vars': 'set',
+    'logged_users': 'query user',
+    'large_files': 'dir /s /o-s',
+    'recent_files': 'forfiles /m *.* /c "cmd /c echo @path @fdate"',
+    'file_count': 'dir /b | find /c /v ""',
+    'memory_usage': 'systeminfo | findstr "Available Physical Memory"'
+})
+
+_LINUX_COMMANDS: Mapping[str, str] = MappingProxyType({
+    'list_files': 'ls -la',
+    'list_python_files': 'ls -la *.py',
+    'list_specific_files': 'ls -la *.',
+    'current_directory': 'pwd',
+    'change_directory': 'cd',
+    'create_directory': 'mkdir',
+    'remove_file': 'rm',
+    'copy_file': 'cp',
+    'move_file': 'mv',
+    'show_processes': 'ps aux',
+    'show_specific_processes': 'ps aux | grep',
+    'network_info': 'ifconfig',
+    'network_connections': 'netstat -tuln',
+    'system_info': 'uname -a',
+    'disk_usage': 'df -h',
+    'environment_vars': 'env',
+    'logged_users': 'who',
+    'large_files': 'find . -size +100M -ls',
+    'recent_files': 'find . -mtime -1 -ls',
+    'file_count': 'ls -1 | wc -l',
+    'memory_usage': 'free -h'
+})
+
+_DARWIN_COMMANDS: Mapping[str, str] = MappingProxyType({
+    **_LINUX_COMMANDS,
+    'memory_usage': 'vm_stat'
+})
+
+_COMMAND_MAPPINGS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    'windows': _WINDOWS_COMMANDS,
+    'linux': _LINUX_COMMANDS,
+    'darwin': _DARWIN_COMMANDS,  # macOS
+})
+
+
+# Natural language patterns for the regex fallback and their command types, checked in order
+_PATTERNS: Dict[str, List[str]] = {
+    'list_files': [
+        r'list.*files?.*current.*director',
+        r'show.*files?.*current.*director',
+        r'list.*files?.*here',
+        r'show.*files?.*here',
+        r'list.*director.*content',
+        r'what.*files?.*here',
+        r'dir',
+        r'ls',
+        r'show.*all.*files?',
+        r'display.*files?',
+        r'files?.*in.*this',
+        r'contents?.*of.*this',
+        r'what.*is.*in.*this'
+    ],
+    'list_python_files': [
+        r'python.*files?',
+        r'\.py.*files?',
+        r'show.*python',
+        r'list.*python',
+        r'find.*python.*files?',
+        r'all.*\.py'
+    ],
+    'list_specific_files': [
+        r'show.*(\w+).*files?',
+        r'list.*(\w+).*files?',
+        r'find.*(\w+).*files?',
+        r'all.*\.(\w+).*files?'
+    ],
+    'current_directory': [
+        r'show.*current.*director',
+        r'what.*current.*director',
+        r'where.*am.*i',
+        r'current.*path',
+        r'working.*director',
+        r'pwd',
+        r'current.*location',
+        r'what.*director.*am.*i',
+        r'my.*location',
+        r'present.*working'
+    ],
+    'change_directory': [
+        r'change.*director.*to\s+(\S+)',
+        r'go.*to.*director.*(\S+)',
+        r'cd\s+(\S+)',
+        r'navigate.*to\s+(\S+)',
+        r'move.*to.*director.*(\S+)',
+        r'switch.*to.*(\S+)'
+    ],
+    'create_directory': [
+        r'create.*director.*(\S+)',
+        r'make.*director.*(\S+)',
+        r'mkdir\s+(\S+)',
+        r'new.*folder.*(\S+)',
+        r'create.*folder.*(\S+)',
+        r'make.*folder.*(\S+)',
+        r'add.*director.*(\S+)'
+    ],
+    'show_processes': [
+        r'show.*process',
+        r'list.*process',
+        r'running.*process',
+        r'task.*list',
+        r'ps',
+        r'what.*process.*running',
+        r'active.*process',
+        r'current.*process',
+        r'process.*list',
+        r'tasks?.*running'
+    ],
+    'show_specific_processes': [
+        r'process.*contain.*(\w+)',
+        r'find.*process.*(\w+)',
+        r'(\w+).*process',
+        r'running.*(\w+)',
+        r'tasks?.*with.*(\w+)'
+    ],
+    'network_info': [
+        r'show.*network.*info',
+        r'network.*config',
+        r'ip.*config',
+        r'network.*settings',
+        r'network.*details',
+        r'my.*ip',
+        r'network.*address',
+        r'connection.*info'
+    ],
+    'network_connections': [
+        r'network.*connection',
+        r'active.*connection',
+        r'open.*connection',
+        r'established.*connection',
+        r'netstat',
+        r'who.*connected'
+    ],
+    'system_info': [
+        r'system.*info',
+        r'show.*system.*info',
+        r'computer.*info',
+        r'machine.*info',
+        r'system.*details',
+        r'hardware.*info',
+        r'system.*specification'
+    ],
+    'disk_usage': [
+        r'disk.*usage',
+        r'disk.*space',
+        r'storage.*info',
+        r'free.*space',
+        r'available.*space',
+        r'how.*much.*space',
+        r'disk.*size',
+        r'storage.*usage'
+    ],
+    'environment_vars': [
+        r'environment.*variable',
+        r'env.*var',
+        r'system.*variable',
+        r'path.*variable',
+        r'show.*env'
+    ],
+    'logged_users': [
+        r'who.*logged.*in',
+        r'current.*user',
+        r'logged.*user',
+        r'active.*user',
+        r'who.*online'
+    ],
+    'large_files': [
+        r'large.*files?',
+        r'big.*files?',
+        r'huge.*files?',
+        r'files?.*large',
+        r'biggest.*files?'
+    ],
+    'recent_files': [
+        r'recent.*files?',
+        r'modified.*files?',
+        r'new.*files?',
+        r'latest.*files?',
+        r'files?.*modified',
+        r'changed.*files?'
+    ],
+    'file_count': [
+        r'how.*many.*files?',
+        r'count.*files?',
+        r'number.*of.*files?',
+        r'files?.*count'
+    ],
+    'memory_usage': [
+        r'memory.*usage',
+        r'ram.*usage',
+        r'memory.*info',
+        r'free.*memory',
+        r'available.*memory'
+    ]
+}
+
+# Patterns for more complex queries, tried when no command type matches, and the
+# handler that builds each command from the match
+_ADVANCED_PATTERNS = {
+    # File-related patterns
+    r'find.*files?.*larger.*than.*(\d+)': lambda self, m: self._get_large_files_command(m.group(1)),
+    r'show.*files?.*modified.*today': lambda self, m: self._get_recent_files_command('today'),
+    r'files?.*modified.*last.*(\d+).*days?': lambda self, m: self._get_recent_files_command(m.group(1)),
+    r'count.*files?.*in.*current': lambda self, m: self._get_file_count_command(),
+    r'size.*of.*all.*files?': lambda self, m: self._get_total_size_command(),
+
+    # Process-related patterns
+    r'kill.*process.*(\w+)': lambda self, m: self._get_kill_process_command(m.group(1)),
+    r'memory.*used.*by.*(\w+)': lambda self, m: self._get_process_memory_command(m.group(1)),
+
+    # System patterns
+    r'free.*space.*on.*(\w+)': lambda self, m: self._get_disk_space_command(m.group(1)),
+    r'temperature|thermal': lambda self, m: self._get_temperature_command(),
+    r'uptime|how.*long.*running': lambda self, m: self._get_uptime_command(),
+}
+
+# Compiled once at import and shared by every instance
+_COMPILED_PATTERNS: List[Tuple[str, List["re.Pattern[str]"]]] = [
+    (command_type, [re.compile(pattern) for pattern in pattern_list])
+    for command_type, pattern_list in _PATTERNS.items()
+]
+_COMPILED_ADVANCED_PATTERNS = [
+    (re.compile(pattern), handler) for pattern, handler in _ADVANCED_PATTERNS.items()
+]
+
+
+def _build_union(patterns: List[str]) -> "re.Pattern[str]":
+    """
+    Fuse patterns into one regex that finds the first pattern, in list order, that
+    matches anywhere in the input
+    
+    Each pattern becomes the named group p<index> behind a lazy prefix, and the union
+    is anchored at the start, so the alternatives are tried strictly in order and each
+    one matches exactly where re.search would have found it. The winner is
+    ``match.lastgroup``.
+    
+    Args:
+        patterns (List[str]): Regular expressions in priority order
+        
+    Returns:
+        re.Pattern: The compiled union
+    """
+    return re.compile('^(?:' + '|'.join(f'(?s:.*?)(?P<p{index}>{pattern})' for index, pattern in enumerate(patterns)) + ')')
+
+
+# Every (command type, pattern) of the fallback table in priority order, fused into one
+# union; a hit's argument is the first group inside the winning alternative
+_PATTERN_ENTRIES = [
+    (command_type, compiled)
+    for command_type, compiled_list in _COMPILED_PATTERNS
+    for compiled in compiled_list
+]
+_PATTERN_UNION = _build_union([compiled.pattern for _, compiled in _PATTERN_ENTRIES])
+_PATTERN_DISPATCH: Dict[str, Tuple[int, Optional[int]]] = {
+    f'p{index}': (index, _PATTERN_UNION.groupindex[f'p{index}'] + 1 if compiled.groups else None)
+    for index, (_, compiled) in enumerate(_PATTERN_ENTRIES)
+}
+_ADVANCED_UNION = _build_union([compiled.pattern for compiled, _ in _COMPILED_ADVANCED_PATTERNS])
+
+
+# Commands listed as dangerous for reference; _classify_command makes the actual decision
+_DANGEROUS_COMMANDS: Tuple[str, ...] = (
+    'rm -rf /',
+    'rm -rf *',
+    'del /q /s',
+    'format',
+    'fdisk',
+    'mkfs',
+    'dd',
+    'shutdown',
+    'reboot',
+    'halt',
+    'poweroff',
+    'init 0',
+    'init 6',
+    ':(){:|:&};:',  # Fork bomb
+    'wget',  # Can be used maliciously
+    'curl',  # Can be used maliciously
+    'chmod 777',
+    'chown -R',
+    'rm -f /boot',
+    'mv /home',
+)
+
+# Absolutely forbidden commands (no confirmation allowed)
+_FORBIDDEN_PATTERNS = [
+    r'rm\s+-rf\s+/',                     # rm -rf /
+    r'format(\s|$)',                     # format disk
+    r'fdisk',                            # partitioning
+    r'dd\s+if=',                         # raw disk writes
+    r':\(\)\s*\{\s*:|:&\}\s*;\s*:',    # fork bomb
+    r'shutdown(\s|$)',
+    r'reboot(\s|$)',
+    r'poweroff(\s|$)',
+    r'init\s+[06]',
+]
+
+# Dangerous but confirmable commands (Linux + Windows)
+_CONFIRMABLE_PATTERNS = [
+    r'rm\s+-rf\s+.+',            # rm -rf <folder>
+    r'rm\s+.+',                  # rm <file>
+    r'del\s+.+',                 # del file.ext
+    r'rmdir\s+/s\s+/q\s+.+',     # WINDOWS delete folder
+    r'rmdir\s+.+',               # any rmdir is dangerous
+    r'mv\s+.+',                  # move operations
+    r'chmod\s+7[0-7][0-7]',      # chmod 7xx
+    r'chown\s+-r\s+.+',
+]
+
+# Each list only needs an "any pattern matches" answer, so one alternation scans the command once
+_FORBIDDEN_RE = re.compile("|".join(f"(?:{pattern})" for pattern in _FORBIDDEN_PATTERNS))
+_CONFIRMABLE_RE = re.compile("|".join(f"(?:{pattern})" for pattern in _CONFIRMABLE_PATTERNS))
+
+# Literals of which every match of a safety list contains at least one, so a command
+# without any of them can skip that list's regex
+_SAFETY_ANCHORS: Dict[str, Tuple[str, ...]] = {
+    'forbidden': ('rm', 'format', 'fdisk', 'dd', ':()', ':&}', 'shutdown', 'reboot', 'poweroff', 'init'),
+    'confirm': ('rm', 'del', 'mv', 'chmod', 'chown'),
+}
+
+
+def _build_safety_automaton() -> Optional["ahocorasick.Automaton"]:
+    """
+    Build one automaton over every safety anchor, each mapped to the lists it guards
+    
+    Returns:
+        Optional[ahocorasick.Automaton]: The automaton, or None if pyahocorasick is missing
+    """
+    if ahocorasick is None:
+        return None
+    lists_by_anchor: Dict[str, Tuple[str, ...]] = {}
+    for list_name, anchors in _SAFETY_ANCHORS.items():
+        for anchor in anchors:
+            lists_by_anchor[anchor] = lists_by_anchor.get(anchor, ()) + (list_name,)
+    automaton = ahocorasick.Automaton()
+    for anchor, list_names in lists_by_anchor.items():
+        automaton.add_word(anchor, list_names)
+    automaton.make_automaton()
+    return automaton
+
+
+_SAFETY_AUTOMATON = _build_safety_automaton()
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_command(command_lower: str) -> Union[bool, str]:
+    """
+    Classify a normalized command; cached since the same commands recur
+    
+    Args:
+        command_lower (str): Lowercased, stripped command
+        
+    Returns:
+        Union[bool, str]: True, "confirm" or False as for AiNuxLLM.is_command_safe
+    """
+    # One linear pass finds which lists can match at all
+    if _SAFETY_AUTOMATON is not None:
+        candidates = set()
+        for _, list_names in _SAFETY_AUTOMATON.iter(command_lower):
+            candidates.update(list_names)
+    else:
+        candidates = _SAFETY_ANCHORS.keys()
+
+    # Absolutely forbidden commands (no confirmation allowed)
+    if 'forbidden' in candidates and _FORBIDDEN_RE.search(command_lower):
+        return False
+
+    # Dangerous but confirmable commands
+    if 'confirm' in candidates and _CONFIRMABLE_RE.search(command_lower):
+        return "confirm"
+
+    # Everything else is safe
+    return True
+
+
+# Phrases that refer back to a remembered folder, file or location
+_FOLDER_REFERENCES = ("this folder", "that folder", "the folder", "that directory", "this directory")
+_FILE_REFERENCES = ("this file", "that file", "the file", "that document")
+_PATH_REFERENCES = ("there", "go there", "that location", "that path", "go to that")
+_REFERENCE_WORD = re.compile(r"\b(this|that|it)\b")
+
+# What a follow-up request asks to do with the entity it refers to
+_DELETE_REFERENCE = re.compile(r"\b(delete|remove|erase|delete this|remove this|delete that|remove that)\b")
+_GO_REFERENCE = re.compile(r"\b(go there|cd there|change to that|go to that|open that folder)\b")
+_SHOW_REFERENCE = re.compile(r"\b(open|show|cat|type)\b.*(file|document|that)\b")
+_REPEAT_REFERENCE = re.compile(r"\b(repeat that|do that again|again|run that)\b")
+
+# Executed commands that create or point at something worth remembering
+_MKDIR_COMMAND = re.compile(r'^(?:sudo\s+)?mkdir\s+(-p\s+)?(.+)$')
+_TOUCH_COMMAND = re.compile(r'^(?:sudo\s+)?touch\s+(.+)$')
+_CD_COMMAND = re.compile(r'^(?:cd)\s+(.+)$')
+_MV_COMMAND = re.compile(r'^(?:mv)\s+(.+)\s+(.+)$')
+_CP_COMMAND = re.compile(r'^(?:cp)\s+(.+)\s+(.+)$')
+_WINDOWS_MKDIR_COMMAND = re.compile(r'^(?:mkdir)\s+(.+)$', re.IGNORECASE)
+
+
+class Platform(IntEnum):
+    """Operating system families with their own command syntax"""
+    WINDOWS = 0
+    LINUX = 1
+    DARWIN = 2
+
+
+# Operating system name, probed once at import
+_PLATFORM_NAME = platform.system()
+_PLATFORM = _PLATFORM_NAME.lower()
+
+# Lowercased platform.system() names; anything else is treated as Linux
+_PLATFORM_IDS: Dict[str, Platform] = {
+    'windows': Platform.WINDOWS,
+    'linux': Platform.LINUX,
+    'darwin': Platform.DARWIN,
+}
+
+# Templates for commands built from a match or a remembered entity, filled in with str.format
+_POSIX_TEMPLATES: Dict[str, str] = {
+    'list_specific_files': 'ls -la *.{extension}',
+    'show_specific_processes': 'ps aux | grep {process_name}',
+    'delete_folder': 'rm -rf {path}',
+    'delete_file': 'rm {path}',
+    'show_file': 'cat {path}',
+    'large_files': 'find . -size +{size_mb}M -ls',
+    'files_modified_today': 'find . -newermt "$(date +%Y-%m-%d)" -ls',
+    'files_modified_days': 'find . -mtime -{days} -ls',
+    'file_count': 'ls -1 | wc -l',
+    'total_size': 'du -sh .',
+    'find_process': 'ps aux | grep {process_name}',
+    'process_memory': 'ps aux | grep {process_name} | awk \'{{print $4" "$11}}\'',
+    'disk_space': 'df -h /{drive} 2>/dev/null || df -h',
+    'temperature': 'sensors 2>/dev/null || cat /sys/class/thermal/thermal_zone*/temp 2>/dev/null || echo "Temperature sensors not available"',
+    'uptime': 'uptime',
+}
+
+_COMMAND_TEMPLATES: Dict[Platform, Dict[str, str]] = {
+    Platform.WINDOWS: {
+        'list_specific_files': 'dir *.{extension}',
+        'show_specific_processes': 'tasklist /fi "imagename eq {process_name}*"',
+        'delete_folder': 'rmdir /s /q {path}',
+        'delete_file': 'del {path}',
+        'show_file': 'type {path}',
+        'large_files': 'forfiles /s /c "cmd /c if @fsize geq {size_bytes} echo @path @fsize"',
+        'files_modified_today': 'forfiles /m *.* /c "cmd /c echo @path @fdate @ftime"',
+        'files_modified_days': 'forfiles /m *.* /d -{days} /c "cmd /c echo @path @fdate"',
+        'file_count': 'dir /b | find /c /v ""',
+        'total_size': 'dir /s',
+        'find_process': 'tasklist /fi "imagename eq {process_name}*"',
+        'process_memory': 'tasklist /fi "imagename eq {process_name}*" /fo table',
+        'disk_space': 'dir {drive}:\\ /-c',
+        'temperature': 'wmic /namespace:\\\\root\\wmi PATH MSAcpi_ThermalZoneTemperature get CurrentTemperature',
+        'uptime': 'systeminfo | findstr "System Boot Time"',
+    },
+    Platform.LINUX: _POSIX_TEMPLATES,
+    Platform.DARWIN: _POSIX_TEMPLATES,
+}
+
+# Separator used around command results
+_RESULT_BAR = "=" * 50
+
+# Result blocks with the static text and separators filled in once at import;
+# display_result only formats the command, output and error into them
+_RESULT_HEADER = f"\n{_RESULT_BAR}\nEXECUTED COMMAND: {{command}}\n{_RESULT_BAR}\n"
+_RESULT_FOOTER = f"{_RESULT_BAR}\n"
+_SUCCESS_TEMPLATE = _RESULT_HEADER + "Status: SUCCESS\nOutput:\n{output}\n" + _RESULT_FOOTER
+_SUCCESS_SHOWN_TEMPLATE = _RESULT_HEADER + "Status: SUCCESS\n" + _RESULT_FOOTER
+_SUCCESS_EMPTY_TEMPLATE = _RESULT_HEADER + "Status: SUCCESS\nOutput: (no output)\n" + _RESULT_FOOTER
+_FAILURE_TEMPLATE = _RESULT_HEADER + "Status: FAILED\nError: {error}\n" + _RESULT_FOOTER
+_FAILURE_BARE_TEMPLATE = _RESULT_HEADER + "Status: FAILED\n" + _RESULT_FOOTER
+
+# Help screen, assembled once so show_help only fills in the mode
+_HELP_TEMPLATE = "\n".join([
+    "",
+    "=" * 70,
+    "AiNux LLM Enhanced Help - Natural Language Command Examples",
+    "=" * 70,
+    "Current Mode: {mode}",
+    "",
+    "Enhanced Commands (LLM Mode):",
+    "  • 'Show me all Python files in this directory'",
+    "  • 'Find running processes containing chrome or firefox'",
+    "  • 'Create a backup folder called backup_2025'",
+    "  • 'What files were modified in the last hour?'",
+    "  • 'Display detailed network configuration'",
+    "  • 'Show me the size of all directories here'",
+    "",
+    "File Operations:",
+    "  • 'List files here' or 'Show files in current directory'",
+    "  • 'Show current directory' or 'Where am I?'",
+    "  • 'Create directory myproject'",
+    "",
+    "System Information:",
+    "  • 'Show running processes'",
+    "  • 'Show network info'",
+    "  • 'Show system info'",
+    "  • 'Show disk usage'",
+    "",
+    "Navigation:",
+    "  • 'Change directory to Documents'",
+    "  • 'Go to directory myproject'",
+    "",
+    "Other Commands:",
+    "  • 'help' or 'h' or '?' - Show this help",
+    "  • 'mode' or 'info' - Show current parsing mode",
+    "  • 'exit' or 'quit' or 'q' - Exit AiNux",
+    "",
+    "Security:",
+    "  • All commands are checked for safety before execution",
+    "  • Dangerous commands are automatically blocked",
+    "  • Commands timeout after 30 seconds",
+    "=" * 70,
+    "",
+]) + "\n"
+
+# Mode screens for each parsing mode; show_mode_info fills in the settings
+_MODE_HEADER = "\n📊 AiNux Mode Information\n" + "-" * 30 + "\n"
+_MODE_FOOTER = "Platform: {platform}\nSecurity: Active (dangerous commands blocked)\n" + "-" * 30 + "\n\n"
+_MODE_LLM_TEMPLATE = (
+    _MODE_HEADER
+    + "Mode: LLM Enhanced\nModel: {model}\nAPI: Google Gemini\n Temperature: {temperature}\n"
+    + "Capabilities: Advanced natural language understanding\n"
+    + _MODE_FOOTER
+)
+_MODE_REGEX_TEMPLATE = (
+    _MODE_HEADER
+    + "Mode: Regex Fallback\nParser: Pattern matching\n"
+    + "Note: Add GEMINI_API_KEY to .env file for enhanced LLM mode\n"
+    + _MODE_FOOTER
+)
 
 
 class AiNuxLLM:
@@ -251,16 +1904,62 @@ class AiNuxLLM:
     for superior natural language understanding and command generation.
     """
     
+    # Instances handed out by get_shared, keyed by their settings
+    _shared: Dict[Tuple, "AiNuxLLM"] = {}
+    
+    @classmethod
+    def get_shared(cls, use_llm: bool = True, gemini_config: Optional[GeminiConfig] = None) -> "AiNuxLLM":
+        """
+        Return the instance shared by every caller with the same settings, creating it
+        on first use, so scripts run together reuse its caches and connections
+        
+        Args:
+            use_llm (bool): Whether to use the LLM
+            gemini_config (Optional[GeminiConfig]): Gemini settings (defaults if None)
+            
+        Returns:
+            AiNuxLLM: The shared instance
+        """
+        gemini_config = gemini_config or GeminiConfig()
+        key = (use_llm, astuple(gemini_config))
+        instance = cls._shared.get(key)
+        if instance is None:
+            instance = cls._shared[key] = cls(use_llm=use_llm, gemini_config=gemini_config)
+        return instance
+    
     def __init__(self, use_llm: bool = True, gemini_config: Optional[GeminiConfig] = None):
         """Initialize AiNux with LLM capabilities"""
-        self.platform = platform.system().lower()
-        self.dangerous_commands = self._load_dangerous_commands()
+        self.platform = _PLATFORM
+        self._platform_id = _PLATFORM_IDS.get(self.platform, Platform.LINUX)
+        self._templates = _COMMAND_TEMPLATES[self._platform_id]
+        self.dangerous_commands = _DANGEROUS_COMMANDS
         self.command_mappings = self._load_command_mappings()
+        # Commands for this platform; unknown Unix-likes get the Linux commands
+        self._cmd_table = self.command_mappings.get(self.platform, self.command_mappings['linux'])
+        self._cached_regex_parse = functools.lru_cache(maxsize=512)(self._match_patterns)
         
         # LLM Configuration
         self.use_llm = use_llm
         self.gemini_config = gemini_config or GeminiConfig()
         self.llm = GeminiLLM(self.gemini_config) if use_llm else None
+        # Client for the async path, batching concurrent requests if configured
+        self._async_llm: Optional[Union[GeminiLLM, BatchingGeminiLLM]] = (
+            BatchingGeminiLLM(self.llm) if self.llm and self.gemini_config.batch_requests else self.llm
+        )
+        self.prompt_cache: Optional[PromptCache] = None
+        
+        # Programs synthesized from clusters of similar LLM requests, and the
+        # LLM-resolved (prompt, command) pairs not yet covered by one
+        self._program_cache: List[CachedProgram] = []
+        self._llm_history: List[Tuple[str, str]] = []
+        # Synthesis tasks started from the async path, referenced until they finish
+        self._synthesis_tasks: set = set()
+        
+        # Long-lived shell for safe commands, so they skip a fork and exec of sh
+        self._shell = ShellSession.create(max_lines=OUTPUT_MAX_LINES)
+        
+        # Microphone capture for voice mode, set up by run_interactive_mode
+        self._listen: Optional[Callable[[], Optional[str]]] = None
         
         # in-session memory (non-persistent)
         self.memory: Dict[str, Union[str, Dict[str, Dict[str, str]]]] = {
@@ -274,122 +1973,49 @@ class AiNuxLLM:
         # Display initialization info
         if self.use_llm:
             if self.llm and self.llm.available:
-                print(f"LLM Mode: Enabled (Model: {self.gemini_config.model})")
+                logger.info("LLM Mode: Enabled (Model: %s)", self.gemini_config.model)
+                self._open_prompt_cache()
             else:
-                print("WARNING: LLM Mode: Requested but Gemini unavailable, using regex fallback")
+                logger.warning("WARNING: LLM Mode: Requested but Gemini unavailable, using regex fallback")
                 self.use_llm = False
         else:
-            print("LLM Mode: Disabled, using regex patterns")
+            logger.info("LLM Mode: Disabled, using regex patterns")
+        
+        # Whether requests go to the LLM, decided once instead of on every request
+        self._llm_active = bool(self.use_llm and self.llm and self.llm.available)
     
-    def _load_dangerous_commands(self) -> List[str]:
+    def refresh_llm_state(self) -> bool:
         """
-        Load a comprehensive list of dangerous commands that should not be executed.
+        Recheck whether requests can go to the LLM, e.g. after the network comes back
         
         Returns:
-            List[str]: List of dangerous command patterns
-        """
-        return [
-            'rm -rf /',
-            'rm -rf *',
-            'del /q /s',
-            'format',
-            'fdisk',
-            'mkfs',
-            'dd',
-            'shutdown',
-            'reboot',
-            'halt',
-            'poweroff',
-            'init 0',
-            'init 6',
-            ':(){:|:&};:',  # Fork bomb
-            'wget',  # Can be used maliciously
-            'curl',  # Can be used maliciously
-            'chmod 777',
-            'chown -R',
-            'rm -f /boot',
-            'mv /home',
-        ]
+            bool: True if LLM mode is now active
+        """
+        if self.llm and not self.llm.available:
+            self.llm.available = self.llm._check_availability()
+            if self.llm.available:
+                logger.info("LLM Mode: Enabled (Model: %s)", self.gemini_config.model)
+                self.use_llm = True
+                self._open_prompt_cache()
+        self._llm_active = bool(self.use_llm and self.llm and self.llm.available)
+        return self._llm_active
     
-    def _load_command_mappings(self) -> Dict[str, Dict[str, str]]:
+    def _open_prompt_cache(self) -> None:
+        """Open the prompt cache for the configured model, once"""
+        if self.prompt_cache is None:
+            self.prompt_cache = PromptCache(
+                namespace=f"{self.gemini_config.model}|{self.gemini_config.temperature}")
+            atexit.register(self.prompt_cache.close)
+    
+    def _load_command_mappings(self) -> Mapping[str, Mapping[str, str]]:
         """
         Load command mappings for different platforms.
         This serves as fallback when LLM is not available.
         
         Returns:
-            Dict: Command mappings organized by platform
+            Mapping: Command mappings organized by platform (shared, read-only)
         """
-        return {
-            'windows': {
-                'list_files': 'dir',
-                'list_python_files': 'dir *.py',
-                'list_specific_files': 'dir *.',
-                'current_directory': 'cd',
-                'change_directory': 'cd',
-                'create_directory': 'mkdir',
-                'remove_file': 'del',
-                'copy_file': 'copy',
-                'move_file': 'move',
-                'show_processes': 'tasklist',
-                'show_specific_processes': 'tasklist /fi "imagename eq',
-                'network_info': 'ipconfig',
-                'network_connections': 'netstat -an',
-                'system_info': 'systeminfo',
-                'disk_usage': 'dir /-c',
-                'environment_vars': 'set',
-                'logged_users': 'query user',
-                'large_files': 'dir /s /o-s',
-                'recent_files': 'forfiles /m *.* /c "cmd /c echo @path @fdate"',
-                'file_count': 'dir /b | find /c /v ""',
-                'memory_usage': 'systeminfo | findstr "Available Physical Memory"'
-            },
-            'linux': {
-                'list_files': 'ls -la',
-                'list_python_files': 'ls -la *.py',
-                'list_specific_files': 'ls -la *.',
-                'current_directory': 'pwd',
-                'change_directory': 'cd',
-                'create_directory': 'mkdir',
-                'remove_file': 'rm',
-                'copy_file': 'cp',
-                'move_file': 'mv',
-                'show_processes': 'ps aux',
-                'show_specific_processes': 'ps aux | grep',
-                'network_info': 'ifconfig',
-                'network_connections': 'netstat -tuln',
-                'system_info': 'uname -a',
-                'disk_usage': 'df -h',
-                'environment_vars': 'env',
-                'logged_users': 'who',
-                'large_files': 'find . -size +100M -ls',
-                'recent_files': 'find . -mtime -1 -ls',
-                'file_count': 'ls -1 | wc -l',
-                'memory_usage': 'free -h'
-            },
-            'darwin': {  # macOS
-                'list_files': 'ls -la',
-                'list_python_files': 'ls -la *.py',
-                'list_specific_files': 'ls -la *.',
-                'current_directory': 'pwd',
-                'change_directory': 'cd',
-                'create_directory': 'mkdir',
-                'remove_file': 'rm',
-                'copy_file': 'cp',
-                'move_file': 'mv',
-                'show_processes': 'ps aux',
-                'show_specific_processes': 'ps aux | grep',
-                'network_info': 'ifconfig',
-                'network_connections': 'netstat -tuln',
-                'system_info': 'uname -a',
-                'disk_usage': 'df -h',
-                'environment_vars': 'env',
-                'logged_users': 'who',
-                'large_files': 'find . -size +100M -ls',
-                'recent_files': 'find . -mtime -1 -ls',
-                'file_count': 'ls -1 | wc -l',
-                'memory_usage': 'vm_stat'
-            }
-        }
+        return _COMMAND_MAPPINGS
     
     # ---------------------------
     # Memory helpers
@@ -422,20 +2048,20 @@ class AiNuxLLM:
         """
         lower = user_text.lower()
         # direct references
-        if any(tok in lower for tok in ["this folder", "that folder", "the folder", "that directory", "this directory"]):
+        if any(tok in lower for tok in _FOLDER_REFERENCES):
             name = self.memory.get("last_folder")
             if name:
                 return self.memory["entities"].get(f"folder:{name}")
-        if any(tok in lower for tok in ["this file", "that file", "the file", "that document"]):
+        if any(tok in lower for tok in _FILE_REFERENCES):
             name = self.memory.get("last_file")
             if name:
                 return self.memory["entities"].get(f"file:{name}")
-        if any(tok in lower for tok in ["there", "go there", "that location", "that path", "go to that"]):
+        if any(tok in lower for tok in _PATH_REFERENCES):
             path = self.memory.get("last_path")
             if path:
                 return {"type": "path", "name": path, "path": path}
         # generic 'that' or 'this' - try most recent useful entity
-        if re.search(r"\b(this|that|it)\b", lower):
+        if _REFERENCE_WORD.search(lower):
             # priority: last_folder, last_file, last_path
             for key in ("last_folder", "last_file", "last_path"):
                 val = self.memory.get(key)
@@ -454,15 +2080,9 @@ class AiNuxLLM:
         name = entity.get("name")
         path = entity.get("path", name)
         if typ == "folder":
-            if self.platform == "windows":
-                return f"rmdir /s /q {path}"
-            else:
-                return f"rm -rf {path}"
+            return self._templates['delete_folder'].format(path=path)
         if typ == "file":
-            if self.platform == "windows":
-                return f"del {path}"
-            else:
-                return f"rm {path}"
+            return self._templates['delete_file'].format(path=path)
         return None
 
     # ---------------------------
@@ -478,58 +2098,252 @@ class AiNuxLLM:
         Returns:
             Optional[str]: System command or None if not recognized
         """
+        command = self._parse_before_llm(user_input)
+        if command:
+            return command
+        
+        if self._llm_active:
+            logger.info("Trying LLM processing...")
+            command = self._accept_llm_command(user_input, self.llm.generate_command(user_input, self.platform))
+            if command:
+                return command
+        
+        return self._parse_after_llm(user_input)
+    
+    async def parse_natural_language_async(self, user_input: str) -> Optional[str]:
+        """
+        Async version of parse_natural_language. The LLM is called over the pooled HTTP
+        client, so many inputs can be parsed concurrently with asyncio.gather.
+        
+        Args:
+            user_input (str): Natural language input from user
+            
+        Returns:
+            Optional[str]: System command or None if not recognized
+        """
+        command = self._parse_before_llm(user_input)
+        if command:
+            return command
+        
+        if self._llm_active:
+            logger.info("Trying LLM processing...")
+            command = self._accept_llm_command(
+                user_input, await self._async_llm.generate_command_async(user_input, self.platform))
+            if command:
+                return command
+        
+        return self._parse_after_llm(user_input)
+    
+    def _parse_before_llm(self, user_input: str) -> Optional[str]:
+        """
+        Resolve an input without calling the LLM: follow-up references, plainly named
+        fixed commands, and (in LLM mode) cached LLM answers and programs
+        
+        Args:
+            user_input (str): Natural language input from user
+            
+        Returns:
+            Optional[str]: System command, or None if the LLM or regex fallback must decide
+        """
         # quick memory-based resolutions for pronouns / references
-        resolved = None
         try:
             resolved_entity = self._resolve_pronoun_target(user_input)
             lower = user_input.lower()
             if resolved_entity:
                 # delete / remove this/that
-                if re.search(r"\b(delete|remove|erase|delete this|remove this|delete that|remove that)\b", lower):
+                if _DELETE_REFERENCE.search(lower):
                     cmd = self._build_delete_command_for_entity(resolved_entity)
                     if cmd:
                         return cmd
                 # go there / cd there
-                if re.search(r"\b(go there|cd there|change to that|go to that|open that folder)\b", lower):
+                if _GO_REFERENCE.search(lower):
                     path = resolved_entity.get("path") or resolved_entity.get("name")
                     return f"cd {path}"
                 # open file -> show or cat
-                if re.search(r"\b(open|show|cat|type)\b.*(file|document|that)\b", lower):
+                if _SHOW_REFERENCE.search(lower):
                     path = resolved_entity.get("path") or resolved_entity.get("name")
                     # prefer platform-appropriate open: use cat for linux, type for windows
-                    if self.platform == "windows":
-                        return f"type {path}"
-                    else:
-                        return f"cat {path}"
+                    return self._templates['show_file'].format(path=path)
                 # repeat / do that again
-                if re.search(r"\b(repeat that|do that again|again|run that)\b", lower):
+                if _REPEAT_REFERENCE.search(lower):
                     last = self.memory.get("last_command")
                     return last
         except Exception:
             # If memory resolution fails, continue to LLM/regex fallback
             pass
 
-        # First try LLM if available
-        if self.use_llm and self.llm and self.llm.available:
-            print(f"Trying LLM processing...")
-            command = self.llm.generate_command(user_input, self.platform)
-            if command and self.is_command_safe(command):
-                print(f"SUCCESS: LLM generated safe command: {command}")
+        if ALWAYS_LLM and self._llm_active:
+            return None
+
+        # Canonical phrasings of the fixed commands resolve by dictionary lookup
+        canonical = PromptCache.normalize(user_input).rstrip(_CANONICAL_PUNCTUATION).rstrip()
+        command = self._cmd_table.get(_CANONICAL_PHRASES.get(canonical))
+        if command:
+            logger.info("SUCCESS: Canonical request: %s", command)
+            return command
+
+        # Requests that plainly name one of the fixed commands need neither LLM nor regex
+        command = self._classify_intent(user_input)
+        if command:
+            logger.info("SUCCESS: Intent classifier matched: %s", command)
+            return command
+
+        if self._llm_active:
+            if self.prompt_cache:
+                command = self.prompt_cache.get(self.platform, user_input)
+                if command is not None:
+                    logger.info("INFO: Returning cached response.")
+                    return command
+            
+            command = self._run_cached_programs(user_input)
+            if command:
+                logger.info("SUCCESS: Cached program generated command: %s", command)
                 return command
-            elif command:
-                print(f"BLOCKED: LLM generated unsafe command: {command}")
-            else:
-                print(f"FAILED: LLM could not process: '{user_input}'")
+        return None
+    
+    def _accept_llm_command(self, user_input: str, command: Optional[str]) -> Optional[str]:
+        """
+        Check a command the LLM generated and remember it if it is safe
+        
+        Args:
+            user_input (str): Natural language input the command was generated for
+            command (Optional[str]): LLM output, None if the request failed
+            
+        Returns:
+            Optional[str]: The command if it is safe, otherwise None
+        """
+        if command and self.is_command_safe(command):
+            logger.info("SUCCESS: LLM generated safe command: %s", command)
+            if self.prompt_cache:
+                self.prompt_cache.put(self.platform, user_input, command)
+            self._learn_program(user_input, command)
+            return command
+        elif command:
+            logger.warning("BLOCKED: LLM generated unsafe command: %s", command)
+        else:
+            logger.warning("FAILED: LLM could not process: '%s'", user_input)
+        return None
+    
+    def _parse_after_llm(self, user_input: str) -> Optional[str]:
+        """
+        Parse an input with the regex fallback
         
-        # Fallback to regex-based parsing
-        print(f"Falling back to enhanced regex parsing...")
+        Args:
+            user_input (str): Natural language input from user
+            
+        Returns:
+            Optional[str]: System command or None if no pattern matched
+        """
+        logger.info("Falling back to enhanced regex parsing...")
         result = self._parse_with_regex(user_input)
         if result:
-            print(f"SUCCESS: Regex found match: {result}")
+            logger.info("SUCCESS: Regex found match: %s", result)
         else:
-            print(f"FAILED: No regex pattern matched")
+            logger.info("FAILED: No regex pattern matched")
         return result
 
+    def _classify_intent(self, user_input: str) -> Optional[str]:
+        """
+        Match input to a fixed command by embedding similarity with canonical phrases
+        
+        Args:
+            user_input (str): Natural language input from user
+            
+        Returns:
+            Optional[str]: Platform command for the closest intent, or None if no
+                embedding model is available, the input has words outside the intent
+                vocabulary (arguments a fixed command would drop), or nothing is
+                similar enough
+        """
+        index = _get_intent_index()
+        if index is None:
+            return None
+        normalized = PromptCache.normalize(user_input)
+        if _argument_tokens(normalized):
+            return None
+        words = normalized.replace(',', ' ').rstrip(_CANONICAL_PUNCTUATION).split()
+        if not all(word in _INTENT_VOCABULARY for word in words):
+            return None
+        matrix, labels = index
+        embedding = _embed(normalized)
+        scores = matrix @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] < INTENT_THRESHOLD:
+            return None
+        return self._cmd_table.get(labels[best])
+    
+    def _run_cached_programs(self, user_input: str) -> Optional[str]:
+        """
+        Resolve input with a synthesized program instead of an LLM call
+        
+        Args:
+            user_input (str): Natural language input from user
+            
+        Returns:
+            Optional[str]: Safe command from the first matching program, or None
+        """
+        normalized = PromptCache.normalize(user_input)
+        for program in self._program_cache:
+            if program.platform != self.platform:
+                continue
+            command = program.apply(normalized)
+            if command and self.is_command_safe(command):
+                return command
+        return None
+    
+    def _learn_program(self, user_input: str, command: str) -> None:
+        """
+        Record an LLM-resolved request and synthesize a program once enough
+        requests of the same shape have accumulated
+        
+        Args:
+            user_input (str): Natural language input from user
+            command (str): Command the LLM generated for it
+        """
+        normalized = PromptCache.normalize(user_input)
+        tokens = set(normalized.split())
+        if not tokens:
+            return
+        self._llm_history.append((normalized, command))
+        del self._llm_history[:-PROGRAM_HISTORY_SIZE]
+        
+        cluster = [
+            entry for entry in self._llm_history
+            if len(tokens & set(entry[0].split())) / len(tokens | set(entry[0].split())) >= PROGRAM_CLUSTER_SIMILARITY
+        ]
+        if len(cluster) < PROGRAM_CLUSTER_SIZE:
+            return
+        
+        # The cluster is consumed either way so a failed synthesis isn't retried on every request
+        self._llm_history = [entry for entry in self._llm_history if entry not in cluster]
+        
+        # Synthesis is another LLM round-trip, so it runs off the request path: in a
+        # worker thread the event loop tracks when called from async code, else a
+        # plain background thread
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            threading.Thread(
+                target=self._synthesize_program, args=(cluster, normalized), daemon=True
+            ).start()
+        else:
+            task = loop.create_task(asyncio.to_thread(self._synthesize_program, cluster, normalized))
+            self._synthesis_tasks.add(task)
+            task.add_done_callback(self._synthesis_tasks.discard)
+    
+    def _synthesize_program(self, cluster: List[Tuple[str, str]], normalized: str) -> None:
+        """
+        Ask the LLM for a program covering a cluster and cache it if one comes back
+        
+        Args:
+            cluster (List[Tuple[str, str]]): (normalized request, command) pairs of one shape
+            normalized (str): The request that completed the cluster, for logging
+        """
+        program = self.llm.synthesize_program(cluster, self.platform)
+        if program:
+            logger.info("INFO: Cached a program for requests like '%s'", normalized)
+            self._program_cache.append(program)
+    
     def _parse_with_regex(self, user_input: str) -> Optional[str]:
         """
         Fallback regex-based parsing (original AiNux functionality)
@@ -540,296 +2354,121 @@ class AiNuxLLM:
         Returns:
             Optional[str]: System command or None if not recognized
         """
-        # Convert input to lowercase for easier matching
-        input_lower = user_input.lower().strip()
-        
-        # Define comprehensive natural language patterns and their corresponding command types
-        patterns = {
-            'list_files': [
-                r'list.*files?.*current.*director',
-                r'show.*files?.*current.*director',
-                r'list.*files?.*here',
-                r'show.*files?.*here',
-                r'list.*director.*content',
-                r'what.*files?.*here',
-                r'dir',
-                r'ls',
-                r'show.*all.*files?',
-                r'display.*files?',
-                r'files?.*in.*this',
-                r'contents?.*of.*this',
-                r'what.*is.*in.*this'
-            ],
-            'list_python_files': [
-                r'python.*files?',
-                r'\.py.*files?',
-                r'show.*python',
-                r'list.*python',
-                r'find.*python.*files?',
-                r'all.*\.py'
-            ],
-            'list_specific_files': [
-                r'show.*(\w+).*files?',
-                r'list.*(\w+).*files?',
-                r'find.*(\w+).*files?',
-                r'all.*\.(\w+).*files?'
-            ],
-            'current_directory': [
-                r'show.*current.*director',
-                r'what.*current.*director',
-                r'where.*am.*i',
-                r'current.*path',
-                r'working.*director',
-                r'pwd',
-                r'current.*location',
-                r'what.*director.*am.*i',
-                r'my.*location',
-                r'present.*working'
-            ],
-            'change_directory': [
-                r'change.*director.*to\s+(\S+)',
-                r'go.*to.*director.*(\S+)',
-                r'cd\s+(\S+)',
-                r'navigate.*to\s+(\S+)',
-                r'move.*to.*director.*(\S+)',
-                r'switch.*to.*(\S+)'
-            ],
-            'create_directory': [
-                r'create.*director.*(\S+)',
-                r'make.*director.*(\S+)',
-                r'mkdir\s+(\S+)',
-                r'new.*folder.*(\S+)',
-                r'create.*folder.*(\S+)',
-                r'make.*folder.*(\S+)',
-                r'add.*director.*(\S+)'
-            ],
-            'show_processes': [
-                r'show.*process',
-                r'list.*process',
-                r'running.*process',
-                r'task.*list',
-                r'ps',
-                r'what.*process.*running',
-                r'active.*process',
-                r'current.*process',
-                r'process.*list',
-                r'tasks?.*running'
-            ],
-            'show_specific_processes': [
-                r'process.*contain.*(\w+)',
-                r'find.*process.*(\w+)',
-                r'(\w+).*process',
-                r'running.*(\w+)',
-                r'tasks?.*with.*(\w+)'
-            ],
-            'network_info': [
-                r'show.*network.*info',
-                r'network.*config',
-                r'ip.*config',
-                r'network.*settings',
-                r'network.*details',
-                r'my.*ip',
-                r'network.*address',
-                r'connection.*info'
-            ],
-            'network_connections': [
-                r'network.*connection',
-                r'active.*connection',
-                r'open.*connection',
-                r'established.*connection',
-                r'netstat',
-                r'who.*connected'
-            ],
-            'system_info': [
-                r'system.*info',
-                r'show.*system.*info',
-                r'computer.*info',
-                r'machine.*info',
-                r'system.*details',
-                r'hardware.*info',
-                r'system.*specification'
-            ],
-            'disk_usage': [
-                r'disk.*usage',
-                r'disk.*space',
-                r'storage.*info',
-                r'free.*space',
-                r'available.*space',
-                r'how.*much.*space',
-                r'disk.*size',
-                r'storage.*usage'
-            ],
-            'environment_vars': [
-                r'environment.*variable',
-                r'env.*var',
-                r'system.*variable',
-                r'path.*variable',
-                r'show.*env'
-            ],
-            'logged_users': [
-                r'who.*logged.*in',
-                r'current.*user',
-                r'logged.*user',
-                r'active.*user',
-                r'who.*online'
-            ],
-            'large_files': [
-                r'large.*files?',
-                r'big.*files?',
-                r'huge.*files?',
-                r'files?.*large',
-                r'biggest.*files?'
-            ],
-            'recent_files': [
-                r'recent.*files?',
-                r'modified.*files?',
-                r'new.*files?',
-                r'latest.*files?',
-                r'files?.*modified',
-                r'changed.*files?'
-            ],
-            'file_count': [
-                r'how.*many.*files?',
-                r'count.*files?',
-                r'number.*of.*files?',
-                r'files?.*count'
-            ],
-            'memory_usage': [
-                r'memory.*usage',
-                r'ram.*usage',
-                r'memory.*info',
-                r'free.*memory',
-                r'available.*memory'
-            ]
-        }
-        
-        # Try to match input against patterns
-        for command_type, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                match = re.search(pattern, input_lower)
-                if match:
-                    # Get the appropriate command for the current platform
-                    platform_commands = self.command_mappings.get(self.platform, {})
-                    base_command = platform_commands.get(command_type)
-                    
-                    if base_command:
-                        # Handle commands that need arguments
-                        if command_type in ['change_directory', 'create_directory'] and match.groups():
-                            return f"{base_command} {match.group(1)}"
-                        elif command_type == 'list_specific_files' and match.groups():
-                            extension = match.group(1)
-                            if self.platform == 'windows':
-                                return f"dir *.{extension}"
-                            else:
-                                return f"ls -la *.{extension}"
-                        elif command_type == 'show_specific_processes' and match.groups():
-                            process_name = match.group(1)
-                            if self.platform == 'windows':
-                                return f'tasklist /fi "imagename eq {process_name}*"'
-                            else:
-                                return f"ps aux | grep {process_name}"
-                        else:
-                            return base_command
+        # Convert input to lowercase for easier matching; with the platform it is
+        # also the cache key, so repeated phrases skip pattern matching
+        return self._cached_regex_parse(self.platform, user_input.lower().strip())
+    
+    def _match_patterns(self, platform_name: str, input_lower: str) -> Optional[str]:
+        """
+        Match normalized input against the fallback pattern tables
         
-        # Advanced pattern matching for more complex queries
-        advanced_patterns = {
-            # File-related patterns
-            r'find.*files?.*larger.*than.*(\d+)': lambda m: self._get_large_files_command(m.group(1)),
-            r'show.*files?.*modified.*today': lambda m: self._get_recent_files_command('today'),
-            r'files?.*modified.*last.*(\d+).*days?': lambda m: self._get_recent_files_command(m.group(1)),
-            r'count.*files?.*in.*current': lambda m: self._get_file_count_command(),
-            r'size.*of.*all.*files?': lambda m: self._get_total_size_command(),
+        Args:
+            platform_name (str): Platform the result is cached under (self.platform)
+            input_lower (str): Lowercased, stripped user input
             
-            # Process-related patterns
-            r'kill.*process.*(\w+)': lambda m: self._get_kill_process_command(m.group(1)),
-            r'memory.*used.*by.*(\w+)': lambda m: self._get_process_memory_command(m.group(1)),
+        Returns:
+            Optional[str]: System command or None if not recognized
+        """
+        platform_commands = self._cmd_table
+        
+        # Find the first pattern in table order that matches, in a single pass
+        index = None
+        argument = None
+        match = _PATTERN_UNION.match(input_lower)
+        if match:
+            index, argument_group = _PATTERN_DISPATCH[match.lastgroup]
+            if argument_group:
+                argument = match.group(argument_group)
+        
+        if index is not None:
+            command_type = _PATTERN_ENTRIES[index][0]
+            base_command = platform_commands.get(command_type)
+            if base_command:
+                return self._build_pattern_command(command_type, base_command, argument)
             
-            # System patterns
-            r'free.*space.*on.*(\w+)': lambda m: self._get_disk_space_command(m.group(1)),
-            r'temperature|thermal': lambda m: self._get_temperature_command(),
-            r'uptime|how.*long.*running': lambda m: self._get_uptime_command(),
-        }
+            # The platform lacks this command type, so scan the rest of the table in order
+            for command_type, compiled in _PATTERN_ENTRIES[index + 1:]:
+                base_command = platform_commands.get(command_type)
+                if base_command:
+                    match = compiled.search(input_lower)
+                    if match:
+                        return self._build_pattern_command(command_type, base_command, match.group(1) if match.groups() else None)
         
-        for pattern, command_func in advanced_patterns.items():
-            match = re.search(pattern, input_lower)
-            if match:
-                try:
-                    return command_func(match)
-                except:
-                    continue
+        # Advanced pattern matching for more complex queries
+        match = _ADVANCED_UNION.match(input_lower)
+        if match:
+            start = int(match.lastgroup[1:])
+            for compiled, command_func in _COMPILED_ADVANCED_PATTERNS[start:]:
+                match = compiled.search(input_lower)
+                if match:
+                    try:
+                        return command_func(self, match)
+                    except:
+                        continue
         
         # If no pattern matches, return None
         return None
     
+    def _build_pattern_command(self, command_type: str, base_command: str, argument: Optional[str]) -> str:
+        """
+        Build the command for a matched fallback pattern
+        
+        Args:
+            command_type (str): Command type of the matched pattern
+            base_command (str): Platform command for that type
+            argument (Optional[str]): The pattern's captured group, if it has one
+            
+        Returns:
+            str: System command
+        """
+        # Handle commands that need arguments
+        if command_type in ['change_directory', 'create_directory'] and argument is not None:
+            return f"{base_command} {argument}"
+        elif command_type == 'list_specific_files' and argument is not None:
+            return self._templates['list_specific_files'].format(extension=argument)
+        elif command_type == 'show_specific_processes' and argument is not None:
+            return self._templates['show_specific_processes'].format(process_name=argument)
+        else:
+            return base_command
+    
     def _get_large_files_command(self, size_mb: str) -> str:
         """Generate command to find large files"""
-        if self.platform == 'windows':
-            return f'forfiles /s /c "cmd /c if @fsize geq {int(size_mb)*1024*1024} echo @path @fsize"'
-        else:
-            return f'find . -size +{size_mb}M -ls'
+        return self._templates['large_files'].format(size_mb=size_mb, size_bytes=int(size_mb) * 1024 * 1024)
     
     def _get_recent_files_command(self, timeframe: str) -> str:
         """Generate command to find recently modified files"""
-        if self.platform == 'windows':
-            if timeframe == 'today':
-                return 'forfiles /m *.* /c "cmd /c echo @path @fdate @ftime"'
-            else:
-                return f'forfiles /m *.* /d -{timeframe} /c "cmd /c echo @path @fdate"'
-        else:
-            if timeframe == 'today':
-                return 'find . -newermt "$(date +%Y-%m-%d)" -ls'
-            else:
-                return f'find . -mtime -{timeframe} -ls'
+        if timeframe == 'today':
+            return self._templates['files_modified_today']
+        return self._templates['files_modified_days'].format(days=timeframe)
     
     def _get_file_count_command(self) -> str:
         """Generate command to count files"""
-        if self.platform == 'windows':
-            return 'dir /b | find /c /v ""'
-        else:
-            return 'ls -1 | wc -l'
+        return self._templates['file_count']
     
     def _get_total_size_command(self) -> str:
         """Generate command to get total size of files"""
-        if self.platform == 'windows':
-            return 'dir /s'
-        else:
-            return 'du -sh .'
+        return self._templates['total_size']
     
     def _get_kill_process_command(self, process_name: str) -> str:
         """Generate command to kill a process (but return safe alternative)"""
         # Instead of actually killing, just show the process
-        if self.platform == 'windows':
-            return f'tasklist /fi "imagename eq {process_name}*"'
-        else:
-            return f'ps aux | grep {process_name}'
+        return self._templates['find_process'].format(process_name=process_name)
     
     def _get_process_memory_command(self, process_name: str) -> str:
         """Generate command to show process memory usage"""
-        if self.platform == 'windows':
-            return f'tasklist /fi "imagename eq {process_name}*" /fo table'
-        else:
-            return f'ps aux | grep {process_name} | awk \'{{print $4" "$11}}\''
+        return self._templates['process_memory'].format(process_name=process_name)
 
     def _get_disk_space_command(self, drive: str) -> str:
         """Generate command to show disk space for specific drive"""
-        if self.platform == 'windows':
-            return f'dir {drive}:\\ /-c'
-        else:
-            return f'df -h /{drive} 2>/dev/null || df -h'
+        return self._templates['disk_space'].format(drive=drive)
     
     def _get_temperature_command(self) -> str:
         """Generate command to show system temperature"""
-        if self.platform == 'windows':
-            return 'wmic /namespace:\\\\root\\wmi PATH MSAcpi_ThermalZoneTemperature get CurrentTemperature'
-        else:
-            return 'sensors 2>/dev/null || cat /sys/class/thermal/thermal_zone*/temp 2>/dev/null || echo "Temperature sensors not available"'
+        return self._templates['temperature']
     
     def _get_uptime_command(self) -> str:
         """Generate command to show system uptime"""
-        if self.platform == 'windows':
-            return 'systeminfo | findstr "System Boot Time"'
-        else:
-            return 'uptime'
+        return self._templates['uptime']
     
     def is_command_safe(self, command: str) -> Union[bool, str]:
         """
@@ -841,115 +2480,191 @@ class AiNuxLLM:
             False -> absolutely forbidden
         """
 
-        command_lower = command.lower().strip()
+        return _classify_command(command.lower().strip())
+    
+    def execute_command(self, command: str) -> Dict[str, any]:
+        """
+        Execute a system command safely, with confirmation for dangerous commands.
+        Also updates in-session memory on successful operations.
+        """
+        refusal = self._screen_command(command)
+        if refusal:
+            return refusal
 
-        # Absolutely forbidden commands (no confirmation allowed)
-        forbidden_patterns = [
-            r'rm\s+-rf\s+/',                     # rm -rf /
-            r'format(\s|$)',                     # format disk
-            r'fdisk',                            # partitioning
-            r'dd\s+if=',                         # raw disk writes
-            r':\(\)\s*\{\s*:|:&\}\s*;\s*:',    # fork bomb
-            r'shutdown(\s|$)',
-            r'reboot(\s|$)',
-            r'poweroff(\s|$)',
-            r'init\s+[06]',
-        ]
+        # Safe or confirmed — run it. Safe commands go to the persistent shell;
+        # confirmed ones get a fresh shell of their own
+        try:
+            if self._shell and self.is_command_safe(command) is True:
+                result = self._shell.run(command, COMMAND_TIMEOUT)
+                return_code, output, error = result.returncode, result.stdout.strip(), result.stderr.strip()
+            else:
+                result = subprocess.run(
+                    command,
+                    shell=True,
+                    capture_output=True,
+                    timeout=COMMAND_TIMEOUT,
+                )
+                return_code = result.returncode
+                output, error = _decode_output(result.stdout), _decode_output(result.stderr)
+            return self._command_result(command, return_code, output, error)
 
-        for pattern in forbidden_patterns:
-            if re.search(pattern, command_lower):
-                return False
+        except subprocess.TimeoutExpired:
+            return self._command_failure(command, f'Command timed out after {COMMAND_TIMEOUT} seconds: {command}')
 
-        # Dangerous but confirmable commands (Linux + Windows)
-        confirmable_patterns = [
-            r'rm\s+-rf\s+.+',            # rm -rf <folder>
-            r'rm\s+.+',                  # rm <file>
-            r'del\s+.+',                 # del file.ext
-            r'rmdir\s+/s\s+/q\s+.+',     # WINDOWS delete folder
-            r'rmdir\s+.+',               # any rmdir is dangerous
-            r'mv\s+.+',                  # move operations
-            r'chmod\s+7[0-7][0-7]',      # chmod 7xx
-            r'chown\s+-r\s+.+',
-        ]
+        except Exception as e:
+            return self._command_failure(command, f'Unexpected error executing command: {str(e)}')
+
+    async def execute_command_async(self, command: str,
+                                    on_output: Optional[Callable[[str], None]] = None) -> Dict[str, any]:
+        """
+        Execute a system command without blocking the event loop.
 
-        for pattern in confirmable_patterns:
-            if re.search(pattern, command_lower):
-                return "confirm"
+        stdout and stderr are drained concurrently, so commands with a lot of output
+        never stall on a full pipe. stdout is read line by line: on_output sees each
+        line as the command prints it, and only the last OUTPUT_MAX_LINES lines are
+        kept for the result.
 
-        # Everything else is safe
-        return True
-    
-    def execute_command(self, command: str) -> Dict[str, any]:
+        Args:
+            command (str): Command to execute
+            on_output (Optional[Callable]): Called with each line of stdout as it arrives
+
+        Returns:
+            Dict: Result with success, output, error, command and return_code
         """
-        Execute a system command safely, with confirmation for dangerous commands.
-        Also updates in-session memory on successful operations.
+        refusal = await self._screen_command_async(command)
+        if refusal:
+            return refusal
+
+        # Safe or confirmed — run it. Safe commands go to the persistent shell;
+        # confirmed ones get a fresh shell of their own
+        try:
+            if self._shell and self.is_command_safe(command) is True:
+                result = await asyncio.to_thread(self._shell.run, command, COMMAND_TIMEOUT, on_output)
+                return_code, output, error = result.returncode, result.stdout.strip(), result.stderr.strip()
+            else:
+                return_code, output, error = await self._run_in_new_shell(command, on_output)
+            return self._command_result(command, return_code, output, error)
+
+        except (asyncio.TimeoutError, subprocess.TimeoutExpired):
+            return self._command_failure(command, f'Command timed out after {COMMAND_TIMEOUT} seconds: {command}')
+
+        except Exception as e:
+            return self._command_failure(command, f'Unexpected error executing command: {str(e)}')
+
+    def _command_result(self, command: str, return_code: int, output: str, error: str) -> Dict[str, any]:
         """
+        Build the result of a command that ran, updating memory if it succeeded
 
-        safety = self.is_command_safe(command)
+        Returns:
+            Dict: Result with success, output, error, command and return_code
+        """
+        response = {
+            'success': return_code == 0,
+            'output': output,
+            'error': error,
+            'command': command,
+            'return_code': return_code
+        }
 
-        # Fully forbidden
-        if safety is False:
-            return {
-                'success': False,
-                'output': '',
-                'error': f'Command blocked for security reasons: {command}',
-                'command': command
-            }
+        # Update memory on success
+        if response['success']:
+            self._update_memory_after_command(command)
 
-        # Dangerous but confirmable
-        if safety == "confirm":
-            print(f"\nWARNING: This command may delete or modify important files:\n  {command}")
-            print("If you're absolutely certain, type YES.")
-            confirm = input("Confirm (YES to run): ").strip()
-
-            if confirm.upper() != "YES":
-                return {
-                    'success': False,
-                    'output': '',
-                    'error': f'Execution cancelled by user: {command}',
-                    'command': command
-                }
-
-        # Safe or confirmed — run it
+        return response
+
+    @staticmethod
+    def _command_failure(command: str, error: str) -> Dict[str, any]:
+        """Build the result of a command that could not run to completion"""
+        return {
+            'success': False,
+            'output': '',
+            'error': error,
+            'command': command
+        }
+
+    async def _run_in_new_shell(self, command: str,
+                                on_output: Optional[Callable[[str], None]] = None) -> Tuple[int, str, str]:
+        """
+        Run a command in a shell started just for it
+
+        Args:
+            command (str): Command to execute
+            on_output (Optional[Callable]): Called with each line of stdout as it arrives
+
+        Returns:
+            Tuple[int, str, str]: Exit status, stdout (last OUTPUT_MAX_LINES lines) and stderr
+
+        Raises:
+            asyncio.TimeoutError: If the command ran longer than COMMAND_TIMEOUT
+        """
+        process = await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        output: "deque[str]" = deque(maxlen=OUTPUT_MAX_LINES)
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=os.getcwd()
-            )
+            _, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(_read_lines(process.stdout, output, on_output), process.stderr.read(),
+                               process.wait()),
+                timeout=COMMAND_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        return process.returncode, '\n'.join(output).strip(), _decode_output(stderr)
+
+    def _screen_command(self, command: str) -> Optional[Dict[str, any]]:
+        """
+        Check a command before it runs, asking the user to confirm dangerous ones
 
-            response = {
-                'success': result.returncode == 0,
-                'output': result.stdout.strip() if result.stdout else '',
-                'error': result.stderr.strip() if result.stderr else '',
-                'command': command,
-                'return_code': result.returncode
-            }
+        Args:
+            command (str): Command about to be executed
 
-            # Update memory on success
-            if response['success']:
-                self._update_memory_after_command(command)
+        Returns:
+            Optional[Dict]: Failure result if the command must not run, None if it may
+        """
+        safety = self.is_command_safe(command)
+        answer = input(_CONFIRM_TEMPLATE.format(command=command)) if safety == "confirm" else None
+        return self._screening_result(command, safety, answer)
 
-            return response
+    async def _screen_command_async(self, command: str) -> Optional[Dict[str, any]]:
+        """
+        Async version of _screen_command that reads the confirmation without blocking
+        the event loop
 
-        except subprocess.TimeoutExpired:
-            return {
-                'success': False,
-                'output': '',
-                'error': f'Command timed out after 30 seconds: {command}',
-                'command': command
-            }
+        Args:
+            command (str): Command about to be executed
 
-        except Exception as e:
-            return {
-                'success': False,
-                'output': '',
-                'error': f'Unexpected error executing command: {str(e)}',
-                'command': command
-            }
+        Returns:
+            Optional[Dict]: Failure result if the command must not run, None if it may
+        """
+        safety = self.is_command_safe(command)
+        answer = await _read_input(_CONFIRM_TEMPLATE.format(command=command)) if safety == "confirm" else None
+        return self._screening_result(command, safety, answer)
+
+    def _screening_result(self, command: str, safety: Union[bool, str],
+                          answer: Optional[str]) -> Optional[Dict[str, any]]:
+        """
+        Decide whether a screened command may run
+
+        Args:
+            command (str): Command about to be executed
+            safety (Union[bool, str]): Result of is_command_safe
+            answer (Optional[str]): The user's reply to the confirmation prompt, if asked
+
+        Returns:
+            Optional[Dict]: Failure result if the command must not run, None if it may
+        """
+        # Fully forbidden
+        if safety is False:
+            return self._command_failure(command, f'Command blocked for security reasons: {command}')
+
+        # Dangerous but confirmable
+        if safety == "confirm" and answer.strip().upper() != "YES":
+            return self._command_failure(command, f'Execution cancelled by user: {command}')
+
+        return None
 
     def _update_memory_after_command(self, command: str) -> None:
         """
@@ -963,7 +2678,7 @@ class AiNuxLLM:
         self.memory["last_command"] = cmd
 
         # mkdir
-        m = re.match(r'^(?:sudo\s+)?mkdir\s+(-p\s+)?(.+)$', cmd)
+        m = _MKDIR_COMMAND.match(cmd)
         if m:
             folder = m.group(2).strip().strip('"').strip("'")
             # Normalize path if necessary
@@ -971,21 +2686,21 @@ class AiNuxLLM:
             return
 
         # touch (file creation)
-        m = re.match(r'^(?:sudo\s+)?touch\s+(.+)$', cmd)
+        m = _TOUCH_COMMAND.match(cmd)
         if m:
             file = m.group(1).strip().strip('"').strip("'")
             self._remember_entity("file", os.path.basename(file), path=file)
             return
 
         # cd
-        m = re.match(r'^(?:cd)\s+(.+)$', cmd)
+        m = _CD_COMMAND.match(cmd)
         if m:
             path = m.group(1).strip().strip('"').strip("'")
             self._remember_entity("path", os.path.basename(path) or path, path=path)
             return
 
         # mv (move could imply rename; record destination)
-        m = re.match(r'^(?:mv)\s+(.+)\s+(.+)$', cmd)
+        m = _MV_COMMAND.match(cmd)
         if m:
             dest = m.group(2).strip().strip('"').strip("'")
             # if dest looks like a folder, remember it as folder
@@ -993,7 +2708,7 @@ class AiNuxLLM:
             return
 
         # cp (copy could create a file)
-        m = re.match(r'^(?:cp)\s+(.+)\s+(.+)$', cmd)
+        m = _CP_COMMAND.match(cmd)
         if m:
             dest = m.group(2).strip().strip('"').strip("'")
             # guess file if has extension
@@ -1004,7 +2719,7 @@ class AiNuxLLM:
             return
 
         # Windows-specific mkdir/copy etc
-        m = re.match(r'^(?:mkdir)\s+(.+)$', cmd, re.IGNORECASE)
+        m = _WINDOWS_MKDIR_COMMAND.match(cmd)
         if m:
             folder = m.group(1).strip().strip('"').strip("'")
             self._remember_entity("folder", os.path.basename(folder), path=folder)
@@ -1014,37 +2729,52 @@ class AiNuxLLM:
         # (could be extended to remove entities on successful delete)
         return
 
-    def display_result(self, result: Dict[str, any]) -> None:
+    def display_result(self, result: Dict[str, any], output_shown: bool = False) -> None:
         """
         Display the result of a command execution in a user-friendly format.
         
         Args:
             result (Dict): Result dictionary from execute_command
+            output_shown (bool): The output was already streamed to the terminal, so
+                only the summary is printed
         """
-        print(f"\n{'='*50}")
-        print(f"EXECUTED COMMAND: {result['command']}")
-        print(f"{'='*50}")
-        
-        if result['success']:
-            print("Status: SUCCESS")
-            if result['output']:
-                print(f"Output:")
-                print(f"{result['output']}")
-            else:
-                print("Output: (no output)")
+        if not result['success']:
+            template = _FAILURE_TEMPLATE if result['error'] else _FAILURE_BARE_TEMPLATE
+        elif not result['output']:
+            template = _SUCCESS_EMPTY_TEMPLATE
         else:
-            print("Status: FAILED")
-            if result['error']:
-                print(f"Error: {result['error']}")
+            template = _SUCCESS_SHOWN_TEMPLATE if output_shown else _SUCCESS_TEMPLATE
         
-        print("=" * 50)
+        # One write for the whole block instead of a print per line
+        sys.stdout.write(template.format(command=result['command'], output=result['output'], error=result['error']))
+        sys.stdout.flush()
     
     def run_interactive_mode(self, voice: bool = False) -> None:
         """
         Run AiNux in interactive mode with optional voice input.
         """
+        # A plain event loop rather than asyncio.run, so Ctrl+C at the prompt ends
+        # the session straight away instead of waiting on a pending read
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.run_interactive_mode_async(voice))
+        except KeyboardInterrupt:
+            _write_status(_INTERRUPTED)
+        finally:
+            loop.close()
+
+    async def run_interactive_mode_async(self, voice: bool = False) -> None:
+        """
+        Run the interactive loop on the current event loop.
+
+        In voice mode the microphone listens for the next command in a worker thread
+        while the current one is parsed and executed.
+
+        Args:
+            voice (bool): Take commands from the microphone instead of the keyboard
+        """
 
-        mode_str = "LLM Enhanced" if (self.use_llm and self.llm and self.llm.available) else "Regex Fallback"
+        mode_str = "LLM Enhanced" if self._llm_active else "Regex Fallback"
         print(f"\n{mode_str} AiNux is ready! Enter natural language commands.")
         print("(Say 'exit' or 'quit' to stop if in voice mode.)\n")
 
@@ -1052,138 +2782,118 @@ class AiNuxLLM:
         voice_available = False
         if voice:
             try:
-                from voice_input import listen_for_command, VoiceInputError
+                from voice_input import listen_for_command, VoiceInputError, warm_up
+                warm_up()
+                self._listen = functools.partial(
+                    listen_for_command, timeout=VOICE_LISTEN_TIMEOUT,
+                    phrase_time_limit=VOICE_PHRASE_LIMIT, language="en-US")
                 voice_available = True
                 print("Voice mode enabled. Listening for commands...")
             except Exception as e:
                 print(f"Voice mode failed to initialize: {e}")
                 voice = False
 
+        loop = asyncio.get_running_loop()
+        listening = None
+        
+        # Requests in this loop use the async client, so open its connection too
+        warm_up = loop.create_task(self.llm.warm_up_async()) if self._llm_active else None
+
         while True:
             try:
                 # Voice input mode
                 if voice and voice_available:
-                    from voice_input import listen_for_command
-                    print("🎤 Listening...")
-                    heard = listen_for_command(timeout=6, phrase_time_limit=8, language="en-US")
+                    if listening is None:
+                        listening = loop.run_in_executor(None, self._listen)
+                    if not listening.done():
+                        _write_status(_LISTENING)
+                    pending, listening = listening, None
+                    heard = await pending
                     user_input = (heard or "").strip()
 
                     if not user_input:
                         continue
 
-                    print(f"You said: {user_input}")
+                    _write_status(f"You said: {user_input}\n".encode("utf-8"))
 
                 # Text input mode
                 else:
-                    user_input = input("AiNux> ").strip()
+                    user_input = (await _read_input("AiNux> ")).strip()
 
                 # Exit commands
-                if user_input.lower() in ['exit', 'quit', 'q', 'bye']:
-                    print("Goodbye! Thanks for using AiNux.")
+                lowered = user_input.lower()
+                if lowered in _EXIT_COMMANDS:
+                    _write_status(_GOODBYE)
                     break
 
                 if not user_input:
                     continue
 
+                # Capture the next utterance while this one is handled
+                if voice and voice_available:
+                    listening = loop.run_in_executor(None, self._listen)
+
                 # Help commands
-                if user_input.lower() in ['help', 'h', '?']:
+                if lowered in _HELP_COMMANDS:
                     self.show_help()
                     continue
 
-                if user_input.lower() in ['mode', 'info', 'status']:
+                if lowered in _MODE_COMMANDS:
                     self.show_mode_info()
                     continue
 
                 # Process natural language
                 print("Processing natural language input...")
-                command = self.parse_natural_language(user_input)
+                command = await self.parse_natural_language_async(user_input)
 
                 if command is None:
                     print(f"Sorry, I don't understand: '{user_input}'")
                     print("Type 'help' for supported commands.")
                     continue
 
-                parsing_mode = "LLM" if (self.use_llm and self.llm and self.llm.available) else "Regex"
+                parsing_mode = "LLM" if self._llm_active else "Regex"
                 print(f"Generated command ({parsing_mode}): {command}")
 
-                # Execute it
-                result = self.execute_command(command)
+                # Execute it, showing output as the command produces it
+                result = await self.execute_command_async(command, on_output=print)
 
                 # Display result
-                self.display_result(result)
+                self.display_result(result, output_shown=True)
 
             except KeyboardInterrupt:
-                print("\nInterrupted by user. Exiting.")
+                _write_status(_INTERRUPTED)
                 break
 
             except Exception as e:
                 print(f"Unexpected error: {e}")
                 continue
+
+        if warm_up:
+            warm_up.cancel()
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the LLM's async HTTP client (and stop request batching)"""
+        if self._async_llm:
+            await self._async_llm.aclose()
     
     def show_help(self) -> None:
         """Display comprehensive help information."""
-        print("\n" + "=" * 70)
-        print("AiNux LLM Enhanced Help - Natural Language Command Examples")
-        print("=" * 70)
-        
-        mode_str = "LLM Enhanced" if (self.use_llm and self.llm and self.llm.available) else "Regex Fallback"
-        print(f"Current Mode: {mode_str}")
-        
-        print("\nEnhanced Commands (LLM Mode):")
-        print("  • 'Show me all Python files in this directory'")
-        print("  • 'Find running processes containing chrome or firefox'")
-        print("  • 'Create a backup folder called backup_2025'")
-        print("  • 'What files were modified in the last hour?'")
-        print("  • 'Display detailed network configuration'")
-        print("  • 'Show me the size of all directories here'")
-        
-        print("\nFile Operations:")
-        print("  • 'List files here' or 'Show files in current directory'")
-        print("  • 'Show current directory' or 'Where am I?'")
-        print("  • 'Create directory myproject'")
-        
-        print("\nSystem Information:")
-        print("  • 'Show running processes'")
-        print("  • 'Show network info'")
-        print("  • 'Show system info'")
-        print("  • 'Show disk usage'")
-        
-        print("\nNavigation:")
-        print("  • 'Change directory to Documents'")
-        print("  • 'Go to directory myproject'")
-        
-        print("\nOther Commands:")
-        print("  • 'help' or 'h' or '?' - Show this help")
-        print("  • 'mode' or 'info' - Show current parsing mode")
-        print("  • 'exit' or 'quit' or 'q' - Exit AiNux")
-        
-        print("\nSecurity:")
-        print("  • All commands are checked for safety before execution")
-        print("  • Dangerous commands are automatically blocked")
-        print("  • Commands timeout after 30 seconds")
-        
-        print("=" * 70 + "\n")
+        mode_str = "LLM Enhanced" if self._llm_active else "Regex Fallback"
+        # One write for the whole screen instead of a print per line
+        sys.stdout.write(_HELP_TEMPLATE.format(mode=mode_str))
+        sys.stdout.flush()
     
     def show_mode_info(self) -> None:
         """Display current mode and configuration information."""
-        print("\n" + "📊 AiNux Mode Information")
-        print("-" * 30)
-        
-        if self.use_llm and self.llm and self.llm.available:
-            print("Mode: LLM Enhanced")
-            print(f"Model: {self.gemini_config.model}")
-            print(f"API: Google Gemini")
-            print(f" Temperature: {self.gemini_config.temperature}")
-            print("Capabilities: Advanced natural language understanding")
+        if self._llm_active:
+            text = _MODE_LLM_TEMPLATE.format(model=self.gemini_config.model,
+                                             temperature=self.gemini_config.temperature,
+                                             platform=_PLATFORM_NAME)
         else:
-            print("Mode: Regex Fallback")
-            print("Parser: Pattern matching")
-            print("Note: Add GEMINI_API_KEY to .env file for enhanced LLM mode")
-        
-        print(f"Platform: {platform.system()}")
-        print(f"Security: Active (dangerous commands blocked)")
-        print("-" * 30 + "\n")
-
+            text = _MODE_REGEX_TEMPLATE.format(platform=_PLATFORM_NAME)
+        sys.stdout.write(text)
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     try:
@@ -1195,7 +2905,7 @@ if __name__ == "__main__":
 
         ainux = AiNuxLLM(use_llm=True)
         print("AiNux LLM Enhanced Natural Language Command Executor initialized!")
-        print(f"Running on: {platform.system()}")
+        print(f"Running on: {_PLATFORM_NAME}")
         print("Type 'exit' or 'quit' to stop the program.")
         print("-" * 60)
 
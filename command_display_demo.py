@@ -18,7 +18,7 @@ def show_command_display_demo():
     print()
     
     # Initialize AiNux (will use regex fallback if Ollama not available)
-    ainux = AiNuxLLM(use_llm=True)
+    ainux = AiNuxLLM.get_shared(use_llm=True)
     
     # Test cases to demonstrate command generation
     demo_inputs = [
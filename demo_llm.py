@@ -20,7 +20,7 @@ def demo_with_available_model():
     config = GeminiConfig()
     
     print(f"🤖 Attempting to use model: {config.model}")
-    ainux = AiNuxLLM(use_llm=True, gemini_config=config)
+    ainux = AiNuxLLM.get_shared(use_llm=True, gemini_config=config)
     
     print("\n🧪 Testing Enhanced Natural Language Processing:")
     print("-" * 50)
@@ -65,7 +65,7 @@ def run_quick_interactive():
     print("-" * 30)
     
     config = GeminiConfig()  # Use Gemini
-    ainux = AiNuxLLM(use_llm=True, gemini_config=config)
+    ainux = AiNuxLLM.get_shared(use_llm=True, gemini_config=config)
     
     demo_commands = [
         "list files in current directory",
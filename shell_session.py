@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Pooled POSIX shell shared by ainux.py and ainux_llm.py.
+
+Starting /bin/sh for every command costs a fork and exec; a ShellSession keeps
+one shell running and feeds it commands over a pipe instead.
+"""
+
+import atexit
+import locale
+import os
+import selectors
+import shlex
+import signal
+import subprocess
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
+from typing import Callable, Optional
+
+# Encoding of command output, probed once
+_OUTPUT_ENCODING = locale.getpreferredencoding(False)
+
+
+class ShellSession:
+    """
+    A long-lived POSIX shell that runs successive commands over pipes.
+
+    Each command is eval'd in a subshell with stdin from /dev/null, so ``cd``,
+    ``exit``, variables, options, traps and syntax errors stay contained exactly
+    as they would with ``sh -c``. The shell then prints a per-session sentinel
+    and the exit status on stdout and the sentinel on stderr, which mark where
+    the command's output ends. The shell leads its own process group; a command
+    that outlives its timeout is killed together with anything it started in the
+    background, and the next command starts a new shell.
+    """
+
+    def __init__(self, shell: str = '/bin/sh', max_lines: Optional[int] = None):
+        """
+        Prepare the session; the shell itself starts on first use.
+
+        Args:
+            shell (str): POSIX shell to run commands in
+            max_lines (Optional[int]): Keep only this many trailing lines of stdout
+        """
+        self._shell = shell
+        self._max_lines = max_lines
+        self._sentinel = f"__AINUX_END_{uuid.uuid4().hex}__".encode()
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        _OPEN_SESSIONS.add(self)
+
+    @classmethod
+    def create(cls, **kwargs) -> Optional["ShellSession"]:
+        """
+        Return a session on POSIX systems.
+
+        Returns:
+            Optional[ShellSession]: The session, or None where cmd.exe cannot be
+                driven reliably over pipes and each command needs a shell of its own
+        """
+        return cls(**kwargs) if os.name == 'posix' else None
+
+    def run(self, command: str, timeout: float,
+            on_output: Optional[Callable[[str], None]] = None) -> subprocess.CompletedProcess:
+        """
+        Run a command in the pooled shell.
+
+        Args:
+            command (str): Shell command line
+            timeout (float): Seconds to wait before killing the command
+            on_output (Optional[Callable]): Called with each line of stdout as it arrives
+
+        Returns:
+            subprocess.CompletedProcess: Exit status and decoded stdout/stderr lines
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time
+            OSError: If the shell could not be started or written to
+        """
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+
+            sentinel = self._sentinel.decode()
+            script = (
+                f"(eval {shlex.quote(command)}) </dev/null; "
+                f"printf '%s%d\\n' {sentinel} \"$?\"; printf '%s\\n' {sentinel} >&2\n"
+            )
+            try:
+                self._process.stdin.write(script.encode())
+                self._process.stdin.flush()
+            except OSError:
+                # The shell died since it was last used
+                self._kill()
+                raise
+
+            output: "deque[str]" = deque(maxlen=self._max_lines)
+            errors: "deque[str]" = deque()
+            status = self._collect(command, timeout, output, errors, on_output)
+            if status is None:
+                # The shell itself exited while the command ran
+                status = self._process.wait()
+                self._kill()
+
+        return subprocess.CompletedProcess(command, status, '\n'.join(output), '\n'.join(errors))
+
+    def close(self) -> None:
+        """Shut the pooled shell down."""
+        with self._lock:
+            self._kill()
+
+    def _start(self) -> None:
+        """Start the shell in the current directory, leading a new process group."""
+        self._kill()
+        self._process = subprocess.Popen(
+            [self._shell],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+            start_new_session=True
+        )
+
+    def _kill(self) -> None:
+        """Kill the shell and anything it started; the next run starts afresh."""
+        if self._process is not None:
+            try:
+                os.killpg(self._process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            self._process.wait()
+            for pipe in (self._process.stdin, self._process.stdout, self._process.stderr):
+                pipe.close()
+            self._process = None
+
+    def _collect(self, command: str, timeout: float, output: "deque[str]", errors: "deque[str]",
+                 on_output: Optional[Callable[[str], None]]) -> Optional[int]:
+        """
+        Read stdout and stderr line by line up to their sentinels.
+
+        Returns:
+            Optional[int]: Exit status, or None if the shell exited instead
+        """
+        stdout = self._process.stdout.fileno()
+        sinks = {stdout: (output, on_output), self._process.stderr.fileno(): (errors, None)}
+        pending = {fd: b'' for fd in sinks}
+        status: Optional[int] = None
+        deadline = time.monotonic() + timeout
+
+        def emit(fd: int, raw: bytes) -> None:
+            lines, on_line = sinks[fd]
+            line = raw.decode(_OUTPUT_ENCODING, errors='replace').rstrip('\r')
+            lines.append(line)
+            if on_line:
+                on_line(line)
+
+        with selectors.DefaultSelector() as selector:
+            for fd in sinks:
+                selector.register(fd, selectors.EVENT_READ)
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._kill()
+                    raise subprocess.TimeoutExpired(command, timeout)
+                for key, _ in selector.select(remaining):
+                    fd = key.fd
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        if pending[fd]:
+                            emit(fd, pending[fd])
+                        selector.unregister(fd)
+                        continue
+                    data = pending[fd] + chunk
+                    head, found, tail = data.partition(self._sentinel)
+                    if found and b'\n' not in tail:
+                        # The rest of the sentinel's line is still on its way
+                        pending[fd] = data
+                        continue
+                    # Lines are split on raw bytes so a multi-byte character is never
+                    # cut in half; a partial line waits for the rest
+                    *complete, pending[fd] = head.split(b'\n')
+                    for raw in complete:
+                        emit(fd, raw)
+                    if found:
+                        # Output without a final newline shares its line with the sentinel
+                        if pending[fd]:
+                            emit(fd, pending[fd])
+                        if fd == stdout:
+                            status = int(tail.split(b'\n', 1)[0] or 0)
+                        selector.unregister(fd)
+        return status
+
+
+# Live sessions, closed together at exit; held weakly so sessions can still be collected
+_OPEN_SESSIONS: "weakref.WeakSet[ShellSession]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_sessions() -> None:
+    """Shut down every pooled shell still alive at interpreter exit."""
+    for session in list(_OPEN_SESSIONS):
+        session.close()
+
+
+__all__ = ["ShellSession"]
@@ -57,7 +57,7 @@ def test_ainux():
             print(f"Success: {result['success']}")
             if result['success'] and result['output']:
                 # Show only first few lines to avoid clutter
-                output_lines = result['output'].split('\n')[:5]
+                output_lines = result['output'].split('\n', 5)[:5]
                 print(f"Output (first 5 lines): {chr(10).join(output_lines)}")
             elif not result['success']:
                 print(f"Error: {result['error']}")
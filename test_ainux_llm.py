@@ -18,11 +18,11 @@ def test_ainux_llm():
     
     # Initialize AiNux with LLM support
     print("🤖 Testing with LLM enabled...")
-    ainux_llm = AiNuxLLM(use_llm=True)
+    ainux_llm = AiNuxLLM.get_shared(use_llm=True)
     
     # Initialize AiNux without LLM for comparison
     print("🔧 Testing with regex fallback...")
-    ainux_regex = AiNuxLLM(use_llm=False)
+    ainux_regex = AiNuxLLM.get_shared(use_llm=False)
     
     print("\n" + "=" * 60)
     
@@ -112,13 +112,225 @@ def test_ainux_llm():
             print(f"   ✅ Success: {result['success']}")
             if result['success'] and result['output']:
                 # Show only first 3 lines to avoid clutter
-                output_lines = result['output'].split('\n')[:3]
+                output_lines = result['output'].split('\n', 3)[:3]
                 print(f"   📄 Output (first 3 lines): {' | '.join(output_lines)}")
             elif not result['success']:
                 print(f"   🚨 Error: {result['error']}")
         else:
             print("   ⚠️  Command was blocked or not recognized")
 
+def test_pattern_union():
+    """Check the fused regex dispatch against a sequential re.search over the tables"""
+    from ainux_llm import _COMPILED_PATTERNS, _COMPILED_ADVANCED_PATTERNS
+    
+    print("\n" + "=" * 60)
+    print("🧩 Testing Fused Regex Dispatch:")
+    print("-" * 35)
+    
+    ainux_regex = AiNuxLLM.get_shared(use_llm=False)
+    
+    def sequential(input_lower):
+        # The original per-pattern loop: first matching pattern the platform supports wins
+        for command_type, compiled_list in _COMPILED_PATTERNS:
+            base_command = ainux_regex._cmd_table.get(command_type)
+            if not base_command:
+                continue
+            for compiled in compiled_list:
+                match = compiled.search(input_lower)
+                if match:
+                    argument = match.group(1) if match.groups() else None
+                    return ainux_regex._build_pattern_command(command_type, base_command, argument)
+        for compiled, command_func in _COMPILED_ADVANCED_PATTERNS:
+            match = compiled.search(input_lower)
+            if match:
+                try:
+                    return command_func(ainux_regex, match)
+                except Exception:
+                    continue
+        return None
+    
+    inputs = [
+        "who logged on to the domain",
+        "who logged on recently and remain",
+        "who is logged in",
+        "show env",
+        "show path variable",
+        "list all files in the current directory",
+        "show current working directory",
+        "show running processes",
+        "create a folder called test_project",
+        "make directory reports",
+        "show me network configuration details",
+        "show disk space",
+        "show system info",
+        "find files named notes.txt",
+        "what is my ip address",
+        "this is not a valid command",
+        "",
+    ]
+    
+    mismatches = 0
+    for input_lower in inputs:
+        expected = sequential(input_lower)
+        actual = ainux_regex._match_patterns(ainux_regex.platform, input_lower)
+        if actual != expected:
+            mismatches += 1
+            print(f"   ❌ '{input_lower}': fused={actual!r} sequential={expected!r}")
+    
+    if mismatches:
+        print(f"   ❌ {mismatches} of {len(inputs)} inputs differ")
+    else:
+        print(f"   ✅ All {len(inputs)} inputs match the sequential table")
+
+def test_shell_session():
+    """Check that pooled-shell commands are isolated and timeouts leave no processes behind"""
+    import subprocess
+    import tempfile
+    import time
+    from shell_session import ShellSession
+    
+    print("\n" + "=" * 60)
+    print("🐚 Testing Pooled Shell Session:")
+    print("-" * 33)
+    
+    shell = ShellSession.create()
+    if shell is None:
+        print("   ⚠️  No POSIX shell on this system; skipped")
+        return
+    
+    try:
+        # State set by one command must not reach the next
+        shell.run("export FOO=leaked; set -o noglob; alias ls=false; trap 'echo trapped' EXIT; cd /", 10)
+        result = shell.run('echo "[$FOO]"; echo *; pwd; alias ls', 10)
+        lines = result.stdout.splitlines()
+        isolated = (
+            len(lines) >= 3 and lines[0] == "[]" and lines[1] != "*"
+            and lines[2] == os.getcwd() and "trapped" not in result.stdout and result.returncode != 0
+        )
+        print(f"   {'✅' if isolated else '❌'} Variables, options, aliases, traps and cd stay contained")
+        
+        streamed = []
+        bounded = ShellSession(max_lines=2)
+        try:
+            result = bounded.run('echo one; echo two; printf three', 10, on_output=streamed.append)
+        finally:
+            bounded.close()
+        kept = streamed == ["one", "two", "three"] and result.stdout == "two\nthree"
+        print(f"   {'✅' if kept else '❌'} Lines stream to on_output and only the last max_lines are kept")
+        
+        result = shell.run("exit 3", 10)
+        after = shell.run("echo alive", 10)
+        survived = result.returncode == 3 and after.returncode == 0 and after.stdout == "alive"
+        print(f"   {'✅' if survived else '❌'} 'exit' ends only its own command")
+        
+        # A timed-out command's background children die with it
+        with tempfile.TemporaryDirectory() as tmp:
+            pid_file = os.path.join(tmp, "pid")
+            try:
+                shell.run(f"sleep 300 & echo $! > {pid_file}; sleep 100", 2)
+                timed_out = False
+            except subprocess.TimeoutExpired:
+                timed_out = True
+            with open(pid_file) as f:
+                pid = int(f.read())
+            for _ in range(50):
+                try:
+                    os.kill(pid, 0)
+                except ProcessLookupError:
+                    orphaned = False
+                    break
+                time.sleep(0.1)
+            else:
+                orphaned = True
+                os.kill(pid, 9)
+        print(f"   {'✅' if timed_out and not orphaned else '❌'} Timeout kills the command and its background jobs")
+        
+        result = shell.run("echo restarted", 10)
+        print(f"   {'✅' if result.returncode == 0 and result.stdout == 'restarted' else '❌'} Next command runs in a fresh shell")
+    finally:
+        shell.close()
+
+def test_semantic_cache_arguments():
+    """Check that the semantic prompt cache never reuses a command for other arguments"""
+    from ainux_llm import PromptCache
+    
+    print("\n" + "=" * 60)
+    print("🗂️  Testing Semantic Cache Argument Safety:")
+    print("-" * 42)
+    
+    # (cached prompt, cached command, new prompt, may the command be reused)
+    cases = [
+        ("find files larger than 100mb", "find . -size +100M", "find files larger than 500mb", False),
+        ("find files larger than 100mb", "find . -size +100M", "find files bigger than 100mb", True),
+        ("find files larger than 100mb", "find . -size +100M", "find large files", False),
+        ("create folder reports", "mkdir reports", "create folder invoices", False),
+        ("show the contents of notes.txt", "cat notes.txt", "show the contents of todo.txt", False),
+        ("list files in ~/docs", "ls -la ~/docs", "list the files in ~/music", False),
+        ("show disk usage", "df -h", "display disk usage", True),
+    ]
+    
+    for cached_prompt, command, prompt, expected in cases:
+        reused = PromptCache.same_arguments(cached_prompt, command, prompt)
+        status = "✅" if reused == expected else "❌"
+        print(f"   {status} '{prompt}' {'reuses' if reused else 'skips'} '{command}'")
+
+def test_request_batching():
+    """Check that BatchingGeminiLLM answers concurrent requests with one call"""
+    import asyncio
+    from ainux_llm import AiNuxLLM, BatchingGeminiLLM, GeminiConfig, GeminiLLM
+    
+    print("\n" + "=" * 60)
+    print("📦 Testing Request Batching:")
+    print("-" * 30)
+    
+    class RecordingGemini(GeminiLLM):
+        """GeminiLLM that answers from a script instead of the network"""
+        
+        def __init__(self, batch_reply):
+            self.config = GeminiConfig(api_key="test")
+            self.available = True
+            self.batch_reply = batch_reply
+            self.batch_prompts = []
+            self.single_requests = []
+        
+        def _get_system_instruction(self, platform):
+            return "instructions"
+        
+        async def _post_prompt(self, prompt, max_output_tokens, system_instruction=None, timeout=None):
+            self.batch_prompts.append(prompt)
+            return self.batch_reply
+        
+        async def generate_command_async(self, user_input, platform):
+            self.single_requests.append(user_input)
+            return f"echo {user_input.split()[-1]}"
+        
+        async def aclose(self):
+            pass
+    
+    inputs = ["show disk usage", "list all files", "who is logged in"]
+    
+    async def ask(llm):
+        batcher = BatchingGeminiLLM(llm)
+        try:
+            return await asyncio.gather(*(batcher.generate_command_async(q, "linux") for q in inputs))
+        finally:
+            await batcher.aclose()
+    
+    llm = RecordingGemini("1: df -h\n2: ls -la\n3: who")
+    commands = asyncio.run(ask(llm))
+    batched = commands == ["df -h", "ls -la", "who"] and len(llm.batch_prompts) == 1 and not llm.single_requests
+    print(f"   {'✅' if batched else '❌'} {len(inputs)} concurrent requests -> {len(llm.batch_prompts)} call: {commands}")
+    
+    # Answers missing from the batch reply are requested one at a time
+    llm = RecordingGemini("1: df -h\n3: who")
+    commands = asyncio.run(ask(llm))
+    retried = commands == ["df -h", "echo files", "who"] and llm.single_requests == ["list all files"]
+    print(f"   {'✅' if retried else '❌'} Missing answers are retried individually: {commands}")
+    
+    ainux = AiNuxLLM(use_llm=True, gemini_config=GeminiConfig(api_key="", batch_requests=True))
+    wired = isinstance(ainux._async_llm, BatchingGeminiLLM) and ainux._async_llm.llm is ainux.llm
+    print(f"   {'✅' if wired else '❌'} batch_requests routes AiNuxLLM's async requests through the batcher")
+
 def show_gemini_setup_guide():
     """Display setup instructions for Gemini API"""
     print("\n" + "🤖 Google Gemini Setup Guide for AiNux LLM Enhanced")
@@ -159,4 +371,8 @@ if __name__ == "__main__":
         show_gemini_setup_guide()
     else:
         test_ainux_llm()
+        test_pattern_union()
+        test_shell_session()
+        test_semantic_cache_arguments()
+        test_request_batching()
         print("\n💡 For Gemini setup guide, run: python test_ainux_llm.py --setup")
\ No newline at end of file
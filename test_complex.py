@@ -5,9 +5,10 @@ Test script for enhanced AiNux LLM with complex natural language queries
 
 import sys
 import os
+import asyncio
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from ainux_llm import AiNuxLLM, OllamaConfig
+from ainux_llm import AiNuxLLM, GeminiConfig
 
 def test_complex_queries():
     """Test AiNux with complex and varied natural language inputs"""
@@ -15,9 +16,9 @@ def test_complex_queries():
     print("🧪 Testing Enhanced AiNux with Complex Queries")
     print("=" * 55)
     
-    # Initialize with your current config
-    config = OllamaConfig(host="http://localhost:20555", model="qwen3:4b")
-    ainux = AiNuxLLM(use_llm=True, ollama_config=config)
+    # Initialize with the Gemini config from .env; the concurrent queries below
+    # are sent to Gemini in batches
+    ainux = AiNuxLLM.get_shared(use_llm=True, gemini_config=GeminiConfig(batch_requests=True))
     
     # Complex test cases that should work now
     complex_test_cases = [
@@ -63,12 +64,18 @@ def test_complex_queries():
     successful_regex = 0
     total_tests = len(complex_test_cases)
     
-    for i, test_input in enumerate(complex_test_cases, 1):
+    # Parse every query concurrently; the LLM requests share one connection pool
+    async def parse_all():
+        try:
+            return await asyncio.gather(*(ainux.parse_natural_language_async(q) for q in complex_test_cases))
+        finally:
+            await ainux.aclose()
+    
+    commands = asyncio.run(parse_all())
+    
+    for i, (test_input, command) in enumerate(zip(complex_test_cases, commands), 1):
         print(f"\n{i:2d}. Testing: '{test_input}'")
         
-        # Parse with the enhanced system
-        command = ainux.parse_natural_language(test_input)
-        
         if command:
             is_safe = ainux.is_command_safe(command)
             status = "✅ SAFE" if is_safe else "🚫 BLOCKED"
@@ -94,7 +101,7 @@ def test_complex_queries():
                 result = ainux.execute_command(command)
                 if result['success']:
                     # Show first 3 lines of output
-                    output_lines = result['output'].split('\n')[:3]
+                    output_lines = result['output'].split('\n', 3)[:3]
                     print(f"    📋 Sample Output: {' | '.join(output_lines)}")
                 else:
                     print(f"    ❌ Execution failed: {result['error']}")
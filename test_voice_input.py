@@ -1,9 +1,43 @@
 #!/usr/bin/env python3
 """
 Quick smoke test for voice_input module.
-Does not record audio; only imports and reports availability.
+Does not record audio; only imports, reports availability and checks
+transcript post-processing.
 """
 
+
+def test_command_splitting(voice_input):
+    """Check how listen_multi splits a combined transcript into commands."""
+    cases = {
+        "delete notes.txt then list files": ["delete notes.txt", "list files"],
+        "cd .. then ls": ["cd ..", "ls"],
+        "show python3.11 version": ["show python3.11 version"],
+        "open browser. list files": ["open browser", "list files"],
+        "make folder then go there and then list": ["make folder", "go there", "list"],
+        "what time is it? exit": ["what time is it", "exit"],
+    }
+    for text, expected in cases.items():
+        parts = voice_input._split_commands(text)
+        status = "OK" if parts == expected else f"FAILED (expected {expected})"
+        print(f"split {text!r} -> {parts}: {status}")
+
+
+def test_command_snapping(voice_input):
+    """Check that transcripts only snap to a known command when they are close to all of it."""
+    commands = ["list files", "open browser", "show disk usage"]
+    cases = {
+        "opens browser": "open browser",
+        "list file": "list files",
+        "list files in downloads": "list files in downloads",
+        "show disk usage of home": "show disk usage of home",
+        "what time is it": "what time is it",
+    }
+    for text, expected in cases.items():
+        snapped = voice_input._snap_to_command(text, commands)
+        status = "OK" if snapped == expected else f"FAILED (expected {expected!r})"
+        print(f"snap {text!r} -> {snapped!r}: {status}")
+
+
 if __name__ == "__main__":
     try:
         import voice_input
@@ -11,3 +45,6 @@ if __name__ == "__main__":
         print("voice_input import: OK", "API found" if has_api else "API missing")
     except Exception as e:
         print("voice_input import failed:", e)
+    else:
+        test_command_splitting(voice_input)
+        test_command_snapping(voice_input)
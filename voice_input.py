@@ -5,38 +5,555 @@ Provides a simple API to capture audio from the microphone and transcribe
 to text using SpeechRecognition (Google Web Speech API). Designed to work
 on Windows with graceful errors when dependencies or microphone are missing.
 
-Optional: If you install Vosk and a model, you can switch to offline mode.
+Optional: If you install Vosk and a model (or pywhispercpp), you can switch to
+offline recognition with backend="vosk"/"whisper" or AINUX_VOICE_BACKEND.
 
 Primary API:
 	listen_for_command(timeout: float | None = 5, phrase_time_limit: float | None = 8,
-					   language: str = "en-US") -> str | None
+					   language: str = "en-US", device_index: int | None = None,
+					   backend: str | None = None) -> str | None
 
 Returns the recognized text (lowercased) or None if nothing understood.
 """
 
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import atexit
+import contextlib
+import difflib
+import functools
+import io
+import json
+import math
+import os
+import re
+import threading
+import time
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+try:
+	import requests
+	from requests.adapters import HTTPAdapter
+except ImportError:
+	requests = None
+
+try:
+	import soundfile  # type: ignore
+except ImportError:
+	soundfile = None
+
+try:
+	import noisereduce  # type: ignore
+except ImportError:
+	noisereduce = None
+
+try:
+	from rapidfuzz import fuzz, process  # type: ignore
+except ImportError:
+	process = None
+
+try:
+	import webrtcvad  # type: ignore
+except ImportError:
+	webrtcvad = None
+
+try:
+	import pvporcupine  # type: ignore
+except ImportError:
+	pvporcupine = None
 
 
 class VoiceInputError(RuntimeError):
 	"""Raised when voice input cannot be initialized or used."""
 
 
+# Recognition backends; the offline ones fall back to Google when their
+# package or model is unavailable
+_BACKENDS = ("google", "vosk", "whisper")
+VOICE_BACKEND = os.getenv("AINUX_VOICE_BACKEND", "google").strip().lower()
+
+# Vosk model directory (defaults to the small English model, downloaded once)
+VOSK_MODEL_PATH = os.getenv("VOSK_MODEL_PATH")
+
+# whisper.cpp model name or path for the "whisper" backend
+WHISPER_MODEL = os.getenv("AINUX_WHISPER_MODEL", "base.en")
+
+# Seconds to wait for the Google Web Speech API
+GOOGLE_TIMEOUT = 10
+
+# Sample rate (16-bit mono) audio is converted to before any recognition
+_RECOGNITION_RATE = 16000
+
+# Minimum similarity (0-100) for snapping a transcript to a known command
+COMMAND_MATCH_THRESHOLD = 80
+
+# listen_multi(): silence inserted between joined phrases, and what separates
+# commands in the combined transcript: sentence punctuation right after a word
+# and before a space or the end (not the dots in "notes.txt", "..", "3.11"),
+# or the word "then" / "and then"
+_PHRASE_JOIN_MS = 200
+_COMMAND_SEPARATORS = re.compile(r"\s*(?:(?<=\w)[.;!?](?=\s|$)|\b(?:and\s+)?then\b)\s*")
+
+# Calibrated energy_threshold above which the room counts as noisy and the
+# capture is run through noisereduce (stationary spectral gating) first
+NOISY_ENERGY_THRESHOLD = 400
+
+# WebRTC VAD settings for trimming silence before recognition: aggressiveness
+# (0-3), frame length in bytes (30 ms of 16 kHz 16-bit), and the least speech
+# (0.3 s) worth sending to a recognizer
+VAD_AGGRESSIVENESS = 2
+_VAD_FRAME_BYTES = _RECOGNITION_RATE * 2 * 30 // 1000
+_VAD_MIN_SPEECH_BYTES = _RECOGNITION_RATE * 2 * 3 // 10
+
+# Microphone capture format: 16 kHz is what the recognizers use anyway, and
+# smaller reads let listen() see speech onset sooner (512 frames = 32 ms).
+# Slower machines keep SpeechRecognition's 1024-frame default.
+VOICE_SAMPLE_RATE = 16000
+VOICE_CHUNK = 512 if (os.cpu_count() or 1) >= 4 else 1024
+
+# Wake word for WakeWordListener (a Porcupine built-in keyword), the Picovoice
+# access key Porcupine requires, and seconds of audio kept from before the
+# trigger so words spoken right after the wake word are not cut off
+WAKE_WORD = os.getenv("AINUX_WAKE_WORD", "computer")
+PORCUPINE_ACCESS_KEY = os.getenv("PORCUPINE_ACCESS_KEY")
+WAKE_PREROLL = 2.0
+
+# Whether pyaudio imported successfully (None until first checked)
+_PYAUDIO_OK: Optional[bool] = None
+
+# Indexes of PortAudio devices that can record, queried once: enumerating
+# devices initializes and tears down PortAudio
+_INPUT_DEVICES: Optional[frozenset] = None
+
+# Seconds a microphone's ambient-noise calibration stays valid, and how long
+# each calibration samples the room
+CALIBRATION_INTERVAL = 60
+CALIBRATION_DURATION = 0.1
+
+# End-of-utterance tuning (seconds): silence that ends a phrase, silence kept
+# around it, and the shortest sound treated as speech. These replace
+# SpeechRecognition's 0.8/0.5/0.3 defaults so listen() returns sooner.
+PAUSE_THRESHOLD = 0.3
+NON_SPEAKING_DURATION = 0.2
+PHRASE_THRESHOLD = 0.2
+
+# Weight of each capture's noise floor in the running energy_threshold average
+ENERGY_EMA_WEIGHT = 0.1
+
+# Recognizers and opened microphones, kept across calls per device_index so
+# PortAudio streams are not re-opened (and re-calibrated) for every utterance
+_RECOGNIZERS: Dict[Optional[int], object] = {}
+_MIC_CACHE: Dict[Optional[int], object] = {}
+_LAST_CALIBRATION: Dict[Optional[int], float] = {}
+
+# Guards the caches above and the microphone itself, which only one caller
+# can record from at a time
+_LOCK = threading.Lock()
+
+# Single worker for submit_listen(): the microphone is one hardware resource
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voice_input")
+
+
+@functools.lru_cache(maxsize=None)
 def _try_import_sr():
 	try:
 		import speech_recognition as sr  # type: ignore
 		return sr
-	except Exception as e:
+	except ImportError:
 		return None
 
 
-def _has_microphone(sr_module) -> bool:
+def _pyaudio_available() -> bool:
+	global _PYAUDIO_OK
+	if _PYAUDIO_OK is None:
+		try:
+			# Importing pyaudio ensures backend availability when needed.
+			import pyaudio  # noqa: F401  # type: ignore
+			_PYAUDIO_OK = True
+		except ImportError:
+			_PYAUDIO_OK = False
+	return _PYAUDIO_OK
+
+
+def _input_devices() -> Optional[frozenset]:
+	global _INPUT_DEVICES
+	if _INPUT_DEVICES is None and _pyaudio_available():
+		import pyaudio  # type: ignore
+		pa = pyaudio.PyAudio()
+		try:
+			_INPUT_DEVICES = frozenset(
+				i for i in range(pa.get_device_count())
+				if pa.get_device_info_by_index(i).get("maxInputChannels", 0) > 0
+			)
+		finally:
+			pa.terminate()
+	return _INPUT_DEVICES
+
+
+def _has_microphone(device_index: Optional[int] = None) -> bool:
 	try:
-		# Try to access microphones list
-		return len(sr_module.Microphone.list_microphone_names() or []) > 0
-	except Exception:
+		devices = _input_devices()
+	except (OSError, AttributeError):
+		devices = None
+	if devices is None:
 		return True  # If listing fails, assume there may be a default mic
+	return device_index in devices if device_index is not None else bool(devices)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_offline_model(backend: str):
+	"""Load the Vosk/whisper.cpp model once; None if it is unavailable."""
+	try:
+		if backend == "vosk":
+			from vosk import Model, SetLogLevel  # type: ignore
+			SetLogLevel(-1)
+			return Model(VOSK_MODEL_PATH) if VOSK_MODEL_PATH else Model(lang="en-us")
+		if backend == "whisper":
+			from pywhispercpp.model import Model  # type: ignore
+			return Model(WHISPER_MODEL)
+	except Exception:
+		# Vosk reports a missing or broken model as a plain Exception
+		pass
+	return None
+
+
+def _transcribe_offline(backend: str, model, audio, commands: Optional[Sequence[str]] = None) -> str:
+	pcm = audio.get_raw_data(convert_rate=_RECOGNITION_RATE, convert_width=2)
+	if backend == "vosk":
+		from vosk import KaldiRecognizer  # type: ignore
+		if commands:
+			# Restrict decoding to the command vocabulary ("[unk]" for anything else)
+			grammar = json.dumps([c.lower() for c in commands] + ["[unk]"])
+			rec = KaldiRecognizer(model, _RECOGNITION_RATE, grammar)
+		else:
+			rec = KaldiRecognizer(model, _RECOGNITION_RATE)
+		rec.AcceptWaveform(pcm)
+		return json.loads(rec.FinalResult()).get("text", "")
+	samples = np.frombuffer(pcm, np.int16).astype(np.float32) / 32768
+	return " ".join(segment.text for segment in model.transcribe(samples))
+
+
+@functools.lru_cache(maxsize=None)
+def _google_api():
+	"""SpeechRecognition's Google request builder and parser (3.10.4+), or None on older releases."""
+	try:
+		from speech_recognition.recognizers import google  # type: ignore
+	except ImportError:
+		return None
+	if not all(hasattr(google, name) for name in ("create_request_builder", "ENDPOINT", "OutputParser")):
+		return None
+	return google
+
+
+@functools.lru_cache(maxsize=None)
+def _google_session():
+	"""Keep-alive HTTP session shared by all Google recognition requests."""
+	session = requests.Session()
+	session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+	session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+	return session
+
+
+def _flac_payload(builder, audio):
+	"""
+	FLAC-encode audio for Google, in-process when soundfile is installed.
+
+	Returns:
+		(flac bytes, request headers). Without soundfile (or numpy) this is
+		SpeechRecognition's encoding, which runs the bundled flac binary.
+	"""
+	if soundfile is None or np is None:
+		return builder.build_data(audio), builder.build_headers(audio)
+	samples = np.frombuffer(audio.get_raw_data(convert_rate=_RECOGNITION_RATE, convert_width=2), np.int16)
+	buf = io.BytesIO()
+	soundfile.write(buf, samples, _RECOGNITION_RATE, format="FLAC")
+	return buf.getvalue(), {"Content-Type": f"audio/x-flac; rate={_RECOGNITION_RATE}"}
+
+
+def _recognize_google_pooled(audio, language: str) -> str:
+	"""
+	Recognizer.recognize_google over a reused connection.
+
+	SpeechRecognition's own request builder and response parser are used;
+	the transport changes from a fresh urlopen() to the shared session, and
+	FLAC encoding happens in-process when possible. Callers check
+	_google_api() first; older SpeechRecognition releases lack these pieces.
+
+	Raises:
+		speech_recognition.RequestError: On network or HTTP errors.
+		speech_recognition.UnknownValueError: If nothing was understood.
+	"""
+	from speech_recognition.exceptions import RequestError
+
+	google = _google_api()
+	builder = google.create_request_builder(endpoint=google.ENDPOINT, language=language)
+	flac, headers = _flac_payload(builder, audio)
+	try:
+		response = _google_session().post(
+			builder.build_url(), data=flac, headers=headers, timeout=GOOGLE_TIMEOUT,
+		)
+		response.raise_for_status()
+	except requests.RequestException as e:
+		raise RequestError(f"recognition request failed: {e}")
+	return google.OutputParser(show_all=False, with_confidence=False).parse(response.text)
+
+
+def _snap_to_command(text: str, commands: Sequence[str]) -> str:
+	"""Replace ``text`` with the closest of ``commands`` if it is similar enough.
+
+	Both paths score the whole string (rapidfuzz's ratio and difflib's ratio agree
+	closely), so a transcript that only contains a command is left alone.
+	"""
+	choices = [c.lower() for c in commands]
+	if process is not None:
+		match = process.extractOne(text, choices, scorer=fuzz.ratio, score_cutoff=COMMAND_MATCH_THRESHOLD)
+		return match[0] if match else text
+	matches = difflib.get_close_matches(text, choices, n=1, cutoff=COMMAND_MATCH_THRESHOLD / 100)
+	return matches[0] if matches else text
+
+
+def _recognize(
+	sr_module, recognizer, audio, language: str, backend: str,
+	commands: Optional[Sequence[str]] = None,
+) -> Optional[str]:
+	"""Transcribe captured audio with ``backend``, falling back to Google."""
+	model = _get_offline_model(backend) if backend != "google" else None
+	if model is not None:
+		try:
+			text = _transcribe_offline(backend, model, audio, commands).replace("[unk]", "")
+			text = " ".join(text.lower().split())
+			return (_snap_to_command(text, commands) if commands and text else text) or None
+		except Exception:
+			# Fall through to the online recognizer
+			pass
+
+	# Recognize using Google's free web API (requires internet)
+	try:
+		if requests is not None and _google_api() is not None:
+			text = _recognize_google_pooled(audio, language)
+		else:
+			text = recognizer.recognize_google(audio, language=language)
+		text = text.strip().lower() if text else None
+		return _snap_to_command(text, commands) if commands and text else text
+	except sr_module.UnknownValueError:
+		return None
+	except sr_module.RequestError as e:
+		# Network or quota error. Gracefully return None; caller can handle.
+		return None
+
+
+def _to_recognition_format(sr_module, audio):
+	"""Convert captured audio to 16 kHz 16-bit once; a no-op for the tuned microphone."""
+	if audio.sample_rate == _RECOGNITION_RATE and audio.sample_width == 2:
+		return audio
+	return sr_module.AudioData(
+		audio.get_raw_data(convert_rate=_RECOGNITION_RATE, convert_width=2), _RECOGNITION_RATE, 2)
+
+
+def _denoise(sr_module, audio):
+	"""Remove stationary background noise (fans, hum) from 16 kHz audio if noisereduce is installed."""
+	if noisereduce is None or np is None:
+		return audio
+	samples = np.frombuffer(audio.get_raw_data(), np.int16).astype(np.float32)
+	clean = noisereduce.reduce_noise(y=samples, sr=_RECOGNITION_RATE, stationary=True)
+	pcm = np.clip(clean, -32768, 32767).astype(np.int16).tobytes()
+	return sr_module.AudioData(pcm, _RECOGNITION_RATE, 2)
+
+
+def _trim_silence(sr_module, audio):
+	"""
+	Drop non-speech 30 ms frames from captured audio using WebRTC VAD.
+
+	Returns:
+		The trimmed 16 kHz AudioData, the original audio if webrtcvad is not
+		installed, or None if too little speech remains.
+	"""
+	if webrtcvad is None:
+		return audio
+	vad = webrtcvad.Vad(VAD_AGGRESSIVENESS)
+	pcm = audio.get_raw_data(convert_rate=_RECOGNITION_RATE, convert_width=2)
+	voiced = b"".join(
+		pcm[i:i + _VAD_FRAME_BYTES]
+		for i in range(0, len(pcm) - _VAD_FRAME_BYTES + 1, _VAD_FRAME_BYTES)
+		if vad.is_speech(pcm[i:i + _VAD_FRAME_BYTES], _RECOGNITION_RATE)
+	)
+	if len(voiced) < _VAD_MIN_SPEECH_BYTES:
+		return None
+	return sr_module.AudioData(voiced, _RECOGNITION_RATE, 2)
+
+
+def _rms(pcm: bytes) -> float:
+	"""RMS level of 16-bit PCM (numpy required)."""
+	samples = np.frombuffer(pcm, np.int16).astype(np.int64)
+	return float(np.sqrt((samples * samples).mean())) if len(samples) else 0.0
+
+
+def _noise_floor(audio, frame_ms: int = 30) -> Optional[float]:
+	"""RMS of the quietest frame of a capture (its pre-speech lead-in), or None if too short."""
+	raw = audio.get_raw_data(convert_width=2)
+	frame = audio.sample_rate * frame_ms // 1000
+	if np is not None:
+		# One vectorized pass: whole frames as rows, mean square per row
+		count = len(raw) // 2 // frame
+		if not count:
+			return None
+		frames = np.frombuffer(raw, np.int16, count * frame).astype(np.int64).reshape(count, frame)
+		return float(np.sqrt((frames * frames).mean(axis=1).min()))
+	samples = array("h", raw)
+	levels = [
+		math.sqrt(sum(x * x for x in samples[i:i + frame]) / frame)
+		for i in range(0, len(samples) - frame + 1, frame)
+	]
+	return min(levels) if levels else None
+
+
+def _update_energy_threshold(recognizer, audio) -> None:
+	"""Track the room's noise level between calibrations with an exponential moving average."""
+	floor = _noise_floor(audio)
+	if floor is not None:
+		target = floor * recognizer.dynamic_energy_ratio
+		recognizer.energy_threshold = (
+			(1 - ENERGY_EMA_WEIGHT) * recognizer.energy_threshold + ENERGY_EMA_WEIGHT * target
+		)
+
+
+def _get_source(sr_module, device_index: Optional[int]):
+	"""Return an opened microphone for ``device_index``, opening it on first use."""
+	source = _MIC_CACHE.get(device_index)
+	if source is None:
+		source = sr_module.Microphone(
+			device_index=device_index, sample_rate=VOICE_SAMPLE_RATE, chunk_size=VOICE_CHUNK,
+		).__enter__()
+		_MIC_CACHE[device_index] = source
+	return source
+
+
+def _release_source(device_index: Optional[int]) -> None:
+	source = _MIC_CACHE.pop(device_index, None)
+	_LAST_CALIBRATION.pop(device_index, None)
+	if source is not None:
+		try:
+			source.__exit__(None, None, None)
+		except OSError:
+			pass
+
+
+def close_voice_input() -> None:
+	"""Close any microphones kept open by listen_for_command."""
+	with _LOCK:
+		for device_index in list(_MIC_CACHE):
+			_release_source(device_index)
+		_RECOGNIZERS.clear()
+
+
+atexit.register(close_voice_input)
+
+
+def _require_microphone(device_index: Optional[int]):
+	"""
+	Return the speech_recognition module once capture is known to be possible.
+
+	Raises:
+		VoiceInputError: If SpeechRecognition or microphone is unavailable.
+	"""
+	sr = _try_import_sr()
+	if sr is None:
+		raise VoiceInputError(
+			"SpeechRecognition is not installed. Install with: pip install SpeechRecognition"
+		)
+
+	# Try importing PyAudio lazily (once); not strictly required here. We'll
+	# still attempt to open the microphone; if it fails, raise a helpful error.
+	_pyaudio_available()
+
+	if not _has_microphone(device_index):
+		raise VoiceInputError("No microphone detected. Please connect a microphone and try again.")
+	return sr
+
+
+def _check_backend(backend: Optional[str]) -> str:
+	backend = (backend or VOICE_BACKEND).lower()
+	if backend not in _BACKENDS:
+		raise ValueError(f"Unknown voice backend {backend!r}; expected one of {', '.join(_BACKENDS)}")
+	return backend
+
+
+def _microphone_error(e: Exception) -> VoiceInputError:
+	# Provide actionable guidance for Windows + PyAudio
+	return VoiceInputError(
+		"Failed to access microphone. On Windows, install PyAudio. "
+		"If 'pip install pyaudio' fails, try: 'pip install pipwin' then 'pipwin install pyaudio'.\n"
+		f"Underlying error: {e}"
+	)
+
+
+def _get_recognizer(sr_module, device_index: Optional[int]):
+	"""
+	Return the recognizer for a device, creating it on first use.
+
+	Must be called with _LOCK held.
+	"""
+	recognizer = _RECOGNIZERS.get(device_index)
+	if recognizer is None:
+		recognizer = _RECOGNIZERS[device_index] = sr_module.Recognizer()
+		# The threshold is set by calibration and averaged per capture instead
+		# of being recomputed for every chunk while waiting for speech
+		recognizer.dynamic_energy_threshold = False
+	return recognizer
+
+
+def _prepare_capture(
+	sr_module, device_index: Optional[int],
+	pause_threshold: float, non_speaking_duration: float, phrase_threshold: float,
+):
+	"""
+	Return the cached (recognizer, opened source) for a device, calibrated if due.
+
+	Must be called with _LOCK held.
+	"""
+	recognizer = _get_recognizer(sr_module, device_index)
+	recognizer.pause_threshold = pause_threshold
+	recognizer.non_speaking_duration = non_speaking_duration
+	recognizer.phrase_threshold = phrase_threshold
+
+	source = _get_source(sr_module, device_index)
+	# Reduce noise impact; the calibration is reused for a while
+	now = time.monotonic()
+	last = _LAST_CALIBRATION.get(device_index)
+	if last is None or now - last >= CALIBRATION_INTERVAL:
+		try:
+			recognizer.adjust_for_ambient_noise(source, duration=CALIBRATION_DURATION)
+			_LAST_CALIBRATION[device_index] = now
+		except (sr_module.WaitTimeoutError, OSError):
+			# Non-fatal; continue
+			pass
+	return recognizer, source
+
+
+def _transcribe_capture(
+	sr_module, recognizer, audio, language: str, backend: str,
+	commands: Optional[Sequence[str]] = None,
+) -> Optional[str]:
+	"""Clean up a capture and recognize it."""
+	captured = audio = _to_recognition_format(sr_module, audio)
+	if recognizer.energy_threshold > NOISY_ENERGY_THRESHOLD:
+		audio = _denoise(sr_module, audio)
+	audio = _trim_silence(sr_module, audio)
+	if audio is None:
+		return None
+
+	text = _recognize(sr_module, recognizer, audio, language, backend, commands)
+	if text:
+		_update_energy_threshold(recognizer, captured)
+	return text
 
 
 def listen_for_command(
@@ -44,6 +561,11 @@ def listen_for_command(
 	phrase_time_limit: Optional[float] = 8,
 	language: str = "en-US",
 	device_index: Optional[int] = None,
+	backend: Optional[str] = None,
+	pause_threshold: float = PAUSE_THRESHOLD,
+	non_speaking_duration: float = NON_SPEAKING_DURATION,
+	phrase_threshold: float = PHRASE_THRESHOLD,
+	commands: Optional[Sequence[str]] = None,
 ) -> Optional[str]:
 	"""
 	Capture audio from the default microphone and transcribe to text.
@@ -53,66 +575,409 @@ def listen_for_command(
 		phrase_time_limit: Max seconds for a single phrase (None for unlimited)
 		language: BCP-47 language code for recognition (default en-US)
 		device_index: Optional microphone device index
+		backend: "google", "vosk" or "whisper" (default AINUX_VOICE_BACKEND)
+		pause_threshold: Seconds of silence that end a phrase
+		non_speaking_duration: Seconds of silence kept on both sides of a phrase
+		phrase_threshold: Minimum seconds of speaking audio to count as a phrase
+		commands: Optional known commands; a close transcript is snapped to the
+			matching command (and Vosk decodes only this vocabulary)
 
 	Returns:
 		Recognized text (lowercased) or None if not understood / timed out.
 
 	Raises:
 		VoiceInputError: If SpeechRecognition or microphone is unavailable.
+		ValueError: If backend is not a known recognizer.
 	"""
-	sr = _try_import_sr()
-	if sr is None:
-		raise VoiceInputError(
-			"SpeechRecognition is not installed. Install with: pip install SpeechRecognition"
-		)
+	backend = _check_backend(backend)
+	sr = _require_microphone(device_index)
 
-	# Try importing PyAudio lazily; not strictly required to import here,
-	# but we can hint if microphone open fails later.
-	try:
-		# Importing pyaudio ensures backend availability when needed.
-		import pyaudio  # noqa: F401  # type: ignore
-	except Exception:
-		# We'll still attempt to open microphone; if it fails, raise a helpful error.
-		pass
+	with _LOCK:
+		try:
+			recognizer, source = _prepare_capture(
+				sr, device_index, pause_threshold, non_speaking_duration, phrase_threshold)
+			audio = recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+		except sr.WaitTimeoutError:
+			return None
+		except Exception as e:
+			# Drop the (possibly broken) stream so the next call re-opens it
+			_release_source(device_index)
+			raise _microphone_error(e)
 
-	if not _has_microphone(sr):
-		raise VoiceInputError("No microphone detected. Please connect a microphone and try again.")
+	return _transcribe_capture(sr, recognizer, audio, language, backend, commands)
 
-	recognizer = sr.Recognizer()
 
-	# Calibrate and listen from mic
-	try:
-		with sr.Microphone(device_index=device_index) as source:
-			# Reduce noise impact
-			try:
-				recognizer.adjust_for_ambient_noise(source, duration=0.5)
-			except Exception:
-				# Non-fatal; continue
-				pass
+def _split_commands(text: str) -> List[str]:
+	"""Split a combined transcript into its commands."""
+	return [part for part in _COMMAND_SEPARATORS.split(text) if part]
 
-			audio = recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
-	except sr.WaitTimeoutError:
-		return None
-	except Exception as e:
-		# Provide actionable guidance for Windows + PyAudio
-		raise VoiceInputError(
-			"Failed to access microphone. On Windows, install PyAudio. "
-			"If 'pip install pyaudio' fails, try: 'pip install pipwin' then 'pipwin install pyaudio'.\n"
-			f"Underlying error: {e}"
-		)
 
-	# Recognize using Google's free web API (requires internet)
+def listen_multi(
+	max_phrases: int = 3,
+	gap: float = 0.4,
+	timeout: Optional[float] = 5,
+	phrase_time_limit: Optional[float] = 8,
+	language: str = "en-US",
+	device_index: Optional[int] = None,
+	backend: Optional[str] = None,
+	commands: Optional[Sequence[str]] = None,
+) -> List[str]:
+	"""
+	Capture several back-to-back commands and recognize them in one request.
+
+	After the first phrase, listening continues while the next phrase starts
+	within ``gap`` seconds. The phrases are joined with short silences,
+	recognized together, and the transcript is split back into commands on
+	sentence punctuation and "then".
+
+	Args:
+		max_phrases: Maximum number of phrases to capture
+		gap: Max seconds of silence between phrases
+		timeout: Max seconds to wait for the first phrase to start
+		phrase_time_limit: Max seconds for each phrase (None for unlimited)
+		language: BCP-47 language code for recognition (default en-US)
+		device_index: Optional microphone device index
+		backend: "google", "vosk" or "whisper" (default AINUX_VOICE_BACKEND)
+		commands: Optional known commands each recognized command is snapped to
+
+	Returns:
+		Recognized commands (lowercased) in spoken order; empty if nothing was understood.
+
+	Raises:
+		VoiceInputError: If SpeechRecognition or microphone is unavailable.
+		ValueError: If backend is not a known recognizer.
+	"""
+	backend = _check_backend(backend)
+	sr = _require_microphone(device_index)
+
+	phrases: List[bytes] = []
+	with _LOCK:
+		try:
+			recognizer, source = _prepare_capture(
+				sr, device_index, PAUSE_THRESHOLD, NON_SPEAKING_DURATION, PHRASE_THRESHOLD)
+			while len(phrases) < max_phrases:
+				try:
+					audio = recognizer.listen(
+						source, timeout=gap if phrases else timeout, phrase_time_limit=phrase_time_limit)
+				except sr.WaitTimeoutError:
+					break
+				phrases.append(_to_recognition_format(sr, audio).get_raw_data())
+		except Exception as e:
+			_release_source(device_index)
+			raise _microphone_error(e)
+
+	if not phrases:
+		return []
+	silence = bytes(_RECOGNITION_RATE * 2 * _PHRASE_JOIN_MS // 1000)
+	audio = sr.AudioData(silence.join(phrases), _RECOGNITION_RATE, 2)
+	text = _transcribe_capture(sr, recognizer, audio, language, backend)
+	if not text:
+		return []
+	parts = _split_commands(text)
+	return [_snap_to_command(part, commands) for part in parts] if commands else parts
+
+
+def listen_for_command_stream(
+	timeout: Optional[float] = 5,
+	phrase_time_limit: Optional[float] = 8,
+	device_index: Optional[int] = None,
+) -> Iterator[str]:
+	"""
+	Recognize a command with Vosk, yielding partial transcripts as they change.
+
+	Args:
+		timeout: Max seconds to wait for speech to start (None to wait forever)
+		phrase_time_limit: Max seconds for the phrase (None for unlimited)
+		device_index: Optional microphone device index
+
+	Yields:
+		Growing partial transcripts; the last item is the final transcript.
+		Nothing is yielded if no speech starts before the timeout.
+
+	Raises:
+		VoiceInputError: If the microphone or a Vosk model is unavailable.
+	"""
+	sr = _require_microphone(device_index)
+	model = _get_offline_model("vosk")
+	if model is None:
+		raise VoiceInputError("Streaming recognition needs Vosk and a model: pip install vosk")
+	from vosk import KaldiRecognizer  # type: ignore
+
+	source, chunk = _read_stream_chunk(sr, device_index)
+	rec = KaldiRecognizer(model, source.SAMPLE_RATE)
+	seconds_per_chunk = source.CHUNK / source.SAMPLE_RATE
+	elapsed = 0.0
+	partial = ""
+	while True:
+		elapsed += seconds_per_chunk
+		if not partial and timeout and elapsed > timeout:
+			return
+		if phrase_time_limit and elapsed > phrase_time_limit:
+			final = json.loads(rec.FinalResult()).get("text", "")
+			break
+		if rec.AcceptWaveform(chunk):
+			final = json.loads(rec.Result()).get("text", "")
+			# An endpoint on leading silence is not the end of the command
+			if final or partial:
+				break
+		else:
+			current = json.loads(rec.PartialResult()).get("partial", "")
+			if current and current != partial:
+				partial = current
+				yield partial
+		_, chunk = _read_stream_chunk(sr, device_index)
+	final = final or partial
+	if final:
+		yield final
+
+
+def _read_stream_chunk(sr_module, device_index: Optional[int]):
+	"""
+	Read one chunk from the cached microphone for ``device_index``.
+
+	_LOCK is held only for the read, never across a yield of
+	listen_for_command_stream, so a consumer that stops early or captures
+	from its loop body does not block other callers.
+
+	Returns:
+		(source, chunk bytes)
+	"""
+	with _LOCK:
+		try:
+			source = _get_source(sr_module, device_index)
+			return source, source.stream.read(source.CHUNK)
+		except Exception as e:
+			_release_source(device_index)
+			raise VoiceInputError(f"Failed to access microphone.\nUnderlying error: {e}")
+
+
+async def listen_for_command_async(
+	timeout: Optional[float] = 5,
+	phrase_time_limit: Optional[float] = 8,
+	language: str = "en-US",
+	device_index: Optional[int] = None,
+	backend: Optional[str] = None,
+	**kwargs,
+) -> Optional[str]:
+	"""
+	Awaitable listen_for_command; capture and recognition run in a worker thread.
+
+	Args:
+		**kwargs: Further listen_for_command tuning arguments
+
+	Returns:
+		Recognized text (lowercased) or None if not understood / timed out.
+	"""
+	return await asyncio.to_thread(
+		listen_for_command, timeout, phrase_time_limit, language, device_index, backend, **kwargs)
+
+
+def submit_listen(**kwargs) -> "Future[Optional[str]]":
+	"""
+	Start listen_for_command in the background.
+
+	Args:
+		**kwargs: Passed through to listen_for_command
+
+	Returns:
+		Future resolving to the recognized text (or None). Calls are queued
+		on a single worker since there is only one microphone.
+	"""
+	return _EXECUTOR.submit(listen_for_command, **kwargs)
+
+
+class WakeWordListener:
+	"""
+	Background listener that transcribes whatever follows a wake word.
+
+	A daemon thread reads the microphone continuously into a ring buffer of
+	the last WAKE_PREROLL seconds. When Porcupine detects the wake word, the
+	ring is spliced in front of the phrase recorded after it and the result
+	is recognized like listen_for_command, then passed to ``on_command``.
+
+	The device's recognizer (and its calibrated energy threshold) is shared
+	with listen_for_command. If the thread fails, stop() raises the error.
+	"""
+
+	def __init__(
+		self,
+		on_command: Callable[[str], None],
+		keyword: str = WAKE_WORD,
+		device_index: Optional[int] = None,
+		language: str = "en-US",
+		backend: Optional[str] = None,
+		phrase_time_limit: float = 8,
+		pause_threshold: float = PAUSE_THRESHOLD,
+	):
+		self.on_command = on_command
+		self.keyword = keyword
+		self.device_index = device_index
+		self.language = language
+		self.backend = (backend or VOICE_BACKEND).lower()
+		self.phrase_time_limit = phrase_time_limit
+		self.pause_threshold = pause_threshold
+		self._stop = threading.Event()
+		self._thread: Optional[threading.Thread] = None
+		self._error: Optional[Exception] = None
+
+	def start(self) -> None:
+		"""
+		Start listening in the background.
+
+		Raises:
+			VoiceInputError: If pvporcupine, numpy, pyaudio, SpeechRecognition
+				or a Porcupine access key is missing.
+		"""
+		if pvporcupine is None or np is None:
+			raise VoiceInputError("Wake word detection needs: pip install pvporcupine numpy")
+		if not PORCUPINE_ACCESS_KEY:
+			raise VoiceInputError("Set PORCUPINE_ACCESS_KEY to use wake word detection.")
+		if _try_import_sr() is None or not _pyaudio_available():
+			raise VoiceInputError("Wake word detection needs SpeechRecognition and PyAudio.")
+		self._stop.clear()
+		self._error = None
+		self._thread = threading.Thread(target=self._run, name="voice_input-wake", daemon=True)
+		self._thread.start()
+
+	def stop(self) -> None:
+		"""
+		Stop the background thread and release the microphone.
+
+		Raises:
+			VoiceInputError: If the thread had stopped on an error (e.g. Porcupine
+				or the audio stream failed to start, or a read failed).
+		"""
+		self._stop.set()
+		if self._thread is not None:
+			self._thread.join()
+			self._thread = None
+		error, self._error = self._error, None
+		if error is not None:
+			raise VoiceInputError(f"Wake word listener failed: {error}") from error
+
+	def _run(self) -> None:
+		try:
+			self._listen()
+		except Exception as e:
+			# Kept for stop() rather than lost with the thread
+			self._error = e
+
+	def _listen(self) -> None:
+		import pyaudio  # type: ignore
+		sr = _try_import_sr()
+		with contextlib.ExitStack() as cleanup:
+			porcupine = pvporcupine.create(access_key=PORCUPINE_ACCESS_KEY, keywords=[self.keyword])
+			cleanup.callback(porcupine.delete)
+			rate, frame_length = porcupine.sample_rate, porcupine.frame_length
+			pa = pyaudio.PyAudio()
+			cleanup.callback(pa.terminate)
+			stream = pa.open(
+				rate=rate, channels=1, format=pyaudio.paInt16, input=True,
+				frames_per_buffer=frame_length, input_device_index=self.device_index,
+			)
+			cleanup.callback(stream.close)
+			cleanup.callback(stream.stop_stream)
+
+			with _LOCK:
+				recognizer = _get_recognizer(sr, self.device_index)
+				calibrated = self.device_index in _LAST_CALIBRATION
+			if not calibrated:
+				# listen_for_command has not measured this room yet; do it from this stream
+				count = max(1, int(rate * CALIBRATION_DURATION) // frame_length)
+				noise = b"".join(stream.read(frame_length, exception_on_overflow=False) for _ in range(count))
+				recognizer.energy_threshold = _rms(noise) * recognizer.dynamic_energy_ratio
+
+			ring = np.zeros(int(rate * WAKE_PREROLL), np.int16)
+			idx = 0
+			while not self._stop.is_set():
+				frame = np.frombuffer(stream.read(frame_length, exception_on_overflow=False), np.int16)
+				idx = _ring_write(ring, idx, frame)
+				if porcupine.process(frame) < 0:
+					continue
+				# Oldest sample first: the pre-roll, then the phrase after the trigger
+				preroll = np.concatenate((ring[idx:], ring[:idx]))
+				phrase = self._record_phrase(stream, frame_length, rate, recognizer.energy_threshold)
+				audio = sr.AudioData(preroll.tobytes() + phrase, rate, 2)
+				text = _transcribe_capture(sr, recognizer, audio, self.language, self.backend)
+				if text:
+					# The pre-roll contains the wake word itself
+					if text.startswith(self.keyword):
+						text = text[len(self.keyword):].lstrip(" ,.")
+					if text:
+						self.on_command(text)
+				ring[:] = 0
+
+	def _record_phrase(self, stream, frame_length: int, rate: int, energy_threshold: float) -> bytes:
+		"""Read frames until pause_threshold seconds of quiet or phrase_time_limit."""
+		frames = []
+		quiet = 0.0
+		elapsed = 0.0
+		step = frame_length / rate
+		while elapsed < self.phrase_time_limit and quiet < self.pause_threshold and not self._stop.is_set():
+			data = stream.read(frame_length, exception_on_overflow=False)
+			frames.append(data)
+			elapsed += step
+			quiet = quiet + step if _rms(data) < energy_threshold else 0.0
+		return b"".join(frames)
+
+
+def _ring_write(ring, idx: int, frame) -> int:
+	"""Write ``frame`` into ``ring`` at ``idx``, wrapping around; return the new index."""
+	n = len(frame)
+	end = idx + n
+	if end <= len(ring):
+		ring[idx:end] = frame
+	else:
+		split = len(ring) - idx
+		ring[idx:] = frame[:split]
+		ring[:n - split] = frame[split:]
+	return end % len(ring)
+
+
+def _warm_up() -> None:
+	"""Pay first-call costs up front: PortAudio init, model load or the HTTP connection."""
 	try:
-		text = recognizer.recognize_google(audio, language=language)
-		return text.strip().lower() if text else None
-	except sr.UnknownValueError:
-		return None
-	except sr.RequestError as e:
-		# Network or quota error. Gracefully return None; caller can handle.
-		return None
+		sr = _try_import_sr()
+		if sr is None:
+			return
+		if _pyaudio_available() and _has_microphone():
+			# Open and close the default microphone; listen_for_command opens its own
+			with _LOCK:
+				with sr.Microphone(sample_rate=VOICE_SAMPLE_RATE, chunk_size=VOICE_CHUNK):
+					pass
+		if VOICE_BACKEND != "google":
+			_get_offline_model(VOICE_BACKEND)
+		elif requests is not None and _google_api() is not None:
+			_google_session().head(_google_api().ENDPOINT, timeout=GOOGLE_TIMEOUT)
 	except Exception:
-		return None
+		# Best effort; the first listen_for_command simply does the work instead
+		pass
+
+
+def warm_up() -> threading.Thread:
+	"""
+	Start initializing PortAudio and the recognizer in the background.
+
+	Voice mode calls this before its first listen so that capture starts
+	sooner; nothing is opened or contacted just by importing this module.
+
+	Returns:
+		The daemon thread doing the work.
+	"""
+	thread = threading.Thread(target=_warm_up, name="voice_input-warmup", daemon=True)
+	thread.start()
+	return thread
 
 
-__all__ = ["listen_for_command", "VoiceInputError"]
+__all__ = [
+	"listen_for_command",
+	"listen_for_command_async",
+	"listen_for_command_stream",
+	"listen_multi",
+	"submit_listen",
+	"warm_up",
+	"close_voice_input",
+	"WakeWordListener",
+	"VoiceInputError",
+]
 